@@ -0,0 +1 @@
+"""QSOL benchmark suite; see run.py."""
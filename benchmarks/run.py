@@ -0,0 +1,343 @@
+"""
+run.py
+
+QSOL evolution and analysis benchmark suite.
+
+Measures the hot paths of the invariant core:
+
+- evolve, evolve_until, evolve_trace, iter_evolve_trace
+- analyze_trace, analyze_stream
+- SimulationSession.run
+
+over short and max-length (10,000-step) trajectories with converging,
+stalling and oscillating transforms, plus the memory footprint of traces.
+
+For every case it records steps per second, the number of memory blocks
+allocated by the case and still held when it returns (e.g. by a returned
+trace) per step, the peak traced allocation per step and the peak RSS of
+the process. Results are written as JSON. They can be compared to a
+stored baseline: a case regresses when its throughput drops, or its memory
+use grows, by more than the configured threshold.
+
+Usage (from the repository root):
+
+    python -m benchmarks.run --output bench.json
+    python -m benchmarks.run --baseline benchmarks/baseline.json --threshold 0.25
+    python -m benchmarks.run --quick --update-baseline benchmarks/baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from qsol_invariants import (
+    ABSOLUTE_LIMITS,
+    QuantumState,
+    SimulationSession,
+    analyze_stream,
+    analyze_trace,
+    compress_trace,
+    evolve,
+    evolve_trace,
+    evolve_until,
+    iter_evolve_trace,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None  # type: ignore[assignment]
+
+
+# Max-length trajectories: 2**-14 steps hit 10_000 * 2**-14 exactly.
+FINE_STEP = 2.0**-14
+LONG_TARGET = 10_000 * FINE_STEP
+
+
+def increment(x: float) -> float:
+    return x + 0.05
+
+
+def fine_increment(x: float) -> float:
+    return x + FINE_STEP
+
+
+def saturating(x: float) -> float:
+    # Stalls (delta == 0.0) at 0.5 after 8192 steps.
+    return min(x + FINE_STEP, 0.5)
+
+
+def flip(x: float) -> float:
+    # Oscillates forever; only the iteration ceiling ends it.
+    return 0.54 if x < 0.5 else 0.46
+
+
+def _until_ceiling(fn: Callable[[float], float]) -> int:
+    try:
+        evolve_until(QuantumState(0.5), target=0.9, fn=fn)
+    except ValueError as exc:
+        if "max_iterations" not in str(exc):
+            raise
+        # The ceiling check raises before step max_iterations + 1.
+        return ABSOLUTE_LIMITS.max_iterations + 1
+    raise RuntimeError(f"{fn.__name__} ended before the iteration ceiling.")
+
+
+def _evolve_steps(count: int) -> int:
+    state = QuantumState(0.0)
+    for _ in range(count):
+        state, _ = evolve(state, fine_increment)
+    return count
+
+
+LONG_TRACE = None
+
+
+def _long_trace():
+    global LONG_TRACE
+    if LONG_TRACE is None:
+        LONG_TRACE = evolve_trace(QuantumState(0.0), LONG_TARGET, fine_increment)
+    return LONG_TRACE
+
+
+def _session(keep_trace: bool) -> int:
+    session = SimulationSession(
+        initial_value=0.0,
+        target=LONG_TARGET,
+        transform=fine_increment,
+        keep_trace=keep_trace,
+    )
+    session.run()
+    assert session.stability is not None
+    return session.stability.steps
+
+
+# name -> callable returning the number of evolution steps it performed
+CASES: Dict[str, Callable[[], Any]] = {
+    "evolve/1k": lambda: _evolve_steps(1_000),
+    "evolve_until/short": lambda: evolve_until(QuantumState(0.0), 0.2, increment)[1],
+    "evolve_until/converging-10k": lambda: evolve_until(
+        QuantumState(0.0), LONG_TARGET, fine_increment
+    )[1],
+    "evolve_until/stalling-8k": lambda: evolve_until(
+        QuantumState(0.0), 0.9, saturating
+    )[1],
+    "evolve_until/oscillating-ceiling": lambda: _until_ceiling(flip),
+    "evolve_until/oscillating-cycle-detect": lambda: evolve_until(
+        QuantumState(0.5), 0.9, flip, detect_cycles=True
+    )[1],
+    "evolve_trace/short": lambda: len(evolve_trace(QuantumState(0.0), 0.2, increment)),
+    "evolve_trace/converging-10k": lambda: len(
+        evolve_trace(QuantumState(0.0), LONG_TARGET, fine_increment)
+    ),
+    "iter_evolve_trace/analyze_stream-10k": lambda: analyze_stream(
+        iter_evolve_trace(QuantumState(0.0), LONG_TARGET, fine_increment),
+        LONG_TARGET,
+    ).steps,
+    "analyze_trace/10k": lambda: analyze_trace(_long_trace(), LONG_TARGET).steps,
+    "analyze_trace/steps-list-10k": lambda: analyze_trace(
+        list(_long_trace()), LONG_TARGET
+    ).steps,
+    "session/run-10k": lambda: _session(keep_trace=True),
+    "session/run-streaming-10k": lambda: _session(keep_trace=False),
+}
+
+# Cases whose result object is measured for memory footprint.
+FOOTPRINT_CASES: Dict[str, Callable[[], Any]] = {
+    "trace-footprint/evolve_trace-10k": lambda: evolve_trace(
+        QuantumState(0.0), LONG_TARGET, fine_increment
+    ),
+    "trace-footprint/step-list-10k": lambda: list(
+        evolve_trace(QuantumState(0.0), LONG_TARGET, fine_increment)
+    ),
+    "trace-footprint/compressed-10k": lambda: compress_trace(
+        iter_evolve_trace(QuantumState(0.0), LONG_TARGET, fine_increment)
+    ),
+}
+
+
+@dataclass
+class CaseResult:
+    name: str
+    steps: int
+    steps_per_sec: Optional[float]
+    retained_blocks_per_step: float
+    peak_bytes_per_step: float
+    peak_rss_kb: Optional[int]
+
+
+def _peak_rss_kb() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+def _measure_memory(fn: Callable[[], Any]) -> tuple[Any, float, float]:
+    # Returns (result, blocks allocated by fn and still held while its
+    # result is alive, peak traced bytes).
+    gc.collect()
+    tracemalloc.start()
+    result = fn()
+    _, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    blocks = sum(stat.count for stat in snapshot.statistics("filename"))
+    return result, blocks, peak
+
+
+def _time(fn: Callable[[], Any], min_time: float, rounds: int) -> tuple[int, float]:
+    # Best-of-rounds wall time per call, each round lasting at least min_time.
+    best = float("inf")
+    steps = 0
+    for _ in range(rounds):
+        calls = 0
+        start = time.perf_counter()
+        while True:
+            steps = fn()
+            calls += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= min_time:
+                break
+        best = min(best, elapsed / calls)
+    return steps, best
+
+
+def run_suite(min_time: float = 0.2, rounds: int = 3) -> List[CaseResult]:
+    results = []
+    for name, fn in CASES.items():
+        steps, per_call = _time(fn, min_time, rounds)
+        _, blocks, peak = _measure_memory(fn)
+        per_step = max(steps, 1)
+        results.append(
+            CaseResult(
+                name=name,
+                steps=steps,
+                steps_per_sec=steps / per_call if per_call > 0 else None,
+                retained_blocks_per_step=blocks / per_step,
+                peak_bytes_per_step=peak / per_step,
+                peak_rss_kb=_peak_rss_kb(),
+            )
+        )
+    for name, fn in FOOTPRINT_CASES.items():
+        trace, blocks, peak = _measure_memory(fn)
+        per_step = max(len(trace), 1)
+        results.append(
+            CaseResult(
+                name=name,
+                steps=len(trace),
+                steps_per_sec=None,
+                retained_blocks_per_step=blocks / per_step,
+                peak_bytes_per_step=peak / per_step,
+                peak_rss_kb=_peak_rss_kb(),
+            )
+        )
+        del trace
+    return results
+
+
+def compare(
+    results: List[CaseResult], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Return a description of every regression beyond threshold (a fraction).
+    """
+    reference = {case["name"]: case for case in baseline.get("cases", [])}
+    regressions = []
+    for result in results:
+        base = reference.get(result.name)
+        if base is None:
+            continue
+        if result.steps_per_sec is not None and base.get("steps_per_sec"):
+            floor = base["steps_per_sec"] * (1.0 - threshold)
+            if result.steps_per_sec < floor:
+                regressions.append(
+                    f"{result.name}: {result.steps_per_sec:,.0f} steps/s "
+                    f"< baseline {base['steps_per_sec']:,.0f} steps/s"
+                )
+        for metric in ("retained_blocks_per_step", "peak_bytes_per_step"):
+            current, previous = getattr(result, metric), base.get(metric)
+            # Ignore noise on metrics that are essentially zero.
+            if previous is None or max(current, previous) < 1.0:
+                continue
+            if current > previous * (1.0 + threshold) + 1.0:
+                regressions.append(
+                    f"{result.name}: {metric} {current:.2f} > baseline {previous:.2f}"
+                )
+    return regressions
+
+
+def _document(results: List[CaseResult]) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "cases": [asdict(result) for result in results],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--baseline", help="compare results to this JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="allowed relative regression before failing (default: 0.2)",
+    )
+    parser.add_argument(
+        "--update-baseline", metavar="PATH", help="write results as the new baseline"
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="shorter timing rounds (noisier)"
+    )
+    args = parser.parse_args(argv)
+
+    if args.quick:
+        results = run_suite(min_time=0.02, rounds=1)
+    else:
+        results = run_suite()
+    document = _document(results)
+
+    for result in results:
+        rate = (
+            f"{result.steps_per_sec:>14,.0f} steps/s"
+            if result.steps_per_sec is not None
+            else " " * 22
+        )
+        print(
+            f"{result.name:<42}{rate}"
+            f"{result.retained_blocks_per_step:>10.2f} retained blocks/step"
+            f"{result.peak_bytes_per_step:>10.1f} B/step peak"
+        )
+
+    for path in (args.output, args.update_baseline):
+        if path:
+            with open(path, "w", encoding="utf-8") as handle:
+                json.dump(document, handle, indent=2)
+                handle.write("\n")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        regressions = compare(results, baseline, args.threshold)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            return 1
+        print(f"No regressions beyond {args.threshold:.0%} of {args.baseline}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
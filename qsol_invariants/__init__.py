@@ -5,27 +5,162 @@ Canonical QSOL invariant contract and evolution core.
 
 This package exposes the public API for:
 - AbsoluteLimits (invariant contract)
+- current_limits, limits_context (per-thread / per-task contract overrides)
+- ExactConvergence, UlpConvergence, EpsilonConvergence, convergence_from_spec
+  (convergence policies)
 - QuantumState (state container)
-- evolve, evolve_until, evolve_trace (PHI-bounded evolution operators)
-- analyze_trace (stability analysis)
+- evolve, evolve_until, evolve_trace, iter_evolve_trace (PHI-bounded evolution
+  operators)
+- evolve_async, evolve_until_async, evolve_trace_async (asyncio operators)
+- ClosedFormTransform (protocol for transforms with an exact closed form)
+- Transform, StepToward, Affine, Clip, Piecewise, Compose,
+  transform_from_spec (declarative, picklable, vectorizable transforms)
+- EvolutionTrace (compact columnar evolution trace)
+- CompressedTrace, compress_trace (run-length encoded constant-delta traces)
+- TraceWriter, TraceFile, write_trace, open_trace, evolve_to_file (binary,
+  memory-mapped trace archives)
+- evolve_batch, evolve_until_batch (vectorized batch evolution, needs NumPy)
+- sweep, sweep_adaptive (initial_value x target maps, needs NumPy)
+- analyze_trace, analyze_stream (stability analysis)
+- analyze_batch, analyze_columns (columnar batch stability reports, needs
+  NumPy)
+- verify_trace (parallel / vectorized replay verification of stored traces)
 - SimulationSession (high-level orchestration)
+- SessionCheckpoint (resumable session state)
+- TransformCache (opt-in memoization of deterministic transforms)
+- Profiler, ProfileReport (opt-in per-step instrumentation)
+- run_sessions, run_sessions_async (parallel and asyncio session runners)
+- estimate_steps, schedule_sessions, SessionSchedule, ScheduleAccuracy
+  (cost-aware, longest-first scheduling of session batches)
 """
 
-from .absolute_limits import AbsoluteLimits, ABSOLUTE_LIMITS
+from .absolute_limits import (
+    AbsoluteLimits,
+    ABSOLUTE_LIMITS,
+    current_limits,
+    limits_context,
+)
+from .convergence import (
+    ConvergencePolicy,
+    EpsilonConvergence,
+    ExactConvergence,
+    UlpConvergence,
+    convergence_from_spec,
+)
 from .quantum_state import QuantumState
-from .evolution import evolve, evolve_until, evolve_trace
-from .stability import analyze_trace, StabilityReport
+from .evolution import (
+    ClosedFormTransform,
+    evolve,
+    evolve_async,
+    evolve_until,
+    evolve_until_async,
+    evolve_trace,
+    evolve_trace_async,
+    iter_evolve_trace,
+)
+from .transforms import (
+    Affine,
+    Clip,
+    Compose,
+    Piecewise,
+    StepToward,
+    Transform,
+    transform_from_spec,
+)
+from .trace import EvolutionCycle, EvolutionStep, EvolutionTrace
+from .compressed_trace import CompressedTrace, compress_trace
+from .trace_file import (
+    TraceFile,
+    TraceWriter,
+    evolve_to_file,
+    open_trace,
+    write_trace,
+)
+from .batch import BatchResult, evolve_batch, evolve_until_batch
+from .sweep import SweepResult, SweepStatus, sweep, sweep_adaptive
+from .stability import (
+    analyze_stream,
+    analyze_trace,
+    StabilityAccumulator,
+    StabilityReport,
+)
+from .batch_stability import BatchStabilityReport, analyze_batch, analyze_columns
+from .verify import TraceVerification, verify_trace
+from .cache import CacheStats, TransformCache
+from .profiling import Profiler, ProfileReport
+from .checkpoint import SessionCheckpoint
 from .session import SimulationSession
+from .scheduler import (
+    ScheduleAccuracy,
+    SessionSchedule,
+    estimate_steps,
+    schedule_sessions,
+)
+from .runner import run_sessions, run_sessions_async
 
 __all__ = [
     "AbsoluteLimits",
     "ABSOLUTE_LIMITS",
+    "current_limits",
+    "limits_context",
+    "ConvergencePolicy",
+    "ExactConvergence",
+    "UlpConvergence",
+    "EpsilonConvergence",
+    "convergence_from_spec",
     "QuantumState",
     "evolve",
     "evolve_until",
     "evolve_trace",
+    "iter_evolve_trace",
+    "evolve_async",
+    "evolve_until_async",
+    "evolve_trace_async",
+    "ClosedFormTransform",
+    "Transform",
+    "StepToward",
+    "Affine",
+    "Clip",
+    "Piecewise",
+    "Compose",
+    "transform_from_spec",
+    "CompressedTrace",
+    "compress_trace",
+    "EvolutionCycle",
+    "EvolutionStep",
+    "EvolutionTrace",
+    "TraceWriter",
+    "TraceFile",
+    "write_trace",
+    "open_trace",
+    "evolve_to_file",
+    "BatchResult",
+    "evolve_batch",
+    "evolve_until_batch",
+    "SweepResult",
+    "SweepStatus",
+    "sweep",
+    "sweep_adaptive",
     "analyze_trace",
+    "analyze_stream",
+    "StabilityAccumulator",
     "StabilityReport",
+    "BatchStabilityReport",
+    "analyze_batch",
+    "analyze_columns",
+    "TraceVerification",
+    "verify_trace",
     "SimulationSession",
+    "SessionCheckpoint",
+    "CacheStats",
+    "TransformCache",
+    "Profiler",
+    "ProfileReport",
+    "run_sessions",
+    "run_sessions_async",
+    "estimate_steps",
+    "schedule_sessions",
+    "SessionSchedule",
+    "ScheduleAccuracy",
 ]
 
@@ -0,0 +1,28 @@
+"""
+_numpy.py
+
+Lazy access to the optional NumPy dependency.
+
+The invariant core is pure Python. Vectorized features import NumPy through
+this module on first use, so the core never pays for the import and installs
+without it.
+"""
+
+from __future__ import annotations
+
+
+def require_numpy():
+    """
+    Import and return the numpy module.
+
+    Raises:
+        ImportError: if NumPy is not installed.
+    """
+    try:
+        import numpy
+    except ImportError as exc:  # pragma: no cover - depends on environment
+        raise ImportError(
+            "This QSOL feature requires NumPy. "
+            "Install it with: pip install qsol-invariants[numpy]"
+        ) from exc
+    return numpy
@@ -5,17 +5,42 @@ QSOL Absolute Limits Contract.
 
 Defines the global, non-negotiable boundaries for all QSOL state evolution:
 - Value domain: [0.0, 1.0]
-- Deterministic convergence rule: delta == 0.0
+- Deterministic convergence rule: delta == 0.0 (or an opt-in tolerance
+  policy, see convergence.py)
 - Global iteration ceiling
 - PHI-bounded transform requirement (max per-step change)
 
 This module is intentionally minimal and stable. It contains no
 implementation-specific logic beyond the invariant contract itself.
+
+Every check also accepts a NumPy array (the value of a vector QuantumState),
+applying the same rule to each component as a single vector operation.
+
+ABSOLUTE_LIMITS is the canonical contract. Operators that take a `limits`
+argument enforce the given contract instead; without one they enforce
+current_limits(): the contract of the innermost limits_context, or
+ABSOLUTE_LIMITS. The override lives in a context variable, so concurrent
+threads and asyncio tasks can each run under their own contract (a new
+thread starts with ABSOLUTE_LIMITS; a task inherits the contract in effect
+when it was created). Worker processes do not inherit it: pass limits
+explicitly (e.g. SimulationSession.limits) to work that crosses processes.
 """
 
 from __future__ import annotations
 
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
+from typing import Any, Iterator
+
+from ._numpy import require_numpy
+from .convergence import EXACT_CONVERGENCE, ConvergencePolicy
+
+
+def _is_array(value: Any) -> bool:
+    # Callers test type(value) is not float first, so that plain floats skip
+    # this check and the scalar path stays cheap.
+    return getattr(value, "ndim", 0) > 0
 
 
 @dataclass(frozen=True)
@@ -42,12 +67,25 @@ class AbsoluteLimits:
     # This does not prescribe a specific transform, only its allowed magnitude.
     max_step_delta: float = 0.1
 
+    # Rule deciding convergence to a target; the canonical rule is exact
+    # (target - value == convergence_delta). Tolerant policies are opt-in.
+    convergence: ConvergencePolicy = EXACT_CONVERGENCE
+
     def clamp_value(self, value: float) -> float:
         """
         Clamp a scalar to the allowed [min_value, max_value] domain.
 
         This is the only permitted way to repair an out-of-range value.
+        Arrays are clamped componentwise.
         """
+        if type(value) is not float and _is_array(value):
+            numpy = require_numpy()
+            # Same comparisons as the scalar rule (NaN and -0.0 pass through).
+            return numpy.where(
+                value < self.min_value,
+                self.min_value,
+                numpy.where(value > self.max_value, self.max_value, value),
+            )
         if value < self.min_value:
             return self.min_value
         if value > self.max_value:
@@ -57,7 +95,12 @@ class AbsoluteLimits:
     def is_within_domain(self, value: float) -> bool:
         """
         Check whether a scalar is within the allowed [min_value, max_value] domain.
+        An array is within the domain when every component is.
         """
+        if type(value) is not float and _is_array(value):
+            return bool(
+                ((self.min_value <= value) & (value <= self.max_value)).all()
+            )
         return self.min_value <= value <= self.max_value
 
     def is_converged(self, delta: float) -> bool:
@@ -65,16 +108,39 @@ class AbsoluteLimits:
         Check whether a given delta satisfies the convergence rule.
 
         By contract, convergence is defined as delta == convergence_delta.
+        An array of deltas has converged when every component has.
         """
+        if type(delta) is not float and _is_array(delta):
+            return bool((delta == self.convergence_delta).all())
         return delta == self.convergence_delta
 
+    def is_converged_to(self, value: Any, target: float) -> bool:
+        """
+        Check whether a value has converged to target under the convergence
+        policy. With the default exact policy this is
+        is_converged(target - value).
+        """
+        if self.convergence.exact:
+            return self.is_converged(target - value)
+        return self.convergence.is_converged(value, target, self.convergence_delta)
+
     def validate_step_delta(self, delta: float) -> None:
         """
         Enforce the PHI-bounded requirement on per-step change.
 
         Raises:
-            ValueError if |delta| exceeds max_step_delta.
+            ValueError if |delta| (or any component of an array of deltas)
+            exceeds max_step_delta.
         """
+        if type(delta) is not float and _is_array(delta):
+            excess = abs(delta) > self.max_step_delta
+            if excess.any():
+                component = int(excess.argmax())
+                raise ValueError(
+                    f"Step delta {delta.flat[component]} of component {component} "
+                    f"exceeds max_step_delta {self.max_step_delta} in AbsoluteLimits."
+                )
+            return
         if abs(delta) > self.max_step_delta:
             raise ValueError(
                 f"Step delta {delta} exceeds max_step_delta {self.max_step_delta} "
@@ -102,10 +168,42 @@ class AbsoluteLimits:
             "QSOL Absolute Limits Contract:\n"
             f"  - domain: [{self.min_value}, {self.max_value}]\n"
             f"  - convergence_delta: {self.convergence_delta}\n"
+            f"  - convergence: {self.convergence.describe()}\n"
             f"  - max_iterations: {self.max_iterations}\n"
             f"  - max_step_delta (PHI-bound): {self.max_step_delta}"
         )
 
 
 # Canonical, shared instance used by all QSOL components.
-ABS
+ABSOLUTE_LIMITS = AbsoluteLimits()
+
+_current_limits: ContextVar[AbsoluteLimits] = ContextVar(
+    "qsol_limits", default=ABSOLUTE_LIMITS
+)
+
+
+def current_limits() -> AbsoluteLimits:
+    """
+    Return the contract in effect: that of the innermost limits_context,
+    else ABSOLUTE_LIMITS.
+    """
+    return _current_limits.get()
+
+
+@contextmanager
+def limits_context(limits: AbsoluteLimits) -> Iterator[AbsoluteLimits]:
+    """
+    Enforce `limits` in place of ABSOLUTE_LIMITS within a with block.
+
+    Applies to every operator called without an explicit `limits` argument
+    in the current thread or asyncio task; contexts nest.
+
+    Example:
+        with limits_context(dataclasses.replace(ABSOLUTE_LIMITS, max_iterations=50)):
+            evolve_until(QuantumState(0.0), 0.5, fn)
+    """
+    token = _current_limits.set(limits)
+    try:
+        yield limits
+    finally:
+        _current_limits.reset(token)
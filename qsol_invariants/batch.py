@@ -0,0 +1,296 @@
+"""
+batch.py
+
+QSOL vectorized batch evolution.
+
+Runs many independent PHI-bounded trajectories ("lanes") at once over NumPy
+arrays:
+
+- evolve_batch       : single PHI-bounded step for every lane
+- evolve_until_batch : deterministic fixed-point evolution for every lane
+
+Every lane obeys exactly the rules of the scalar operators in evolution.py:
+the PHI-bound check, clamping, the convergence rule, the delta == 0.0 stall
+short-circuit and the iteration ceiling. Results are bit-identical to the
+scalar path, provided the transform computes the same floats elementwise as
+its scalar counterpart. Where the scalar operators raise, the batch operators
+flag the lane instead and stop evolving it.
+
+With detect_cycles=True, cycles are found with Brent's algorithm, which
+needs no per-lane history; the entry point of each cycle is then recovered
+by replaying the lane, so step counts match the scalar operators exactly.
+
+NumPy is an optional dependency and is imported on first use.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Tuple
+
+from ._numpy import require_numpy
+from .absolute_limits import AbsoluteLimits, current_limits
+
+
+# A vectorizable transform: maps an array of values to an array of the same
+# shape, before clamping.
+BatchTransformFn = Callable[[Any], Any]
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    """
+    Per-lane outcome of a batch evolution.
+
+    All fields are NumPy arrays with the shape of the initial values.
+
+    - values:            final value of each lane (last valid value if flagged)
+    - steps:             evolution steps completed by each lane
+    - converged:         lane converged to its target
+    - phi_violation:     a step violated max_step_delta (scalar path raises)
+    - ceiling_violation: lane exceeded max_iterations (scalar path raises)
+    - cycled:            lane stopped on a revisited value (detect_cycles)
+    - cycle_start, cycle_length: the lane's EvolutionCycle fields, 0 where
+                         no cycle was detected
+
+    The cycle fields are None unless the batch ran with detect_cycles=True.
+    """
+
+    values: Any
+    steps: Any
+    converged: Any
+    phi_violation: Any
+    ceiling_violation: Any
+    cycled: Any = None
+    cycle_start: Any = None
+    cycle_length: Any = None
+
+    @property
+    def violation(self) -> Any:
+        """
+        Lanes for which the scalar path would have raised ValueError.
+        """
+        return self.phi_violation | self.ceiling_violation
+
+
+def _clamp(np, values, limits: AbsoluteLimits):
+    # Mirrors AbsoluteLimits.clamp_value elementwise (NaN passes through).
+    return np.where(
+        values < limits.min_value,
+        limits.min_value,
+        np.where(values > limits.max_value, limits.max_value, values),
+    )
+
+
+def _apply(np, values, fn: BatchTransformFn):
+    raw = np.asarray(fn(values), dtype=np.float64)
+    if raw.shape != values.shape:
+        raise ValueError(
+            f"Batch transform returned shape {raw.shape}, expected {values.shape}."
+        )
+    return raw
+
+
+def _step(np, values, fn: BatchTransformFn, limits: AbsoluteLimits):
+    # One clamped step, for replaying lanes already known to be valid.
+    return _clamp(np, _apply(np, values, fn), limits)
+
+
+def _cycle_entries(np, initial, lengths, fn, limits, max_steps):
+    """
+    Return (entry, value) per lane: the first index mu with
+    x[mu] == x[mu + length] and the value x[mu], by replaying from initial.
+    """
+    behind = initial.copy()
+    ahead = initial.copy()
+    remaining = lengths.copy()
+    lanes = np.flatnonzero(remaining > 0)
+    while lanes.size:
+        ahead[lanes] = _step(np, ahead[lanes], fn, limits)
+        remaining[lanes] -= 1
+        lanes = lanes[remaining[lanes] > 0]
+
+    entry = np.zeros(initial.size, dtype=np.int64)
+    lanes = np.flatnonzero(behind != ahead)
+    while lanes.size and entry[lanes[0]] <= max_steps:
+        behind[lanes] = _step(np, behind[lanes], fn, limits)
+        ahead[lanes] = _step(np, ahead[lanes], fn, limits)
+        entry[lanes] += 1
+        lanes = lanes[behind[lanes] != ahead[lanes]]
+    return entry, behind
+
+
+def evolve_batch(
+    values: Any,
+    fn: BatchTransformFn,
+    limits: Optional[AbsoluteLimits] = None,
+) -> Tuple[Any, Any, Any]:
+    """
+    Perform a single PHI-bounded evolution step on every lane.
+
+    Args:
+        values: Array-like of current values (clamped into the domain first,
+                as QuantumState would).
+        fn: Vectorizable deterministic transform, applied before clamping.
+        limits: Invariant contract to enforce (defaults to current_limits()).
+
+    Returns:
+        (next_values, deltas, violations) where:
+            next_values: clamped values after the step; lanes that violate
+                         the PHI bound keep their current value.
+            deltas:      signed raw change per lane (fn(x) - x).
+            violations:  boolean mask of lanes whose |delta| exceeds
+                         max_step_delta.
+    """
+    np = require_numpy()
+    limits = current_limits() if limits is None else limits
+
+    current = _clamp(np, np.asarray(values, dtype=np.float64), limits)
+    raw = _apply(np, current, fn)
+    deltas = raw - current
+    violations = np.abs(deltas) > limits.max_step_delta
+    next_values = np.where(violations, current, _clamp(np, raw, limits))
+    return next_values, deltas, violations
+
+
+def evolve_until_batch(
+    initial_values: Any,
+    targets: Any,
+    fn: BatchTransformFn,
+    limits: Optional[AbsoluteLimits] = None,
+    detect_cycles: bool = False,
+) -> BatchResult:
+    """
+    Evolve every lane deterministically until convergence to its target.
+
+    This is the elementwise equivalent of evolution.evolve_until. Lanes are
+    masked out as soon as they converge, stall (delta == 0.0) or violate the
+    contract, so the transform is only evaluated on lanes that are still live.
+
+    Args:
+        initial_values: Array-like of starting values.
+        targets: Array-like of target values, broadcast to initial_values.
+        fn: Vectorizable deterministic transform, applied before clamping.
+        limits: Invariant contract to enforce (defaults to current_limits()).
+        detect_cycles: Stop lanes whose trajectory revisits a value, as
+                       evolve_until(detect_cycles=True) does, and record the
+                       cycle. Brent's algorithm may only confirm a cycle
+                       after the scalar operator would have stopped, so lanes
+                       still live at the ceiling keep iterating (up to four
+                       times the ceiling) to find cycles that started before
+                       it.
+
+    Returns:
+        BatchResult with final values, step counts and per-lane flags.
+    """
+    np = require_numpy()
+    limits = current_limits() if limits is None else limits
+
+    values = _clamp(np, np.asarray(initial_values, dtype=np.float64), limits)
+    shape = values.shape
+    values = values.reshape(-1)
+    targets = np.broadcast_to(
+        np.asarray(targets, dtype=np.float64), shape
+    ).reshape(-1)
+
+    size = values.size
+    steps = np.zeros(size, dtype=np.int64)
+    phi_violation = np.zeros(size, dtype=bool)
+    ceiling_violation = np.zeros(size, dtype=bool)
+
+    if detect_cycles:
+        initial = values.copy()
+        # Brent's algorithm: compare against a checkpoint ("tortoise") that
+        # moves to the current value whenever the run length hits a power
+        # of two; a match gives the exact cycle length.
+        tortoise = values.copy()
+        power = np.ones(size, dtype=np.int64)
+        run = np.zeros(size, dtype=np.int64)
+        cycle_length = np.zeros(size, dtype=np.int64)
+        found = np.zeros(size, dtype=bool)
+
+    active = np.flatnonzero((targets - values) != limits.convergence_delta)
+    iteration = 0
+    ceiling = limits.max_iterations + 1
+    overtime = False
+
+    while active.size:
+        # Enforce the iteration ceiling before the next step, as the scalar
+        # path does. All live lanes have taken the same number of steps.
+        if iteration > limits.max_iterations and not overtime:
+            ceiling_violation[active] = True
+            if not detect_cycles:
+                break
+            # Keep searching for cycles that began before the ceiling;
+            # values and steps stay frozen at the ceiling.
+            overtime = True
+            frozen_values, frozen_steps = values.copy(), steps.copy()
+        if overtime and iteration >= 4 * ceiling:
+            break
+
+        current = values[active]
+        raw = _apply(np, current, fn)
+        delta = raw - current
+
+        bad = np.abs(delta) > limits.max_step_delta
+        if bad.any():
+            if not overtime:
+                phi_violation[active[bad]] = True
+            ok = ~bad
+            active, raw, delta = active[ok], raw[ok], delta[ok]
+
+        next_values = _clamp(np, raw, limits)
+        values[active] = next_values
+        steps[active] += 1
+        iteration += 1
+
+        converged = (targets[active] - next_values) == limits.convergence_delta
+        stalled = delta == 0.0
+        active = active[~(converged | stalled)]
+
+        if detect_cycles:
+            run[active] += 1
+            hit = values[active] == tortoise[active]
+            found[active[hit]] = True
+            cycle_length[active[hit]] = run[active[hit]]
+            active = active[~hit]
+            moved = active[run[active] == power[active]]
+            tortoise[moved] = values[moved]
+            power[moved] *= 2
+            run[moved] = 0
+
+    cycled = cycle_start = None
+    if detect_cycles:
+        if overtime:
+            values = np.where(ceiling_violation, frozen_values, values)
+            steps = np.where(ceiling_violation, frozen_steps, steps)
+        lanes = np.flatnonzero(found)
+        entry, entry_values = _cycle_entries(
+            np, initial[lanes], cycle_length[lanes], fn, limits, ceiling
+        )
+        # The scalar loop stops at step entry + length, if that is within
+        # the ceiling.
+        in_time = entry + cycle_length[lanes] <= ceiling
+        lanes = lanes[in_time]
+        entry, entry_values = entry[in_time], entry_values[in_time]
+
+        cycled = np.zeros(size, dtype=bool)
+        cycle_start = np.zeros(size, dtype=np.int64)
+        cycled[lanes] = True
+        cycle_start[lanes] = entry
+        cycle_length = np.where(cycled, cycle_length, 0)
+        values[lanes] = entry_values
+        steps[lanes] = entry + cycle_length[lanes]
+        ceiling_violation[lanes] = False
+
+    converged = (targets - values) == limits.convergence_delta
+    return BatchResult(
+        values=values.reshape(shape),
+        steps=steps.reshape(shape),
+        converged=converged.reshape(shape),
+        phi_violation=phi_violation.reshape(shape),
+        ceiling_violation=ceiling_violation.reshape(shape),
+        cycled=None if cycled is None else cycled.reshape(shape),
+        cycle_start=None if cycle_start is None else cycle_start.reshape(shape),
+        cycle_length=None if cycled is None else cycle_length.reshape(shape),
+    )
@@ -0,0 +1,285 @@
+"""
+batch_stability.py
+
+QSOL batch stability analysis.
+
+Analyzes many scalar traces at once into columnar reports:
+
+- analyze_batch        : analyze a sequence of traces
+- analyze_columns      : analyze one concatenated value/delta buffer with
+                         per-trace step offsets
+- BatchStabilityReport : one NumPy array per metric, one entry per trace
+
+Besides the StabilityReport fields (computed exactly as analyze_trace would),
+every trace gets extended metrics:
+
+- sign_changes    : steps whose delta has the opposite sign of the previous
+                    step's, i.e. oscillations
+- max_abs_delta   : largest |delta|
+- steps_at_bounds : steps ending on min_value or max_value (clamped)
+- rate            : empirical convergence rate, the geometric mean of the
+                    error ratios |target - v[k+1]| / |target - v[k]| over the
+                    steps where both errors are non-zero (< 1 contracts,
+                    > 1 diverges, NaN if no step qualifies)
+
+All metrics come out of the same vectorized pass over the concatenated
+columns, with no per-trace Python objects. NumPy is required.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Sequence, Union
+
+from ._numpy import require_numpy
+from .absolute_limits import AbsoluteLimits, current_limits
+from .compressed_trace import CompressedTrace
+from .convergence import ConvergencePolicy
+from .trace import EvolutionStep, EvolutionTrace, is_row_column
+
+
+@dataclass(frozen=True)
+class BatchStabilityReport:
+    """
+    Columnar stability report; entry i of every array describes trace i.
+
+    - converged, steps, initial_value, final_value, final_delta,
+      monotonic_increasing, monotonic_decreasing: as in StabilityReport
+    - converged_exact: the canonical rule held (StabilityReport.converged_by
+      == "exact"); converged may also be set by a tolerant policy
+    - cycle_start, cycle_length: the trace's cycle, or -1
+    - sign_changes, max_abs_delta, steps_at_bounds, rate: extended metrics
+      (see the module docstring)
+    """
+
+    converged: Any
+    converged_exact: Any
+    steps: Any
+    initial_value: Any
+    final_value: Any
+    final_delta: Any
+    monotonic_increasing: Any
+    monotonic_decreasing: Any
+    cycle_start: Any
+    cycle_length: Any
+    sign_changes: Any
+    max_abs_delta: Any
+    steps_at_bounds: Any
+    rate: Any
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def columns(self) -> Dict[str, Any]:
+        """
+        Return the report as a dict of arrays.
+        """
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
+
+    def to_records(self) -> Any:
+        """
+        Return the report as a NumPy structured array (one record per trace).
+        """
+        np = require_numpy()
+        columns = self.columns()
+        records = np.empty(
+            len(self), dtype=[(name, array.dtype) for name, array in columns.items()]
+        )
+        for name, array in columns.items():
+            records[name] = array
+        return records
+
+
+def _segment_sums(np, values, starts, ends) -> Any:
+    # Sum of values[starts[i]:ends[i]] for every i, via a running total.
+    totals = np.concatenate(([0], np.cumsum(values)))
+    return totals[ends] - totals[starts]
+
+
+def analyze_columns(
+    values: Any,
+    deltas: Any,
+    offsets: Any,
+    targets: Union[float, Any],
+    limits: Optional[AbsoluteLimits] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+    cycle_starts: Optional[Any] = None,
+    cycle_lengths: Optional[Any] = None,
+) -> BatchStabilityReport:
+    """
+    Analyze traces stored back to back in two flat columns.
+
+    Trace i has steps offsets[i] .. offsets[i + 1] - 1 of deltas, and
+    offsets[i + 1] - offsets[i] + 1 boundary values starting at
+    values[offsets[i] + i] (each trace contributes one more value than
+    steps, as in EvolutionTrace).
+
+    Args:
+        values: Concatenated value columns (len(deltas) + number of traces).
+        deltas: Concatenated delta columns.
+        offsets: Step offsets, of length number of traces + 1, starting at 0.
+        targets: Target of every trace (scalar or one per trace).
+        limits: Contract whose bounds define clamped steps and whose
+                convergence rule applies (defaults to current_limits()).
+        convergence: Convergence policy overriding limits.convergence.
+        cycle_starts, cycle_lengths: Optional per-trace cycles (-1 for none).
+
+    Returns:
+        BatchStabilityReport.
+
+    Raises:
+        ValueError if the columns do not match the offsets.
+    """
+    np = require_numpy()
+    limits = current_limits() if limits is None else limits
+    policy = limits.convergence if convergence is None else convergence
+    values = np.asarray(values, dtype=np.float64)
+    deltas = np.asarray(deltas, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    count = len(offsets) - 1
+    if (
+        count < 0
+        or offsets[0] != 0
+        or offsets[-1] != len(deltas)
+        or len(values) != len(deltas) + count
+        or (np.diff(offsets) < 0).any()
+    ):
+        raise ValueError(
+            f"analyze_columns got {len(values)} values and {len(deltas)} deltas, "
+            f"which do not match offsets describing {count} traces."
+        )
+    targets = np.broadcast_to(np.asarray(targets, dtype=np.float64), (count,))
+
+    steps = np.diff(offsets)
+    first = offsets[:-1] + np.arange(count)  # index of each initial value
+    last = first + steps  # index of each final value
+    empty = steps == 0
+
+    # Traces without steps report the clamped target, as analyze_trace does.
+    fallback = np.where(
+        targets < limits.min_value,
+        limits.min_value,
+        np.where(targets > limits.max_value, limits.max_value, targets),
+    )
+    initial_value = np.where(empty, fallback, values[first])
+    final_value = np.where(empty, fallback, values[last])
+
+    # Value pairs (values[j], values[j + 1]) for j in [first, last) belong to
+    # their trace; pairs straddling two traces fall outside every range.
+    before, after = values[:-1], values[1:]
+    increasing_breaks = _segment_sums(np, ~(before <= after), first, last)
+    decreasing_breaks = _segment_sums(np, ~(before >= after), first, last)
+
+    # Consecutive delta pairs (k, k + 1) for k in [start, end - 1) of a trace
+    # (padded so that every step index has a pair slot).
+    signs = np.sign(deltas)
+    flips = np.append(signs[:-1] * signs[1:] < 0, False)
+    step_starts, step_ends = offsets[:-1], offsets[1:]
+    pair_ends = np.maximum(step_ends - 1, step_starts)
+    sign_changes = _segment_sums(np, flips, step_starts, pair_ends)
+
+    max_abs_delta = np.zeros(count)
+    if len(deltas):
+        nonempty = ~empty
+        max_abs_delta[nonempty] = np.maximum.reduceat(
+            np.abs(deltas), step_starts[nonempty]
+        )
+
+    # Steps ending on a bound: the values after each step of a trace.
+    at_bounds = (after == limits.min_value) | (after == limits.max_value)
+    steps_at_bounds = _segment_sums(np, at_bounds, first, last)
+
+    trace_of_value = np.repeat(np.arange(count), steps + 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_errors = np.log(np.abs(targets[trace_of_value] - values))
+        ratios = log_errors[1:] - log_errors[:-1]
+    usable = np.isfinite(ratios)
+    log_rate = _segment_sums(np, np.where(usable, ratios, 0.0), first, last)
+    samples = _segment_sums(np, usable, first, last)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.where(samples > 0, np.exp(log_rate / np.maximum(samples, 1)), np.nan)
+
+    with np.errstate(invalid="ignore"):
+        converged_exact = (targets - final_value) == limits.convergence_delta
+        converged = converged_exact
+        if not policy.exact:
+            converged = converged | policy.converged_mask(
+                final_value, targets, limits.convergence_delta
+            )
+
+    def cycle_column(column):
+        if column is None:
+            return np.full(count, -1, dtype=np.int64)
+        return np.asarray(column, dtype=np.int64)
+
+    return BatchStabilityReport(
+        converged=converged,
+        converged_exact=converged_exact,
+        steps=steps,
+        initial_value=initial_value,
+        final_value=final_value,
+        final_delta=final_value - initial_value,
+        monotonic_increasing=increasing_breaks == 0,
+        monotonic_decreasing=decreasing_breaks == 0,
+        cycle_start=cycle_column(cycle_starts),
+        cycle_length=cycle_column(cycle_lengths),
+        sign_changes=sign_changes,
+        max_abs_delta=max_abs_delta,
+        steps_at_bounds=steps_at_bounds,
+        rate=rate,
+    )
+
+
+def _trace_columns(trace: Sequence[EvolutionStep]):
+    if isinstance(trace, CompressedTrace):
+        trace = trace.decompress()
+    if isinstance(trace, EvolutionTrace):
+        if is_row_column(trace.values):
+            raise ValueError("analyze_batch only analyzes scalar traces.")
+        return trace.values, trace.deltas, trace.cycle
+    if not len(trace):
+        raise ValueError("analyze_batch needs an initial value for every trace.")
+    values = [step.prev_state.value for step in trace] + [trace[-1].next_state.value]
+    return values, [step.delta for step in trace], None
+
+
+def analyze_batch(
+    traces: Sequence[Sequence[EvolutionStep]],
+    targets: Union[float, Any],
+    limits: Optional[AbsoluteLimits] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+) -> BatchStabilityReport:
+    """
+    Analyze many traces into one columnar report.
+
+    Args:
+        traces: EvolutionTrace (including TraceFile.trace), CompressedTrace or
+                non-empty EvolutionStep sequences.
+        targets: Target of every trace (scalar or one per trace).
+        limits: Contract the traces were produced under (defaults to
+                current_limits()).
+        convergence: Convergence policy overriding limits.convergence.
+
+    Returns:
+        BatchStabilityReport, in the order of traces.
+    """
+    np = require_numpy()
+    columns = [_trace_columns(trace) for trace in traces]
+    lengths = np.array([len(deltas) for _, deltas, _ in columns], dtype=np.int64)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    cycles = [cycle for _, _, cycle in columns]
+
+    def concatenate(parts) -> Any:
+        parts = [np.asarray(part, dtype=np.float64) for part in parts]
+        return np.concatenate(parts) if parts else np.empty(0)
+
+    return analyze_columns(
+        concatenate(values for values, _, _ in columns),
+        concatenate(deltas for _, deltas, _ in columns),
+        offsets,
+        targets,
+        limits=limits,
+        convergence=convergence,
+        cycle_starts=[-1 if cycle is None else cycle.start for cycle in cycles],
+        cycle_lengths=[-1 if cycle is None else cycle.length for cycle in cycles],
+    )
@@ -0,0 +1,184 @@
+"""
+cache.py
+
+QSOL transform memoization.
+
+Transforms are deterministic by contract, so a transform evaluated again on
+an input it has already seen must return the same value. TransformCache
+exploits this with an opt-in, size-bounded LRU memo keyed by transform
+identity and input value:
+
+- TransformCache : shared LRU store with hit/miss/eviction counters
+- CacheStats     : snapshot of those counters
+
+A cache can be shared by any number of transforms and sessions (and threads)
+in one process. Copies sent to worker processes start empty.
+"""
+
+from __future__ import annotations
+
+import inspect
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Tuple
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of a TransformCache.
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    maxsize: int
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        Fraction of lookups served from the cache (0.0 before any lookup).
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class TransformCache:
+    """
+    Size-bounded LRU memo of transform results.
+
+    Entries are keyed by (transform, input value); functions are compared by
+    identity, as the cache holds a reference to each one, while declarative
+    transforms (transforms.py) compare by content, so equal ones share
+    entries. Vector inputs are keyed by shape and bytes. -0.0 and 0.0 are
+    kept apart so that cached results stay bit-exact.
+    """
+
+    def __init__(self, maxsize: int = 65_536) -> None:
+        if maxsize < 1:
+            raise ValueError(
+                f"TransformCache maxsize must be positive, got {maxsize}."
+            )
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Hashable, ...], float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def wrap(self, fn: Callable[[float], Any]) -> "CachedTransform":
+        """
+        Return a transform that evaluates fn through this cache.
+        """
+        return CachedTransform(fn, self)
+
+    def stats(self) -> CacheStats:
+        """
+        Return a snapshot of the cache counters.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                size=len(self._entries),
+                maxsize=self.maxsize,
+            )
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(fn: Callable[[float], Any], value: Any) -> Tuple[Hashable, ...]:
+        if getattr(value, "ndim", 0) > 0:
+            # Arrays are unhashable; their bytes also tell -0.0 from 0.0.
+            return fn, value.shape, value.tobytes()
+        if value == 0.0:
+            return fn, value, math.copysign(1.0, value)
+        return fn, value
+
+    def _get(self, key: Tuple[Hashable, ...]) -> Tuple[bool, float]:
+        with self._lock:
+            try:
+                result = self._entries[key]
+            except KeyError:
+                self._misses += 1
+                return False, 0.0
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return True, result
+
+    def _put(self, key: Tuple[Hashable, ...], result: float) -> None:
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def __call__(self, fn: Callable[[float], Any], value: float) -> Any:
+        """
+        Evaluate fn(value) through the cache.
+
+        If fn returns an awaitable, an awaitable is returned whose result is
+        cached once it completes.
+        """
+        key = self._key(fn, value)
+        found, result = self._get(key)
+        if found:
+            return result
+        raw = fn(value)
+        if inspect.isawaitable(raw):
+            return self._put_async(key, raw)
+        self._put(key, raw)
+        return raw
+
+    async def _put_async(self, key: Tuple[Hashable, ...], raw: Any) -> float:
+        result = await raw
+        self._put(key, result)
+        return result
+
+    def __getstate__(self) -> dict:
+        # Worker processes get an empty cache of the same size.
+        return {"maxsize": self.maxsize}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["maxsize"])  # type: ignore[misc]
+
+    def __repr__(self) -> str:
+        return f"TransformCache(size={len(self)}, maxsize={self.maxsize})"
+
+
+class CachedTransform:
+    """
+    A transform evaluated through a TransformCache.
+
+    Other attributes, such as a closed form's iterate(), are forwarded to the
+    wrapped transform, so wrapping keeps its capabilities.
+    """
+
+    def __init__(self, fn: Callable[[float], Any], cache: TransformCache) -> None:
+        self.fn = fn
+        self.cache = cache
+
+    def __call__(self, value: float) -> Any:
+        return self.cache(self.fn, value)
+
+    def __getattr__(self, name: str) -> Any:
+        if name in ("fn", "cache"):
+            raise AttributeError(name)
+        return getattr(self.fn, name)
+
+    def __repr__(self) -> str:
+        return f"CachedTransform({self.fn!r})"
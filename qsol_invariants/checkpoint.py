@@ -0,0 +1,191 @@
+"""
+checkpoint.py
+
+QSOL session checkpoints.
+
+A SessionCheckpoint captures everything needed to continue an evolution
+session bit-for-bit: the current state and step index, the partial
+stability accumulator, the values visited so far (with cycle detection) and
+the AbsoluteLimits in force, including the convergence policy.
+
+Checkpoints are stored as JSON with every float encoded by float.hex(), so
+they round-trip exactly (including NaN, infinities and -0.0). Saves are
+atomic: the file is written next to its destination and renamed over it, so
+a preempted process never leaves a torn checkpoint behind.
+
+Only scalar sessions can be checkpointed.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import json
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from .absolute_limits import AbsoluteLimits
+from .convergence import convergence_from_spec
+from .stability import StabilityAccumulator
+from .trace import EvolutionCycle
+
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+FORMAT_VERSION = 2
+
+
+def _encode(value: Optional[float]) -> Optional[str]:
+    return None if value is None else float(value).hex()
+
+
+def _decode(value: Optional[str]) -> Optional[float]:
+    return None if value is None else float.fromhex(value)
+
+
+def _encode_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        name: _encode(field) if isinstance(field, float) else field
+        for name, field in fields.items()
+    }
+
+
+def _decode_fields(fields: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        name: _decode(field) if isinstance(field, str) else field
+        for name, field in fields.items()
+    }
+
+
+def _encode_limits(limits: AbsoluteLimits) -> Dict[str, Any]:
+    fields = {
+        field.name: getattr(limits, field.name)
+        for field in dataclasses.fields(limits)
+        if field.name != "convergence"
+    }
+    document = _encode_fields(fields)
+    policy = limits.convergence.to_spec()
+    document["convergence"] = (
+        _encode_fields(policy) if isinstance(policy, dict) else policy
+    )
+    return document
+
+
+def _decode_limits(document: Dict[str, Any]) -> AbsoluteLimits:
+    fields = dict(document)
+    policy = fields.pop("convergence")
+    if isinstance(policy, dict):
+        policy = _decode_fields(policy)
+    return AbsoluteLimits(
+        convergence=convergence_from_spec(policy), **_decode_fields(fields)
+    )
+
+
+@dataclass(frozen=True)
+class SessionCheckpoint:
+    """
+    The resumable state of a SimulationSession.
+
+    - value, steps:   state after `steps` evolution steps
+    - done:           the evolution ended (converged, stalled or cycled);
+                      cycle records the cycle in the latter case
+    - limits:         AbsoluteLimits the session was running under
+    - accumulator:    StabilityAccumulator.to_dict() of the steps so far
+    - seen:           visited values -> step index, with cycle detection
+    """
+
+    initial_value: float
+    target: float
+    value: float
+    steps: int
+    done: bool
+    limits: AbsoluteLimits
+    detect_cycles: bool
+    accumulator: Dict[str, Any]
+    cycle: Optional[EvolutionCycle] = None
+    seen: Optional[Dict[float, int]] = None
+
+    def to_json(self) -> str:
+        """
+        Serialize the checkpoint (floats as exact hex strings).
+        """
+        document = {
+            "format": FORMAT_VERSION,
+            "initial_value": _encode(self.initial_value),
+            "target": _encode(self.target),
+            "value": _encode(self.value),
+            "steps": self.steps,
+            "done": self.done,
+            "limits": _encode_limits(self.limits),
+            "detect_cycles": self.detect_cycles,
+            "accumulator": _encode_fields(self.accumulator),
+            "cycle": (
+                None
+                if self.cycle is None
+                else [self.cycle.start, self.cycle.length]
+            ),
+            "seen": (
+                None
+                if self.seen is None
+                else [[_encode(value), index] for value, index in self.seen.items()]
+            ),
+        }
+        return json.dumps(document, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "SessionCheckpoint":
+        """
+        Parse a checkpoint produced by to_json().
+
+        Raises:
+            ValueError if the document is not a supported checkpoint.
+        """
+        document = json.loads(text)
+        if document.get("format") != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported session checkpoint format {document.get('format')!r}; "
+                f"expected {FORMAT_VERSION}."
+            )
+        cycle = document["cycle"]
+        seen = document["seen"]
+        return cls(
+            initial_value=float.fromhex(document["initial_value"]),
+            target=float.fromhex(document["target"]),
+            value=float.fromhex(document["value"]),
+            steps=document["steps"],
+            done=document["done"],
+            limits=_decode_limits(document["limits"]),
+            detect_cycles=document["detect_cycles"],
+            accumulator=_decode_fields(document["accumulator"]),
+            cycle=None if cycle is None else EvolutionCycle(*cycle),
+            seen=(
+                None
+                if seen is None
+                else {float.fromhex(value): index for value, index in seen}
+            ),
+        )
+
+    def save(self, path: PathLike) -> None:
+        """
+        Atomically write the checkpoint to path.
+        """
+        temporary = f"{os.fspath(path)}.tmp"
+        with open(temporary, "w", encoding="utf-8") as handle:
+            handle.write(self.to_json())
+            handle.flush()
+            os.fsync(handle.fileno())
+        os.replace(temporary, path)
+
+    @classmethod
+    def load(cls, path: PathLike) -> "SessionCheckpoint":
+        """
+        Read a checkpoint written by save().
+        """
+        with open(path, encoding="utf-8") as handle:
+            return cls.from_json(handle.read())
+
+    def restore_accumulator(self) -> StabilityAccumulator:
+        """
+        Return a fresh StabilityAccumulator continuing from this checkpoint.
+        """
+        return StabilityAccumulator.from_dict(self.accumulator)
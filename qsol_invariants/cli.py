@@ -0,0 +1,259 @@
+"""
+cli.py
+
+QSOL bulk evolution command line (installed as `qsol-evolve`).
+
+Streams session specs from JSONL files (or stdin) to StabilityReport records
+as JSONL, one output line per input line, in input order:
+
+    qsol-evolve specs.jsonl -o reports.jsonl --workers 8
+
+Each spec is a JSON object:
+
+- initial_value, target : floats (required)
+- transform             : "package.module:attribute", a bare name looked
+                          up in the --transforms module, or a declarative
+                          transform spec object such as {"type":
+                          "step_toward", "goal": 0.5, "step": 0.01} (see
+                          transforms.py) (defaults to --transform)
+- detect_cycles         : bool (defaults to --detect-cycles)
+- limits                : AbsoluteLimits fields overriding the defaults
+- convergence           : "exact", {"ulps": n} or {"absolute": a,
+                          "relative": r} (see convergence.py)
+- id                    : copied to the output record
+
+Each output record holds the StabilityReport fields (plus id), or an "error"
+message if the spec was invalid or the evolution violated the contract.
+
+Specs are read lazily and evaluated in chunks, with a bounded number of
+chunks in flight, so memory stays flat however long the input is. Each spec
+runs as a SimulationSession with keep_trace=False, so reports are computed
+in a single streaming pass, without keeping a trace. The
+process pool is only imported when more than one worker is requested.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import importlib
+import json
+import sys
+from collections import deque
+from itertools import islice
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from .absolute_limits import AbsoluteLimits, current_limits
+from .convergence import convergence_from_spec
+from .session import SimulationSession
+from .transforms import transform_from_spec
+
+
+# Command-line defaults shared with the workers: transform, transforms and
+# detect_cycles.
+_Options = Dict[str, Any]
+
+_transforms: Dict[str, Callable[[float], float]] = {}
+
+
+def _resolve_transform(
+    name: str, transforms_module: Optional[str]
+) -> Callable[[float], float]:
+    key = f"{transforms_module}|{name}"
+    fn = _transforms.get(key)
+    if fn is None:
+        if ":" in name:
+            module_name, attribute = name.split(":", 1)
+        elif transforms_module is not None:
+            module_name, attribute = transforms_module, name
+        else:
+            raise ValueError(
+                f"Transform {name!r} is not of the form 'module:attribute' "
+                "and no --transforms module was given."
+            )
+        fn = getattr(importlib.import_module(module_name), attribute)
+        _transforms[key] = fn
+    return fn
+
+
+def _limits(overrides: Optional[Dict[str, Any]]) -> AbsoluteLimits:
+    if not overrides:
+        return current_limits()
+    return dataclasses.replace(current_limits(), **overrides)
+
+
+def _evaluate(spec: Dict[str, Any], options: _Options) -> Dict[str, Any]:
+    transform = spec.get("transform", options["transform"])
+    if transform is None:
+        raise ValueError("Spec has no transform and no --transform default was given.")
+    if isinstance(transform, dict):
+        fn = transform_from_spec(transform)
+    else:
+        fn = _resolve_transform(transform, options["transforms"])
+    limits = _limits(spec.get("limits"))
+    convergence = spec.get("convergence")
+    if convergence is not None:
+        limits = dataclasses.replace(
+            limits, convergence=convergence_from_spec(convergence)
+        )
+    session = SimulationSession(
+        initial_value=float(spec["initial_value"]),
+        target=float(spec["target"]),
+        transform=fn,
+        keep_trace=False,
+        detect_cycles=spec.get("detect_cycles", options["detect_cycles"]),
+        limits=limits,
+    )
+    session.run()
+    return dataclasses.asdict(session.stability)
+
+
+def _run_line(line: str, options: _Options) -> Dict[str, Any]:
+    record: Dict[str, Any] = {}
+    try:
+        spec = json.loads(line)
+        if not isinstance(spec, dict):
+            raise ValueError("Spec must be a JSON object.")
+        if "id" in spec:
+            record["id"] = spec["id"]
+        record.update(_evaluate(spec, options))
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    return record
+
+
+def _run_chunk(lines: Sequence[str], options: _Options) -> Tuple[str, int]:
+    # Returns the chunk's output lines and its number of error records.
+    records = [_run_line(line, options) for line in lines]
+    errors = sum("error" in record for record in records)
+    return "".join(json.dumps(record) + "\n" for record in records), errors
+
+
+def _read_lines(paths: Sequence[str]) -> Iterator[str]:
+    for path in paths:
+        handle = sys.stdin if path == "-" else open(path, encoding="utf-8")
+        try:
+            for line in handle:
+                if line.strip():
+                    yield line
+        finally:
+            if handle is not sys.stdin:
+                handle.close()
+
+
+def _chunks(lines: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(lines)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run(
+    chunks: Iterator[List[str]], options: _Options, workers: int
+) -> Iterator[Tuple[str, int]]:
+    if workers == 1:
+        for chunk in chunks:
+            yield _run_chunk(chunk, options)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(_run_chunk, chunk, options))
+            # Bound the number of chunks held in memory.
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="qsol-evolve",
+        description="Evolve QSOL session specs (JSONL) into stability reports (JSONL).",
+    )
+    parser.add_argument(
+        "inputs",
+        nargs="*",
+        default=["-"],
+        help="JSONL spec files ('-' for stdin, the default).",
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="Output JSONL file ('-' for stdout)."
+    )
+    parser.add_argument(
+        "-w", "--workers", type=int, default=1, help="Worker processes (default 1)."
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=256,
+        help="Specs per unit of work (default 256).",
+    )
+    parser.add_argument(
+        "--transform", help="Default transform for specs that do not name one."
+    )
+    parser.add_argument(
+        "--transforms",
+        metavar="MODULE",
+        help="Module in which bare transform names are looked up.",
+    )
+    parser.add_argument(
+        "--detect-cycles",
+        action="store_true",
+        help="Stop evolutions that revisit a value (default for every spec).",
+    )
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Run the qsol-evolve command line.
+
+    Returns:
+        0 if every spec produced a report, 1 if any produced an error record.
+    """
+    args = _parser().parse_args(argv)
+    if args.workers < 1 or args.chunksize < 1:
+        _parser().error("--workers and --chunksize must be positive.")
+
+    options: _Options = {
+        "transform": args.transform,
+        "transforms": args.transforms,
+        "detect_cycles": args.detect_cycles,
+    }
+    chunks = _chunks(_read_lines(args.inputs), args.chunksize)
+    output = (
+        sys.stdout
+        if args.output == "-"
+        else open(args.output, "w", encoding="utf-8", buffering=1 << 20)
+    )
+    errors = 0
+    try:
+        for text, chunk_errors in _run(chunks, options, args.workers):
+            errors += chunk_errors
+            output.write(text)
+    finally:
+        if output is sys.stdout:
+            output.flush()
+        else:
+            output.close()
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,260 @@
+"""
+compressed_trace.py
+
+QSOL run-length compressed evolution traces.
+
+- CompressedTrace : an evolution trace stored as runs of constant delta
+- compress_trace  : encode an existing trace
+
+Increment-style and affine transforms produce long runs of steps with the
+same delta. A run is stored as its first step index, the value before that
+step (its base) and the shared delta; the k-th value inside the run
+(0 < k < length) is reconstructed as clamp(base + k * delta), and the value
+after the run's last step is the base of the next run (or the final value).
+A step only joins a run if that reconstruction is bit-for-bit identical to
+the recorded value, so decoding is lossless: a trace stuck at a clamp bound
+with a constant raw delta is still a single run, while a trace whose
+rounding drifts away from the formula simply breaks into more runs.
+
+Indexing finds the run of step i by binary search (O(log runs)), and
+analyze_trace works directly on the runs. Only scalar traces can be
+compressed.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_right
+from collections.abc import Sequence
+from typing import Iterable, Iterator, List, Optional, Tuple, Union, overload
+
+from .absolute_limits import AbsoluteLimits, current_limits
+from .quantum_state import QuantumState
+from .trace import EvolutionCycle, EvolutionStep, EvolutionTrace, is_row_column
+
+
+def _identical(a: float, b: float) -> bool:
+    # Bit-level equality for decoding purposes: -0.0 differs from 0.0 and
+    # NaN matches NaN.
+    if a == b:
+        return math.copysign(1.0, a) == math.copysign(1.0, b)
+    return a != a and b != b
+
+
+class CompressedTrace(Sequence):
+    """
+    A chronological evolution trace stored as runs of constant delta.
+
+    Behaves like EvolutionTrace: it supports append(next_value, delta),
+    len(), indexing and iteration over EvolutionStep views, and carries the
+    cycle that ended the evolution, if any.
+
+    limits are the contract whose clamp rule is used to reconstruct values;
+    they must match the limits the trace was produced under for runs along
+    a clamp bound to be recognized (any limits still decode losslessly).
+    """
+
+    __slots__ = ("_starts", "_bases", "_deltas", "_final", "_steps", "limits", "cycle")
+
+    def __init__(
+        self,
+        initial_value: float,
+        limits: Optional[AbsoluteLimits] = None,
+    ) -> None:
+        if getattr(initial_value, "ndim", 0) > 0:
+            raise ValueError("CompressedTrace only stores scalar traces.")
+        self._starts = array("q")
+        self._bases = array("d")
+        self._deltas = array("d")
+        self._final = initial_value
+        self._steps = 0
+        self.limits = current_limits() if limits is None else limits
+        self.cycle: Optional[EvolutionCycle] = None
+
+    @property
+    def runs(self) -> int:
+        """
+        Number of constant-delta runs.
+        """
+        return len(self._starts)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate size of the run buffers in bytes.
+        """
+        return 24 * len(self._starts) + 8
+
+    def _value(self, run: int, offset: int) -> float:
+        if offset == 0:
+            return self._bases[run]
+        return self.limits.clamp_value(self._bases[run] + offset * self._deltas[run])
+
+    def _run_end(self, run: int) -> float:
+        return self._final if run + 1 == len(self._starts) else self._bases[run + 1]
+
+    def append(self, next_value: float, delta: float) -> None:
+        """
+        Record one step ending at next_value with the given raw delta.
+        """
+        runs = len(self._starts)
+        if runs:
+            run = runs - 1
+            length = self._steps - self._starts[run]
+            # The current final value becomes an interior value of the run.
+            if _identical(delta, self._deltas[run]) and _identical(
+                self._final, self._value(run, length)
+            ):
+                self._final = next_value
+                self._steps += 1
+                return
+        self._starts.append(self._steps)
+        self._bases.append(self._final)
+        self._deltas.append(delta)
+        self._final = next_value
+        self._steps += 1
+
+    def iter_runs(self) -> Iterator[Tuple[float, float, float, float, int]]:
+        """
+        Yield (base, second, last_prev, end, steps) for every run.
+
+        base is the value before the run's first step, second the value
+        after it, last_prev the value before the run's last step and end the
+        value after it. The values second .. last_prev are monotone in the
+        direction of the run's delta.
+        """
+        for run in range(len(self._starts)):
+            steps = (
+                self._starts[run + 1] if run + 1 < len(self._starts) else self._steps
+            ) - self._starts[run]
+            end = self._run_end(run)
+            second = end if steps == 1 else self._value(run, 1)
+            yield self._bases[run], second, self._value(run, steps - 1), end, steps
+
+    def decompress(self) -> EvolutionTrace:
+        """
+        Return the equivalent columnar EvolutionTrace.
+        """
+        values = array("d", (self._value_at(i) for i in range(self._steps + 1)))
+        deltas = array("d", (self._delta_at(i) for i in range(self._steps)))
+        trace = EvolutionTrace.from_columns(values, deltas)
+        trace.cycle = self.cycle
+        return trace
+
+    def _run_of(self, step: int) -> int:
+        return bisect_right(self._starts, step) - 1
+
+    def _value_at(self, boundary: int) -> float:
+        if boundary == self._steps:
+            return self._final
+        run = self._run_of(boundary)
+        return self._value(run, boundary - self._starts[run])
+
+    def _delta_at(self, step: int) -> float:
+        return self._deltas[self._run_of(step)]
+
+    def _step(self, index: int) -> EvolutionStep:
+        run = self._run_of(index)
+        offset = index - self._starts[run]
+        length = (
+            self._starts[run + 1] if run + 1 < len(self._starts) else self._steps
+        ) - self._starts[run]
+        next_value = (
+            self._run_end(run) if offset + 1 == length else self._value(run, offset + 1)
+        )
+        return EvolutionStep(
+            index=index,
+            prev_state=QuantumState(self._value(run, offset), self.limits),
+            next_state=QuantumState(next_value, self.limits),
+            delta=self._deltas[run],
+        )
+
+    def __len__(self) -> int:
+        return self._steps
+
+    @overload
+    def __getitem__(self, index: int) -> EvolutionStep: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EvolutionStep]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[EvolutionStep, List[EvolutionStep]]:
+        if isinstance(index, slice):
+            return [self._step(i) for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("CompressedTrace index out of range")
+        return self._step(index)
+
+    def __iter__(self) -> Iterator[EvolutionStep]:
+        for index in range(len(self)):
+            yield self._step(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Sequence):
+            return (
+                getattr(other, "cycle", self.cycle) == self.cycle
+                and list(self) == list(other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"CompressedTrace(steps={len(self)}, runs={self.runs})"
+
+
+def compress_trace(
+    trace: Union[EvolutionTrace, Iterable[EvolutionStep]],
+    limits: Optional[AbsoluteLimits] = None,
+) -> CompressedTrace:
+    """
+    Run-length encode a scalar trace.
+
+    Args:
+        trace: EvolutionTrace (including TraceFile.trace) or a non-empty
+               iterable of EvolutionStep objects, consumed in a single pass
+               (e.g. iter_evolve_trace, whose cycle is recorded).
+        limits: Contract the trace was produced under (defaults to
+                current_limits()).
+
+    Returns:
+        CompressedTrace with the same steps and cycle.
+
+    Raises:
+        ValueError for vector traces or an empty step iterable.
+    """
+    if isinstance(trace, EvolutionTrace):
+        values, deltas = trace.values, trace.deltas
+        if not len(values):
+            raise ValueError("Cannot compress a trace without an initial value.")
+        if is_row_column(values):
+            raise ValueError("CompressedTrace only stores scalar traces.")
+        compressed = CompressedTrace(values[0], limits)
+        for i in range(len(deltas)):
+            compressed.append(values[i + 1], deltas[i])
+        compressed.cycle = trace.cycle
+        return compressed
+
+    compressed: Optional[CompressedTrace] = None
+    cycle: Optional[EvolutionCycle] = None
+    iterator = iter(trace)
+    while True:
+        try:
+            step = next(iterator)
+        except StopIteration as stop:
+            if isinstance(stop.value, EvolutionCycle):
+                cycle = stop.value
+            break
+        if compressed is None:
+            compressed = CompressedTrace(step.prev_state.value, limits)
+        compressed.append(step.next_state.value, step.delta)
+    if compressed is None:
+        raise ValueError("Cannot compress an empty sequence of steps.")
+    compressed.cycle = cycle
+    return compressed
@@ -0,0 +1,238 @@
+"""
+convergence.py
+
+QSOL convergence policies.
+
+The canonical rule is exact: a value has converged when
+target - value == convergence_delta. Floating-point transforms that approach
+their target asymptotically may never satisfy it and run on until the stall
+check or the iteration ceiling. An opt-in policy on the limits contract
+(AbsoluteLimits.convergence) relaxes the rule:
+
+- ExactConvergence   : the canonical rule (the default)
+- UlpConvergence     : within a number of ULPs of the target
+- EpsilonConvergence : within an absolute and/or relative epsilon
+- convergence_from_spec : rebuild a policy from its JSON-compatible spec
+
+Every policy accepts whatever the exact rule accepts, so a tolerant policy
+can only end an evolution earlier, never later. Arrays (vector states) have
+converged when every component has.
+"""
+
+from __future__ import annotations
+
+import math
+import struct
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, ClassVar, Dict, Union
+
+from ._numpy import require_numpy
+
+
+def _is_array(value: Any) -> bool:
+    return getattr(value, "ndim", 0) > 0
+
+
+def _ordinal(value: float) -> int:
+    # Maps floats onto integers so that adjacent floats differ by one
+    # (-0.0 and 0.0 both map to 0).
+    (bits,) = struct.unpack("<q", struct.pack("<d", value))
+    return bits if bits >= 0 else -(bits & 0x7FFF_FFFF_FFFF_FFFF)
+
+
+def ulp_distance(a: float, b: float) -> float:
+    """
+    Number of representable floats between a and b (inf if either is NaN).
+    """
+    if math.isnan(a) or math.isnan(b):
+        return math.inf
+    return abs(_ordinal(a) - _ordinal(b))
+
+
+class ConvergencePolicy(ABC):
+    """
+    Abstract base class of convergence policies.
+
+    Subclasses are frozen dataclasses implementing the scalar rule
+    (_converged), its elementwise NumPy form (converged_mask), describe()
+    and to_spec(); exact is True only for the canonical rule, which lets the evolution loops
+    keep their fast exact comparison.
+    """
+
+    exact: ClassVar[bool] = False
+
+    def is_converged(
+        self, value: Any, target: float, convergence_delta: float = 0.0
+    ) -> bool:
+        """
+        Whether value (every component of an array) has converged to target.
+        """
+        if _is_array(value):
+            return bool(self.converged_mask(value, target, convergence_delta).all())
+        return self._converged(value, target, convergence_delta)
+
+    @abstractmethod
+    def converged_mask(
+        self, values: Any, targets: Any, convergence_delta: float = 0.0
+    ) -> Any:
+        """
+        Elementwise convergence of an array of values to broadcastable targets.
+        """
+
+    @abstractmethod
+    def _converged(self, value: float, target: float, convergence_delta: float) -> bool:
+        """
+        Whether the scalar value has converged to target.
+        """
+
+    @abstractmethod
+    def describe(self) -> str:
+        """
+        Short name of the policy, as recorded in StabilityReport.converged_by.
+        """
+
+    @abstractmethod
+    def to_spec(self) -> Union[str, Dict[str, Any]]:
+        """
+        Return the JSON-compatible spec of the policy (see
+        convergence_from_spec).
+        """
+
+
+def _exactly_converged(value: Any, target: Any, convergence_delta: float) -> Any:
+    return (target - value) == convergence_delta
+
+
+def _ordinals(numpy, values: Any) -> Any:
+    bits = numpy.asarray(values, dtype=numpy.float64).view(numpy.int64)
+    return numpy.where(bits < 0, -(bits & 0x7FFF_FFFF_FFFF_FFFF), bits)
+
+
+@dataclass(frozen=True)
+class ExactConvergence(ConvergencePolicy):
+    """
+    The canonical rule: target - value == convergence_delta.
+    """
+
+    exact: ClassVar[bool] = True
+
+    def converged_mask(
+        self, values: Any, targets: Any, convergence_delta: float = 0.0
+    ) -> Any:
+        return _exactly_converged(values, targets, convergence_delta)
+
+    def _converged(self, value: float, target: float, convergence_delta: float) -> bool:
+        return _exactly_converged(value, target, convergence_delta)
+
+    def describe(self) -> str:
+        return "exact"
+
+    def to_spec(self) -> str:
+        return "exact"
+
+
+@dataclass(frozen=True)
+class UlpConvergence(ConvergencePolicy):
+    """
+    Converged within `ulps` representable floats of the target.
+    """
+
+    ulps: int = 1
+
+    def __post_init__(self) -> None:
+        if self.ulps < 0:
+            raise ValueError(f"UlpConvergence needs ulps >= 0, got {self.ulps}.")
+
+    def converged_mask(
+        self, values: Any, targets: Any, convergence_delta: float = 0.0
+    ) -> Any:
+        numpy = require_numpy()
+        values = numpy.asarray(values, dtype=numpy.float64)
+        targets = numpy.asarray(targets, dtype=numpy.float64)
+        a, b = _ordinals(numpy, values), _ordinals(numpy, targets)
+        same_side = (a >= 0) == (b >= 0)
+        # Opposite signs: the distance is the sum of both magnitudes, compared
+        # without forming it (it may not fit in an int64).
+        magnitude = numpy.abs(b)
+        opposite = (magnitude <= self.ulps) & (
+            numpy.abs(a) <= self.ulps - numpy.minimum(magnitude, self.ulps)
+        )
+        within = numpy.where(same_side, numpy.abs(a - b) <= self.ulps, opposite)
+        within &= ~(numpy.isnan(values) | numpy.isnan(targets))
+        return within | _exactly_converged(values, targets, convergence_delta)
+
+    def _converged(self, value: float, target: float, convergence_delta: float) -> bool:
+        return (
+            _exactly_converged(value, target, convergence_delta)
+            or ulp_distance(value, target) <= self.ulps
+        )
+
+    def describe(self) -> str:
+        return f"ulp({self.ulps})"
+
+    def to_spec(self) -> Dict[str, Any]:
+        return {"ulps": self.ulps}
+
+
+@dataclass(frozen=True)
+class EpsilonConvergence(ConvergencePolicy):
+    """
+    Converged when |target - value| <= max(absolute, relative * scale), where
+    scale = max(|target|, |value|) (as in math.isclose).
+    """
+
+    absolute: float = 0.0
+    relative: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not (self.absolute >= 0.0 and self.relative >= 0.0):
+            raise ValueError(
+                "EpsilonConvergence needs non-negative tolerances, got "
+                f"absolute={self.absolute}, relative={self.relative}."
+            )
+
+    def converged_mask(
+        self, values: Any, targets: Any, convergence_delta: float = 0.0
+    ) -> Any:
+        numpy = require_numpy()
+        scale = numpy.maximum(numpy.abs(targets), numpy.abs(values))
+        within = numpy.abs(targets - values) <= numpy.maximum(
+            self.absolute, self.relative * scale
+        )
+        return within | _exactly_converged(values, targets, convergence_delta)
+
+    def _converged(self, value: float, target: float, convergence_delta: float) -> bool:
+        if _exactly_converged(value, target, convergence_delta):
+            return True
+        scale = max(abs(target), abs(value))
+        return abs(target - value) <= max(self.absolute, self.relative * scale)
+
+    def describe(self) -> str:
+        return f"epsilon(absolute={self.absolute}, relative={self.relative})"
+
+    def to_spec(self) -> Dict[str, Any]:
+        return {"absolute": self.absolute, "relative": self.relative}
+
+
+EXACT_CONVERGENCE = ExactConvergence()
+
+
+def convergence_from_spec(spec: Union[str, Dict[str, Any]]) -> ConvergencePolicy:
+    """
+    Build a policy from its spec: "exact", {"ulps": n} or
+    {"absolute": a, "relative": r}.
+
+    Raises:
+        ValueError for an unknown spec or invalid parameters.
+    """
+    if spec == "exact":
+        return EXACT_CONVERGENCE
+    if not isinstance(spec, dict):
+        raise ValueError(f"Unknown convergence policy {spec!r}.")
+    try:
+        if "ulps" in spec:
+            return UlpConvergence(**spec)
+        return EpsilonConvergence(**spec)
+    except TypeError as exc:
+        raise ValueError(f"Invalid convergence spec {spec!r}: {exc}") from None
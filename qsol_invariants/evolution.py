@@ -7,45 +7,144 @@ Defines the canonical state evolution primitives:
 
 - evolve       : single PHI-bounded step
 - evolve_until : deterministic fixed-point evolution toward a target
-- evolve_trace : evolution with full audit-ready trace
+- evolve_trace : evolution with full audit-ready trace (columnar EvolutionTrace)
+- iter_evolve_trace : streaming evolution, yielding steps as they happen
+- evolve_async, evolve_until_async, evolve_trace_async : asyncio variants
+  that await the transform
+
+and the loops they are built on, shared with the session, scheduler,
+trace archive and command-line modules:
+
+- iter_transitions         : the state-based loop, as a generator of
+                             (prev_state, next_state, delta)
+- evolve_transitions_async : the same loop, awaiting the transform
+- evolve_until_kernel      : the evolve_until loop on raw floats
+- closed_form_prefix       : the event-free prefix of a closed-form
+                             trajectory
 
 All evolution is:
 - deterministic
 - PHI-bounded per step
 - constrained by AbsoluteLimits.max_iterations
+
+Transforms may advertise an exact closed form (ClosedFormTransform), which
+lets evolve_until jump over the steps between events instead of iterating
+them one by one.
+
+Every operator enforces the AbsoluteLimits given as `limits`, or else
+current_limits() (ABSOLUTE_LIMITS unless overridden with limits_context).
+Convergence follows the limits' rule unless an operator is given a tolerant
+convergence policy (see convergence.py), which ends asymptotic evolutions
+once they are close enough to the target.
+
+With detect_cycles=True the operators also stop as soon as the trajectory
+revisits a value. The transform is deterministic, so from then on the
+trajectory repeats forever and could only end at the iteration ceiling.
+
+Every loop operator accepts an optional profiling.Profiler, which times the
+components of each step and calls per-step hooks.
+
+All operators also evolve vector QuantumStates: the transform then maps an
+array to an array, the invariants apply to every component, the evolution
+converges when every component has converged and stalls when no component
+moves.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Callable, List, Tuple
-
-from .absolute_limits import ABSOLUTE_LIMITS
+import inspect
+import operator
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    Hashable,
+    Optional,
+    Protocol,
+    Tuple,
+    Union,
+    runtime_checkable,
+)
+
+from .absolute_limits import AbsoluteLimits, current_limits
+from .convergence import ConvergencePolicy
+from .profiling import Profiler
 from .quantum_state import QuantumState
+from .trace import EvolutionCycle, EvolutionStep, EvolutionTrace
 
 
 TransformFn = Callable[[float], float]
 
+# A transform for the async operators: a coroutine function, or a plain
+# transform (its result is used directly when it is not awaitable).
+AsyncTransformFn = Callable[[float], Union[float, Awaitable[float]]]
+
+# (prev_state, next_state, delta) for each step; returns the detected cycle.
+_Transitions = Generator[
+    Tuple[QuantumState, QuantumState, float], None, Optional[EvolutionCycle]
+]
 
-@dataclass(frozen=True)
-class EvolutionStep:
+
+def _vector_stalled(delta: Any) -> bool:
+    return not delta.any()
+
+
+def _vector_key(value: Any) -> Hashable:
+    return value.tobytes()
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def _loop_checks(
+    state: QuantumState,
+) -> Tuple[Callable[[Any], bool], Callable[[Any], Hashable]]:
     """
-    A single evolution step, capturing the transition for auditability.
+    Return (stalled, cycle_key) for the traced loops.
+
+    For scalars, stalled(delta) is delta == 0.0 and a value is its own cycle
+    key; vector states stall when no component moves and are keyed by their
+    bytes.
     """
+    if state.is_vector:
+        return _vector_stalled, _vector_key
+    return operator.not_, _identity
 
-    index: int
-    prev_state: QuantumState
-    next_state: QuantumState
-    delta: float
 
+@runtime_checkable
+class ClosedFormTransform(Protocol):
+    """
+    A transform that advertises an exact closed form for its iterates.
 
-def evolve(state: QuantumState, fn: TransformFn) -> Tuple[QuantumState, float]:
+    iterate(value, steps) must return exactly the float that `steps`
+    successive applications of the transform to value produce, without
+    clamping, or None when it cannot guarantee that for the given arguments.
+    The unclamped trajectory must be monotone, as it is for constant
+    increments and affine maps with a non-negative slope.
+
+    Evolution operators trust the declaration: they use iterate to locate the
+    first step at which the trajectory converges, stalls, leaves the domain
+    or violates the PHI bound, and only evaluate the transform from there on.
+    """
+
+    def __call__(self, value: float) -> float: ...
+
+    def iterate(self, value: float, steps: int) -> Optional[float]: ...
+
+
+def evolve(
+    state: QuantumState, fn: TransformFn, limits: Optional[AbsoluteLimits] = None
+) -> Tuple[QuantumState, float]:
     """
     Perform a single PHI-bounded evolution step.
 
     Args:
         state: Current QuantumState.
         fn: A deterministic transform function f(x) -> x', before clamping.
+        limits: Contract to enforce (defaults to current_limits()).
 
     Returns:
         (next_state, delta) where:
@@ -55,15 +154,23 @@ def evolve(state: QuantumState, fn: TransformFn) -> Tuple[QuantumState, float]:
     Raises:
         ValueError: if the implied delta violates PHI bounds.
     """
-    raw_next = fn(state.value)
+    return _complete_step(state, fn(state.value), limits)
+
+
+def _complete_step(
+    state: QuantumState, raw_next: float, limits: Optional[AbsoluteLimits] = None
+) -> Tuple[QuantumState, float]:
+    # Invariant checks of a step, once the transform has produced raw_next.
+    if limits is None:
+        limits = current_limits()
     delta = raw_next - state.value
 
     # Validate delta against PHI-bound requirement.
-    ABSOLUTE_LIMITS.validate_step_delta(delta)
+    limits.validate_step_delta(delta)
 
     # Clamp the resulting value to the allowed domain.
-    clamped_next = ABSOLUTE_LIMITS.clamp_value(raw_next)
-    next_state = QuantumState(clamped_next)
+    clamped_next = limits.clamp_value(raw_next)
+    next_state = QuantumState(clamped_next, limits)
 
     return next_state, delta
 
@@ -72,16 +179,36 @@ def evolve_until(
     initial: QuantumState,
     target: float,
     fn: TransformFn,
+    detect_cycles: bool = False,
+    profiler: Optional[Profiler] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
 ) -> Tuple[QuantumState, int]:
     """
     Evolve deterministically until convergence to a target under the invariant rule.
 
-    Convergence is defined by the AbsoluteLimits convergence_delta (delta == 0.0).
+    Convergence is defined by the AbsoluteLimits convergence_delta (delta == 0.0),
+    or by the given convergence policy.
+
+    If fn is a ClosedFormTransform whose closed form is available from the
+    initial value, the steps up to the first convergence, stall, clamp or
+    PHI-bound event are skipped via its closed form, and a trajectory
+    clamped onto a fixed point fails the ceiling immediately. The
+    outcome and step count are those of the step-by-step loop.
 
     Args:
         initial: Starting QuantumState.
         target: Target scalar value.
         fn: Deterministic transform function f(x) -> x', before clamping.
+        detect_cycles: Stop as soon as the trajectory revisits a value
+                       instead of iterating until the ceiling. Use
+                       evolve_trace or iter_evolve_trace to obtain the
+                       cycle's entry index and length.
+        profiler: Optional Profiler that times each step and calls its hooks.
+        convergence: Convergence policy overriding AbsoluteLimits.convergence
+                     (e.g. UlpConvergence(4)); the closed form is only used
+                     with the exact rule.
+        limits: Contract to enforce (defaults to current_limits()).
 
     Returns:
         (final_state, steps) where:
@@ -91,37 +218,338 @@ def evolve_until(
     Raises:
         ValueError: if iteration count would exceed AbsoluteLimits.max_iterations.
     """
+    vector = initial.is_vector
+    limits = current_limits() if limits is None else limits
+    policy = limits.convergence if convergence is None else convergence
+    if (
+        not vector
+        and policy.exact
+        and isinstance(fn, ClosedFormTransform)
+        and fn.iterate(initial.value, 1) is not None
+    ):
+        return _evolve_until_closed_form(
+            initial, target, fn, detect_cycles, profiler, limits, policy
+        )
+
+    if profiler is None and not vector:
+        value, steps, _ = evolve_until_kernel(
+            initial.value, target, fn, detect_cycles, limits, convergence=policy
+        )
+        return QuantumState(value, limits), steps
+
+    # Instrumented or vector: the traced loop, keeping only the last state.
     state = initial.copy()
     steps = 0
+    transitions = iter_transitions(
+        state,
+        target,
+        fn,
+        detect_cycles=detect_cycles,
+        profiler=profiler,
+        limits=limits,
+        convergence=policy,
+    )
+    for _, state, _ in transitions:
+        steps += 1
+    return state, steps
+
+
+def evolve_until_kernel(
+    initial_value: float,
+    target: float,
+    fn: TransformFn,
+    detect_cycles: bool = False,
+    limits: Optional[AbsoluteLimits] = None,
+    on_step: Optional[Callable[[float, float], None]] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+) -> Tuple[float, int, Optional[EvolutionCycle]]:
+    """
+    The evolve_until loop on raw floats.
+
+    Performs exactly the checks of evolve and QuantumState, in the same
+    order, with the limits hoisted into locals and no QuantumState built per
+    step. Violations are raised through AbsoluteLimits, so exception types
+    and messages are those of the state-based loop (iter_transitions).
+
+    limits replaces current_limits() for every check, convergence overrides
+    its convergence policy, and on_step, if given, is called with
+    (prev_value, next_value) after each step (e.g.
+    StabilityAccumulator.update).
+
+    Returns:
+        (final_value, steps, cycle) where cycle is set if the loop stopped on
+        a revisited value.
+    """
+    limits = current_limits() if limits is None else limits
+    min_value = limits.min_value
+    max_value = limits.max_value
+    convergence_delta = limits.convergence_delta
+    max_iterations = limits.max_iterations
+    max_step_delta = limits.max_step_delta
+    policy = limits.convergence if convergence is None else convergence
+    # Tolerant policies are consulted only when the exact rule fails.
+    tolerant = None if policy.exact else policy.is_converged
+
+    value = limits.clamp_value(initial_value)
+    steps = 0
+    seen: Optional[Dict[float, int]] = None
+    if detect_cycles:
+        seen = {value: steps}
 
     while True:
-        # Enforce iteration ceiling before performing the next step.
-        ABSOLUTE_LIMITS.validate_iteration_count(steps)
+        if steps > max_iterations:
+            limits.validate_iteration_count(steps)
+
+        if target - value == convergence_delta or (
+            tolerant is not None and tolerant(value, target, convergence_delta)
+        ):
+            return value, steps, None
+
+        prev_value = value
+        raw_next = fn(value)
+        delta = raw_next - value
+        if abs(delta) > max_step_delta:
+            limits.validate_step_delta(delta)
+
+        if raw_next < min_value:
+            value = min_value
+        elif raw_next > max_value:
+            value = max_value
+        else:
+            value = raw_next
+        steps += 1
+        if on_step is not None:
+            on_step(prev_value, value)
 
-        # If already converged, stop.
-        if state.is_converged_to(target):
-            return state, steps
+        if target - value == convergence_delta or (
+            tolerant is not None and tolerant(value, target, convergence_delta)
+        ):
+            return value, steps, None
 
-        next_state, delta = evolve(state, fn)
+        if delta == 0.0:
+            return value, steps, None
 
-        state = next_state
+        if seen is not None:
+            start = seen.setdefault(value, steps)
+            if start != steps:
+                return value, steps, EvolutionCycle(start, steps - start)
+
+
+def closed_form_prefix(
+    initial_value: float,
+    target: float,
+    fn: ClosedFormTransform,
+    limits: Optional[AbsoluteLimits] = None,
+) -> Optional[Tuple[float, float, int]]:
+    """
+    Locate the last step before the first event of a closed-form trajectory.
+
+    An event is anything that ends plain iteration of the closed form:
+    convergence, a stall, leaving the domain (clamping) or a PHI-bound
+    violation. Because the trajectory is monotone, "the trajectory has
+    reached the target" and "an event other than convergence has happened"
+    are both monotone in the step number, so the first event is found by
+    galloping and bisection in O(log steps) calls to iterate.
+
+    Returns:
+        (prev_value, value, steps): the value after `steps` event-free steps
+        and the value one step earlier, or None if nothing can be skipped or
+        the closed form is unavailable.
+    """
+    limits = current_limits() if limits is None else limits
+    values: Dict[int, Optional[float]] = {0: initial_value}
+
+    def value_at(steps: int) -> Optional[float]:
+        if steps not in values:
+            values[steps] = fn.iterate(initial_value, steps)
+        return values[steps]
+
+    def pair_at(step: int) -> Tuple[float, float]:
+        prev, value = value_at(step - 1), value_at(step)
+        if prev is None or value is None:
+            raise LookupError(step)
+        return prev, value
+
+    def breaks_at(step: int) -> bool:
+        # Any event except convergence.
+        prev, value = pair_at(step)
+        delta = value - prev
+        return (
+            not limits.is_within_domain(value)
+            or abs(delta) > limits.max_step_delta
+            or delta == 0.0
+        )
+
+    def first(predicate: Callable[[int], bool], lo: int, ceiling: int) -> int:
+        # Smallest step in (lo, ceiling] satisfying predicate, or ceiling + 1.
+        base, stride = lo, 1
+        hi = lo + 1
+        while not predicate(hi):
+            if hi == ceiling:
+                return ceiling + 1
+            stride *= 2
+            lo, hi = hi, min(base + stride, ceiling)
+        while hi - lo > 1:
+            mid = (lo + hi) // 2
+            if predicate(mid):
+                hi = mid
+            else:
+                lo = mid
+        return hi
+
+    # The loop performs at most max_iterations + 1 steps before the ceiling
+    # check raises. If no event occurs by then, resume at the ceiling and let
+    # the iteration check raise exactly as the loop would.
+    ceiling = limits.max_iterations + 1
+    try:
+        first_value = value_at(1)
+        if first_value is None:
+            return None
+        direction = (first_value > initial_value) - (first_value < initial_value)
+
+        def reaches_target(step: int) -> bool:
+            value = pair_at(step)[1]
+            return direction * (value - target) >= 0 or limits.is_converged(
+                target - value
+            )
+
+        event = first(lambda k: breaks_at(k) or reaches_target(k), 0, ceiling)
+        if event <= ceiling and not breaks_at(event):
+            value = pair_at(event)[1]
+            if not limits.is_converged(target - value):
+                # Passed the target without converging: moving away from it,
+                # the trajectory can only end by clamping, stalling or a
+                # PHI-bound violation.
+                event = first(breaks_at, event, ceiling)
+        steps = event - 1
+        if steps < 1:
+            return None
+        prev, value = pair_at(steps)
+    except LookupError:
+        return None
+    return prev, value, steps
+
+
+def _evolve_until_closed_form(
+    initial: QuantumState,
+    target: float,
+    fn: ClosedFormTransform,
+    detect_cycles: bool = False,
+    profiler: Optional[Profiler] = None,
+    limits: Optional[AbsoluteLimits] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+) -> Tuple[QuantumState, int]:
+    """
+    evolve_until for closed-form transforms: skip to the first event, then
+    finish with the regular loop under the same (exact) convergence policy.
+    """
+    limits = current_limits() if limits is None else limits
+    state = initial.copy()
+    steps = 0
+    if not state.is_converged_to(target, convergence, limits):
+        prefix = closed_form_prefix(state.value, target, fn, limits)
+        if prefix is not None:
+            _, value, steps = prefix
+            state = QuantumState(value, limits)
+
+    transitions = iter_transitions(
+        state,
+        target,
+        fn,
+        start=steps,
+        skip_stuck=not detect_cycles,
+        detect_cycles=detect_cycles,
+        profiler=profiler,
+        limits=limits,
+        convergence=convergence,
+    )
+    for _, state, _ in transitions:
         steps += 1
+    return state, steps
 
-        # Check convergence relative to target after the step.
-        if state.is_converged_to(target):
-            return state, steps
 
-        # Optional: short-circuit if the transform no longer moves toward the target.
-        # This keeps deterministic behavior while avoiding infinite loops on bad fn.
-        if delta == 0.0 and not state.is_converged_to(target):
-            return state, steps
+def iter_transitions(
+    initial: QuantumState,
+    target: float,
+    fn: TransformFn,
+    start: int = 0,
+    skip_stuck: bool = False,
+    detect_cycles: bool = False,
+    profiler: Optional[Profiler] = None,
+    seen: Optional[Dict[Hashable, int]] = None,
+    limits: Optional[AbsoluteLimits] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+) -> _Transitions:
+    """
+    Yield (prev_state, next_state, delta) for every step of a traced evolution.
+
+    This is the single definition of the state-based evolution loop shared by
+    evolve_trace, iter_evolve_trace and the instrumented and vector paths of
+    evolve_until. The generator returns the detected
+    EvolutionCycle, or None.
+
+    Args:
+        start: Number of steps already taken before `initial`; the iteration
+               ceiling applies to the total.
+        skip_stuck: Raise the iteration-ceiling error as soon as a clamped
+                    step leaves the state unchanged. The state is then a fixed
+                    point of clamp(fn(x)) with a non-zero delta, so every
+                    remaining step is identical and the ceiling is certain.
+        detect_cycles: Stop at the first revisited value and return the cycle.
+        profiler: Optional Profiler that times each step and calls its hooks.
+        seen: With detect_cycles, the values visited so far (cycle key ->
+              step index), when resuming an evolution; updated in place.
+        limits: Contract to enforce (defaults to current_limits()).
+        convergence: Convergence policy overriding limits.convergence.
+    """
+    limits = current_limits() if limits is None else limits
+    policy = limits.convergence if convergence is None else convergence
+    step = evolve if profiler is None else profiler.evolve
+    stalled, cycle_key = _loop_checks(initial)
+    state = initial.copy()
+    index = start
+    if not detect_cycles:
+        seen = None
+    elif seen is None:
+        seen = {cycle_key(state.value): index}
+
+    while True:
+        limits.validate_iteration_count(index)
+
+        if state.is_converged_to(target, policy, limits):
+            return None
+
+        next_state, delta = step(state, fn, limits)
+        yield state, next_state, delta
+
+        stuck = skip_stuck and next_state.value == state.value
+        state = next_state
+        index += 1
+
+        if state.is_converged_to(target, policy, limits):
+            return None
+
+        if stalled(delta) and not state.is_converged_to(target, policy, limits):
+            return None
+
+        if seen is not None:
+            entry = seen.setdefault(cycle_key(state.value), index)
+            if entry != index:
+                return EvolutionCycle(start=entry, length=index - entry)
+
+        if stuck:
+            limits.validate_iteration_count(limits.max_iterations + 1)
 
 
 def evolve_trace(
     initial: QuantumState,
     target: float,
     fn: TransformFn,
-) -> List[EvolutionStep]:
+    detect_cycles: bool = False,
+    profiler: Optional[Profiler] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> EvolutionTrace:
     """
     Evolve with a full audit-ready trace of all intermediate states.
 
@@ -129,38 +557,216 @@ def evolve_trace(
         initial: Starting QuantumState.
         target: Target scalar value.
         fn: Deterministic transform function f(x) -> x', before clamping.
+        detect_cycles: Stop as soon as the trajectory revisits a value and
+                       record the cycle on the trace.
+        profiler: Optional Profiler that times each step and calls its hooks.
+        convergence: Convergence policy overriding AbsoluteLimits.convergence.
+        limits: Contract to enforce (defaults to current_limits()).
 
     Returns:
-        List of EvolutionStep objects, in chronological order.
+        EvolutionTrace of the steps, in chronological order. It behaves as a
+        sequence of EvolutionStep objects; trace.cycle holds the detected
+        EvolutionCycle, if any.
     """
-    trace: List[EvolutionStep] = []
-    state = initial.copy()
-    index = 0
-
+    trace = EvolutionTrace(initial.copy().value)
+    transitions = iter_transitions(
+        initial,
+        target,
+        fn,
+        detect_cycles=detect_cycles,
+        profiler=profiler,
+        limits=limits,
+        convergence=convergence,
+    )
     while True:
-        ABSOLUTE_LIMITS.validate_iteration_count(index)
+        try:
+            _, next_state, delta = next(transitions)
+        except StopIteration as stop:
+            trace.cycle = stop.value
+            return trace
+        trace.append(next_state.value, delta)
 
-        if state.is_converged_to(target):
-            break
 
-        next_state, delta = evolve(state, fn)
+def iter_evolve_trace(
+    initial: QuantumState,
+    target: float,
+    fn: TransformFn,
+    detect_cycles: bool = False,
+    profiler: Optional[Profiler] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> Generator[EvolutionStep, None, Optional[EvolutionCycle]]:
+    """
+    Evolve lazily, yielding each EvolutionStep as soon as it is computed.
+
+    The steps are exactly those evolve_trace would record, but nothing is
+    retained, so consumers can process arbitrarily long evolutions in
+    constant memory. Invariant violations are raised when the offending
+    step is reached.
 
-        step = EvolutionStep(
+    Args:
+        initial: Starting QuantumState.
+        target: Target scalar value.
+        fn: Deterministic transform function f(x) -> x', before clamping.
+        detect_cycles: Stop as soon as the trajectory revisits a value.
+        profiler: Optional Profiler that times each step and calls its hooks.
+        convergence: Convergence policy overriding AbsoluteLimits.convergence.
+        limits: Contract to enforce (defaults to current_limits() as of the
+                first step requested).
+
+    Yields:
+        EvolutionStep objects, in chronological order.
+
+    Returns:
+        The detected EvolutionCycle, or None (the value of StopIteration, or
+        of a `yield from` expression).
+
+    Raises:
+        ValueError: if a step violates PHI bounds or the iteration ceiling.
+    """
+    transitions = iter_transitions(
+        initial,
+        target,
+        fn,
+        detect_cycles=detect_cycles,
+        profiler=profiler,
+        limits=limits,
+        convergence=convergence,
+    )
+    index = 0
+    while True:
+        try:
+            state, next_state, delta = next(transitions)
+        except StopIteration as stop:
+            return stop.value
+        yield EvolutionStep(
             index=index,
             prev_state=state,
             next_state=next_state,
             delta=delta,
         )
-        trace.append(step)
+        index += 1
+
+
+async def evolve_async(
+    state: QuantumState, fn: AsyncTransformFn, limits: Optional[AbsoluteLimits] = None
+) -> Tuple[QuantumState, float]:
+    """
+    Perform a single PHI-bounded evolution step, awaiting the transform.
+
+    Same contract and invariant checks as evolve.
+    """
+    raw_next = fn(state.value)
+    if inspect.isawaitable(raw_next):
+        raw_next = await raw_next
+    return _complete_step(state, raw_next, limits)
+
+
+async def evolve_transitions_async(
+    initial: QuantumState,
+    target: float,
+    fn: AsyncTransformFn,
+    detect_cycles: bool = False,
+    on_step: Optional[Callable[[QuantumState, QuantumState, float], None]] = None,
+    profiler: Optional[Profiler] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> Tuple[QuantumState, int, Optional[EvolutionCycle]]:
+    """
+    The traced evolution loop of iter_transitions, awaiting the transform.
+
+    Calls on_step(prev_state, next_state, delta) for every step and returns
+    (final_state, steps, cycle).
+    """
+    step = evolve_async if profiler is None else profiler.evolve_async
+    limits = current_limits() if limits is None else limits
+    policy = limits.convergence if convergence is None else convergence
+    stalled, cycle_key = _loop_checks(initial)
+    state = initial.copy()
+    index = 0
+    seen: Optional[Dict[Hashable, int]] = None
+    if detect_cycles:
+        seen = {cycle_key(state.value): index}
+
+    while True:
+        limits.validate_iteration_count(index)
+
+        if state.is_converged_to(target, policy, limits):
+            return state, index, None
+
+        next_state, delta = await step(state, fn, limits)
+        if on_step is not None:
+            on_step(state, next_state, delta)
 
         state = next_state
         index += 1
 
-        if state.is_converged_to(target):
-            break
+        if state.is_converged_to(target, policy, limits):
+            return state, index, None
 
-        if delta == 0.0 and not state.is_converged_to(target):
-            break
+        if stalled(delta) and not state.is_converged_to(target, policy, limits):
+            return state, index, None
+
+        if seen is not None:
+            entry = seen.setdefault(cycle_key(state.value), index)
+            if entry != index:
+                cycle = EvolutionCycle(start=entry, length=index - entry)
+                return state, index, cycle
 
-    return trace
 
+async def evolve_until_async(
+    initial: QuantumState,
+    target: float,
+    fn: AsyncTransformFn,
+    detect_cycles: bool = False,
+    profiler: Optional[Profiler] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> Tuple[QuantumState, int]:
+    """
+    Evolve until convergence to a target, awaiting the transform.
+
+    Same contract, invariant checks and result as evolve_until.
+    """
+    state, steps, _ = await evolve_transitions_async(
+        initial,
+        target,
+        fn,
+        detect_cycles,
+        profiler=profiler,
+        convergence=convergence,
+        limits=limits,
+    )
+    return state, steps
+
+
+async def evolve_trace_async(
+    initial: QuantumState,
+    target: float,
+    fn: AsyncTransformFn,
+    detect_cycles: bool = False,
+    profiler: Optional[Profiler] = None,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> EvolutionTrace:
+    """
+    Evolve with a full audit-ready trace, awaiting the transform.
+
+    Same contract, invariant checks and result as evolve_trace.
+    """
+    trace = EvolutionTrace(initial.copy().value)
+
+    def record(prev: QuantumState, next_state: QuantumState, delta: float) -> None:
+        trace.append(next_state.value, delta)
+
+    _, _, trace.cycle = await evolve_transitions_async(
+        initial,
+        target,
+        fn,
+        detect_cycles,
+        on_step=record,
+        profiler=profiler,
+        convergence=convergence,
+        limits=limits,
+    )
+    return trace
@@ -0,0 +1,211 @@
+"""
+profiling.py
+
+QSOL evolution instrumentation.
+
+Optional, opt-in instrumentation of the evolution loop:
+
+- Profiler      : per-step hooks plus monotonic-clock counters, passed to the
+                  evolution operators as profiler=...
+- ProfileReport : immutable snapshot of a Profiler's counters
+- StepHook      : hook signature, called as hook(prev_state, next_state, delta)
+
+Time is split between the transform, the AbsoluteLimits checks of a step
+(PHI-bound validation and clamping), QuantumState construction and stability
+analysis; whatever remains of the total (loop bookkeeping, convergence
+checks, hooks) is reported as overhead.
+
+Operators called without a profiler run their uninstrumented code path, so
+instrumentation costs nothing when it is disabled.
+"""
+
+from __future__ import annotations
+
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+from .absolute_limits import AbsoluteLimits, current_limits
+from .quantum_state import QuantumState
+
+
+StepHook = Callable[[QuantumState, QuantumState, float], None]
+
+_clock = time.perf_counter_ns
+
+
+@dataclass(frozen=True)
+class ProfileReport:
+    """
+    Timing breakdown and step counts of an instrumented evolution.
+
+    Times are in seconds. steps counts the steps evaluated one by one;
+    steps skipped through a closed form are not included.
+    """
+
+    steps: int
+    transform_calls: int
+    transform_seconds: float
+    limits_seconds: float
+    state_seconds: float
+    analysis_seconds: float
+    total_seconds: float
+
+    @property
+    def overhead_seconds(self) -> float:
+        """
+        Time not attributed to any component (loop bookkeeping, convergence
+        checks, hooks).
+        """
+        attributed = (
+            self.transform_seconds
+            + self.limits_seconds
+            + self.state_seconds
+            + self.analysis_seconds
+        )
+        return max(self.total_seconds - attributed, 0.0)
+
+    def describe(self) -> str:
+        """
+        Return a human-readable timing breakdown.
+        """
+        total = self.total_seconds
+
+        def line(name: str, seconds: float) -> str:
+            share = seconds / total if total else 0.0
+            return f"  - {name}: {seconds:.6f}s ({share:.1%})"
+
+        return "\n".join(
+            [
+                "QSOL Evolution Profile:",
+                f"  - steps: {self.steps}",
+                f"  - transform_calls: {self.transform_calls}",
+                line("transform", self.transform_seconds),
+                line("limits", self.limits_seconds),
+                line("state", self.state_seconds),
+                line("analysis", self.analysis_seconds),
+                line("overhead", self.overhead_seconds),
+                f"  - total: {total:.6f}s",
+            ]
+        )
+
+
+class Profiler:
+    """
+    Collects per-step counters and dispatches step hooks.
+
+    A Profiler accumulates across every evolution it is passed to; use a
+    fresh one per run for a per-run breakdown. Components are timed with
+    time.perf_counter_ns.
+    """
+
+    __slots__ = (
+        "hooks",
+        "steps",
+        "transform_calls",
+        "transform_ns",
+        "limits_ns",
+        "state_ns",
+        "analysis_ns",
+        "total_ns",
+    )
+
+    def __init__(self, hooks: Iterable[StepHook] = ()) -> None:
+        self.hooks: List[StepHook] = list(hooks)
+        self.steps = 0
+        self.transform_calls = 0
+        self.transform_ns = 0
+        self.limits_ns = 0
+        self.state_ns = 0
+        self.analysis_ns = 0
+        self.total_ns = 0
+
+    def add_hook(self, hook: StepHook) -> None:
+        """
+        Register a hook called as hook(prev_state, next_state, delta) after
+        every evaluated step.
+        """
+        self.hooks.append(hook)
+
+    def evolve(
+        self,
+        state: QuantumState,
+        fn: Callable[[float], float],
+        limits: Optional[AbsoluteLimits] = None,
+    ) -> Tuple[QuantumState, float]:
+        """
+        Instrumented equivalent of evolution.evolve.
+        """
+        start = _clock()
+        raw_next = fn(state.value)
+        self.transform_ns += _clock() - start
+        self.transform_calls += 1
+        return self.complete_step(state, raw_next, limits)
+
+    async def evolve_async(
+        self,
+        state: QuantumState,
+        fn: Callable[[float], Any],
+        limits: Optional[AbsoluteLimits] = None,
+    ) -> Tuple[QuantumState, float]:
+        """
+        Instrumented equivalent of evolution.evolve_async. The transform time
+        includes the time spent awaiting it.
+        """
+        start = _clock()
+        raw_next = fn(state.value)
+        if inspect.isawaitable(raw_next):
+            raw_next = await raw_next
+        self.transform_ns += _clock() - start
+        self.transform_calls += 1
+        return self.complete_step(state, raw_next, limits)
+
+    def complete_step(
+        self,
+        state: QuantumState,
+        raw_next: float,
+        limits: Optional[AbsoluteLimits] = None,
+    ) -> Tuple[QuantumState, float]:
+        """
+        Instrumented invariant checks of a step (see evolution.evolve), then
+        the step hooks.
+        """
+        if limits is None:
+            limits = current_limits()
+        start = _clock()
+        delta = raw_next - state.value
+        limits.validate_step_delta(delta)
+        clamped_next = limits.clamp_value(raw_next)
+        checked = _clock()
+        next_state = QuantumState(clamped_next, limits)
+        self.state_ns += _clock() - checked
+        self.limits_ns += checked - start
+        self.steps += 1
+        for hook in self.hooks:
+            hook(state, next_state, delta)
+        return next_state, delta
+
+    def time_analysis(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Call fn(*args), counting its duration as analysis time.
+        """
+        start = _clock()
+        try:
+            return fn(*args)
+        finally:
+            self.analysis_ns += _clock() - start
+
+    def report(self) -> ProfileReport:
+        """
+        Return a snapshot of the counters.
+        """
+        return ProfileReport(
+            steps=self.steps,
+            transform_calls=self.transform_calls,
+            transform_seconds=self.transform_ns / 1e9,
+            limits_seconds=self.limits_ns / 1e9,
+            state_seconds=self.state_ns / 1e9,
+            analysis_seconds=self.analysis_ns / 1e9,
+            total_seconds=self.total_ns / 1e9,
+        )
@@ -9,30 +9,86 @@ evolution operators. This class guarantees:
 - value is always clamped to [0, 1]
 - all deltas are validated against AbsoluteLimits
 - state transitions are deterministic and side‑effect free
+
+A state built from a sequence or array is a vector state: its value is a
+read-only float64 NumPy array, and every invariant applies to each
+component (NumPy is then required).
+
+The invariants are those of the given AbsoluteLimits, or else of
+current_limits(); a state does not keep a reference to its contract.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from .absolute_limits import ABSOLUTE_LIMITS
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ._numpy import require_numpy
+from .absolute_limits import AbsoluteLimits, current_limits
+from .convergence import ConvergencePolicy
+
 
+def _as_vector(value: Any) -> Any:
+    # A read-only float64 copy for sequences and arrays; None for scalars.
+    if isinstance(value, (float, int)):
+        return None
+    if not isinstance(value, (list, tuple)) and getattr(value, "ndim", 0) == 0:
+        return None
+    numpy = require_numpy()
+    return numpy.array(value, dtype=numpy.float64)
 
-@dataclass
+
+@dataclass(init=False)
 class QuantumState:
     """
     A scalar state constrained by the QSOL Absolute Limits Contract.
 
     The state is always kept within [0, 1] and all transitions must obey the
-    PHI‑bounded max_step_delta constraint.
+    PHI‑bounded max_step_delta constraint. For a vector state both hold for
+    every component.
     """
 
-    value: float = field(default=0.0)
-
-    def __post_init__(self) -> None:
-        # Clamp initial value to the allowed domain.
-        self.value = ABSOLUTE_LIMITS.clamp_value(self.value)
+    __slots__ = ("value",)
+
+    value: Any
+
+    def __init__(
+        self, value: Any = 0.0, limits: Optional[AbsoluteLimits] = None
+    ) -> None:
+        if limits is None:
+            limits = current_limits()
+        vector = None if type(value) is float else _as_vector(value)
+        if vector is None:
+            # Clamp initial value to the allowed domain.
+            self.value = limits.clamp_value(value)
+        else:
+            vector = limits.clamp_value(vector)
+            vector.flags.writeable = False
+            self.value = vector
+
+    @classmethod
+    def _recorded(cls, value: Any) -> "QuantumState":
+        # A state for a value that was clamped when it was recorded (e.g. a
+        # trace column), under whatever contract was in effect then; it is
+        # not clamped again under the current one.
+        vector = None if type(value) is float else _as_vector(value)
+        if vector is not None:
+            vector.flags.writeable = False
+            value = vector
+        state = cls.__new__(cls)
+        state.value = value
+        return state
+
+    @property
+    def is_vector(self) -> bool:
+        """
+        Whether the state holds an array of components.
+        """
+        return type(self.value) is not float and getattr(self.value, "ndim", 0) > 0
 
-    def apply_delta(self, delta: float) -> "QuantumState":
+    def apply_delta(
+        self, delta: float, limits: Optional[AbsoluteLimits] = None
+    ) -> "QuantumState":
         """
         Apply a PHI‑bounded delta to the state and return a NEW QuantumState.
 
@@ -42,12 +98,14 @@ class QuantumState:
         - clamps the result to [0, 1]
         - returns a new QuantumState (no mutation)
         """
-        ABSOLUTE_LIMITS.validate_step_delta(delta)
+        if limits is None:
+            limits = current_limits()
+        limits.validate_step_delta(delta)
 
         new_value = self.value + delta
-        new_value = ABSOLUTE_LIMITS.clamp_value(new_value)
+        new_value = limits.clamp_value(new_value)
 
-        return QuantumState(new_value)
+        return QuantumState(new_value, limits)
 
     def distance_to(self, target: float) -> float:
         """
@@ -55,20 +113,48 @@ class QuantumState:
         """
         return target - self.value
 
-    def is_converged_to(self, target: float) -> bool:
+    def is_converged_to(
+        self,
+        target: float,
+        convergence: Optional[ConvergencePolicy] = None,
+        limits: Optional[AbsoluteLimits] = None,
+    ) -> bool:
         """
         Check whether the state has converged to the target under the invariant
-        convergence rule (delta == 0).
+        convergence rule (delta == convergence_delta), or under the given
+        convergence policy.
         """
-        delta = self.distance_to(target)
-        return ABSOLUTE_LIMITS.is_converged(delta)
+        if limits is None:
+            limits = current_limits()
+        if convergence is None or convergence.exact:
+            delta = self.distance_to(target)
+            return limits.is_converged(delta)
+        return convergence.is_converged(self.value, target, limits.convergence_delta)
 
     def copy(self) -> "QuantumState":
         """
         Return a shallow copy of the state.
         """
-        return QuantumState(self.value)
+        # The value is already clamped (and read-only for vectors), so it is
+        # shared as is rather than clamped again under the current contract.
+        state = QuantumState.__new__(QuantumState)
+        state.value = self.value
+        return state
+
+    def __eq__(self, other: object) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        if self.is_vector or other.is_vector:  # type: ignore[attr-defined]
+            numpy = require_numpy()
+            return bool(numpy.array_equal(self.value, other.value))  # type: ignore[attr-defined]
+        return (self.value,) == (other.value,)  # type: ignore[attr-defined]
+
+    __hash__ = None  # type: ignore[assignment]
 
     def __repr__(self) -> str:
+        if self.is_vector:
+            numpy = require_numpy()
+            components = numpy.array2string(self.value, precision=6, separator=", ")
+            return f"QuantumState(value={components})"
         return f"QuantumState(value={self.value:.6f})"
 
@@ -0,0 +1,204 @@
+"""
+runner.py
+
+QSOL parallel session runner.
+
+Fans independent SimulationSession runs out across a process pool:
+
+- run_sessions       : run many sessions on N worker processes
+- run_sessions_async : run many sessions on one event loop with bounded
+                       concurrency
+
+Sessions are shipped to the workers in chunks to amortize IPC (or, given a
+SessionSchedule from scheduler.py, in one bin of predicted-balanced work per
+worker, longest sessions first), and results
+come back in a compact form: the trace columns as array('d') buffers plus the
+StabilityReport, never pickled lists of EvolutionStep/QuantumState objects.
+Results are applied to the sessions in input order, so the outcome is
+identical to calling run() on each session sequentially.
+
+Transforms must be picklable (module-level functions or picklable callables;
+lambdas and closures are not). Step hooks run in the worker processes.
+
+For transforms that are naturally async (e.g. calls to local model servers),
+run_sessions_async interleaves thousands of sessions on a single event loop
+instead of blocking a thread per session.
+
+The process pool and asyncio are imported on first use, keeping the package
+cheap to import (e.g. for the qsol-evolve command line).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import List, Optional, Sequence, Tuple, Union
+
+from .profiling import ProfileReport
+from .scheduler import SessionSchedule
+from .session import SimulationSession
+from .stability import StabilityReport
+from .trace import EvolutionCycle, EvolutionTrace
+
+
+# (values, deltas, cycle, stability, profile_report) on success, or the
+# raised exception.
+_SessionResult = Union[
+    Tuple[
+        object,
+        object,
+        Optional[EvolutionCycle],
+        StabilityReport,
+        Optional[ProfileReport],
+    ],
+    BaseException,
+]
+
+
+def _run_one(session: SimulationSession) -> _SessionResult:
+    try:
+        session.run()
+    except Exception as exc:
+        return exc
+    trace = session.trace
+    assert session.stability is not None
+    return (
+        trace.values,
+        trace.deltas,
+        trace.cycle,
+        session.stability,
+        session.profile_report,
+    )
+
+
+def _run_chunk(sessions: Sequence[SimulationSession]) -> List[_SessionResult]:
+    return [_run_one(session) for session in sessions]
+
+
+def _apply(session: SimulationSession, result: _SessionResult) -> None:
+    values, deltas, cycle, stability, profile_report = result  # type: ignore[misc]
+    trace = EvolutionTrace.from_columns(values, deltas)
+    trace.cycle = cycle
+    session.trace = trace
+    session.stability = stability
+    session.profile_report = profile_report
+    session.completed = True
+
+
+def run_sessions(
+    sessions: Sequence[SimulationSession],
+    workers: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    schedule: Optional[SessionSchedule] = None,
+) -> List[SimulationSession]:
+    """
+    Run many sessions in parallel across a process pool.
+
+    Each session is updated in place exactly as if its run() method had been
+    called, and the sessions are returned in input order.
+
+    Args:
+        sessions: Sessions to run. Their transforms must be picklable.
+        workers: Number of worker processes (defaults to os.cpu_count()).
+                 With one worker, sessions run in the calling process.
+        chunksize: Sessions per task shipped to a worker (defaults to about
+                   four tasks per worker).
+        schedule: Optional SessionSchedule of these sessions (see
+                  schedule_sessions); each of its bins is shipped as one task,
+                  replacing chunksize.
+
+    Returns:
+        The input sessions, in input order.
+
+    Raises:
+        The first exception raised by a session, in input order, after all
+        other sessions have been run and updated. Failed sessions are left
+        not completed, as run() would leave them.
+    """
+    sessions = list(sessions)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"run_sessions needs at least one worker, got {workers}.")
+
+    if schedule is not None and len(schedule.estimates) != len(sessions):
+        raise ValueError(
+            f"SessionSchedule covers {len(schedule.estimates)} sessions, "
+            f"got {len(sessions)}."
+        )
+
+    in_process = workers == 1 or len(sessions) <= 1
+    if in_process:
+        # run() already updated the sessions in place.
+        results = _run_chunk(sessions)
+    else:
+        if schedule is not None:
+            order = [index for bin_ in schedule.bins for index in bin_]
+            groups = [list(bin_) for bin_ in schedule.bins if bin_]
+        else:
+            if chunksize is None:
+                chunksize = max(1, -(-len(sessions) // (workers * 4)))
+            order = list(range(len(sessions)))
+            groups = [
+                order[i : i + chunksize] for i in range(0, len(sessions), chunksize)
+            ]
+        chunks = [[sessions[index] for index in group] for group in groups]
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+            flat = [result for chunk in pool.map(_run_chunk, chunks) for result in chunk]
+        # Back to input order.
+        position = {index: i for i, index in enumerate(order)}
+        results = [flat[position[index]] for index in range(len(sessions))]
+
+    error: Optional[BaseException] = None
+    for session, result in zip(sessions, results):
+        if isinstance(result, BaseException):
+            error = error or result
+        elif not in_process:
+            _apply(session, result)
+    if error is not None:
+        raise error
+    return sessions
+
+
+async def run_sessions_async(
+    sessions: Sequence[SimulationSession],
+    concurrency: int = 64,
+) -> List[SimulationSession]:
+    """
+    Run many sessions concurrently on the running event loop.
+
+    At most `concurrency` sessions are in flight at once. Each session is
+    updated in place by its run_async() method.
+
+    Args:
+        sessions: Sessions to run; transforms may be coroutine functions.
+        concurrency: Maximum number of sessions evolving at the same time.
+
+    Returns:
+        The input sessions, in input order.
+
+    Raises:
+        The first exception raised by a session, in input order, after all
+        other sessions have finished.
+    """
+    if concurrency < 1:
+        raise ValueError(
+            f"run_sessions_async needs a concurrency of at least 1, got {concurrency}."
+        )
+    import asyncio
+
+    sessions = list(sessions)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(session: SimulationSession) -> None:
+        async with semaphore:
+            await session.run_async()
+
+    results = await asyncio.gather(
+        *(run_one(session) for session in sessions), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return sessions
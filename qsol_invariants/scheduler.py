@@ -0,0 +1,309 @@
+"""
+scheduler.py
+
+QSOL cost-aware session scheduling.
+
+Session cost ranges from a single step to the max_iterations ceiling, so
+splitting a batch into equal-sized chunks leaves workers idle behind a few
+stragglers. The scheduler predicts each session's step count before running
+it and balances the predicted work across workers:
+
+- estimate_steps    : predict the number of steps a session will take
+- schedule_sessions : bin sessions across workers, longest first (LPT)
+- SessionSchedule   : the predicted steps and the per-worker bins, accepted
+                      by run_sessions(schedule=...)
+- ScheduleAccuracy  : predicted vs actual steps after the run
+
+A prediction probes the first steps of the trajectory (in the calling
+process) and extrapolates the error |target - value|:
+
+- a constant step (arithmetic) runs to the target when it lands on it
+  exactly (value, step and target on one binary grid); otherwise it
+  overshoots to a clamp bound, where it either revisits a value
+  (detect_cycles) or runs to the ceiling
+- a contracting error (geometric) is extended with Aitken's delta-squared
+  limit until the remaining gap is below one ULP of the target
+- anything else (growing or irregular errors) is predicted to run to the
+  ceiling
+
+The PHI bound, |endpoint - initial| / max_step_delta, is a lower bound on
+every prediction. Sessions that end during the probe are predicted exactly.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import os
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, List, Optional, Sequence, Tuple
+
+from ._numpy import require_numpy
+from .absolute_limits import AbsoluteLimits
+from .evolution import iter_transitions
+from .session import SimulationSession
+
+
+def _error(value: Any, target: float) -> float:
+    # Distance to the target; the largest component distance for vectors.
+    if getattr(value, "ndim", 0) > 0:
+        return float(abs(target - value).max())
+    return abs(target - value)
+
+
+def _lands(values: List[Any], goal: Any) -> bool:
+    # Whether the constant steps ending values hit goal exactly: the last
+    # two steps are equal, and value, step and goal lie on one binary grid
+    # (so every partial sum is exact) with goal a whole number of steps
+    # ahead. Vectors must land in every component.
+    before, prev, last = values[-3], values[-2], values[-1]
+    if getattr(last, "ndim", 0) > 0:
+        numpy = require_numpy()
+        goals = numpy.broadcast_to(goal, last.shape).tolist()
+        columns = zip(before.tolist(), prev.tolist(), last.tolist())
+        return all(_lands(list(column), g) for column, g in zip(columns, goals))
+    step = last - prev
+    if step != prev - before:
+        return False
+    if step == 0.0:
+        return last == goal
+    if not all(math.isfinite(v) for v in (last, step, goal)):
+        return False
+    denominator = max(Fraction(v).denominator for v in (last, step, goal))
+    start, stride, end = (int(Fraction(v) * denominator) for v in (last, step, goal))
+    steps, rest = divmod(end - start, stride)
+    return rest == 0 and steps >= 0 and max(abs(start), abs(end)) <= 2**53
+
+
+def _probe(session: SimulationSession, probe: int) -> Tuple[List[Any], bool]:
+    # Returns the values of the first `probe` steps and whether the
+    # evolution ended (or failed) within them.
+    values = [session.initial_state.value]
+    transitions = iter_transitions(
+        session.initial_state,
+        session.target,
+        session.transform,
+        detect_cycles=session.detect_cycles,
+        limits=session.limits,
+    )
+    try:
+        for _, next_state, _ in transitions:
+            values.append(next_state.value)
+            if len(values) > probe + 1:
+                return values[:-1], False
+    except ValueError:
+        # The session fails here; running it costs as many steps.
+        pass
+    return values, True
+
+
+def _extrapolate(
+    values: List[Any], target: float, detect_cycles: bool, limits: AbsoluteLimits
+) -> Tuple[Optional[float], float]:
+    # Returns (remaining steps, error at the end), with None for the ceiling.
+    reachable = limits.is_within_domain(target)
+    goal = limits.clamp_value(target)
+    errors = [_error(value, goal) for value in values]
+    d1, d2 = errors[-2] - errors[-3], errors[-1] - errors[-2]
+
+    if d2 != 0.0 and math.isclose(d1, d2, rel_tol=1e-6):
+        # Constant steps: converge only by landing exactly on the target.
+        if d2 < 0.0 and reachable and _lands(values, goal):
+            return errors[-1] / -d2, 0.0
+        if getattr(values[-1], "ndim", 0) > 0 or not detect_cycles:
+            return None, errors[-1]
+        # Walk to the bound in the direction of travel, then revisit it.
+        velocity = values[-1] - values[-2]
+        bound = limits.max_value if velocity > 0.0 else limits.min_value
+        return (bound - values[-1]) / velocity + 1, abs(goal - bound)
+
+    if d1 != 0.0 and 0.0 < d2 / d1 < 1.0:
+        # Contracting error: ratio r, Aitken limit errors[-1] + d2 * r / (1 - r).
+        ratio = d2 / d1
+        limit = errors[-1] + d2 * ratio / (1.0 - ratio)
+        gap = abs(errors[-1] - limit)
+        resolution = math.ulp(abs(goal) + limit)
+        if gap <= resolution:
+            return 1, limit
+        return math.log(resolution / gap) / math.log(ratio), limit
+
+    return None, errors[-1]
+
+
+def estimate_steps(session: SimulationSession, probe: int = 16) -> int:
+    """
+    Predict the number of steps a session will take.
+
+    Args:
+        session: Session to estimate (it is not modified). Its transform must
+                 be synchronous; it is called up to probe times.
+        probe: Number of steps evaluated before extrapolating (at least 3).
+
+    Returns:
+        Predicted step count, between 0 and max_iterations.
+
+    Raises:
+        ValueError if probe < 3.
+    """
+    if probe < 3:
+        raise ValueError(
+            f"estimate_steps needs a probe of at least 3 steps, got {probe}."
+        )
+    values, ended = _probe(session, probe)
+    steps = len(values) - 1
+    if ended:
+        return steps
+
+    limits = session.limits
+    ceiling = limits.max_iterations
+    remaining, end_error = _extrapolate(
+        values, session.target, session.detect_cycles, limits
+    )
+    if remaining is None:
+        return ceiling
+    goal = limits.clamp_value(session.target)
+    phi_bound = abs(_error(values[0], goal) - end_error) / limits.max_step_delta
+    estimate = max(steps + math.ceil(remaining), math.ceil(phi_bound))
+    return min(estimate, ceiling)
+
+
+@dataclass(frozen=True)
+class ScheduleAccuracy:
+    """
+    Predicted vs actual step counts of a scheduled batch.
+
+    A session that did not complete (it raised, typically at the ceiling) is
+    counted as running max_iterations + 1 steps, the step at which the
+    ceiling check raises, so a straggler predicted short still shows in the
+    error statistics; failed counts such sessions.
+    """
+
+    predicted: Tuple[int, ...]
+    actual: Tuple[int, ...]
+    predicted_makespan: int
+    actual_makespan: int
+    failed: int = 0
+
+    @property
+    def mean_absolute_error(self) -> float:
+        """
+        Mean |predicted - actual| over all sessions (0.0 if none).
+        """
+        errors = [
+            abs(predicted - actual)
+            for predicted, actual in zip(self.predicted, self.actual)
+        ]
+        return sum(errors) / len(errors) if errors else 0.0
+
+    @property
+    def exact(self) -> int:
+        """
+        Number of sessions whose step count was predicted exactly.
+        """
+        return sum(
+            predicted == actual for predicted, actual in zip(self.predicted, self.actual)
+        )
+
+    def describe(self) -> str:
+        return (
+            "QSOL Schedule Accuracy:\n"
+            f"  - sessions: {len(self.predicted)} ({self.failed} failed)\n"
+            f"  - exact predictions: {self.exact}\n"
+            f"  - mean absolute error: {self.mean_absolute_error:.1f} steps\n"
+            f"  - makespan: predicted {self.predicted_makespan}, "
+            f"actual {self.actual_makespan} steps"
+        )
+
+
+@dataclass(frozen=True)
+class SessionSchedule:
+    """
+    Predicted step counts of a batch and its assignment to workers.
+
+    bins[w] holds the indices of the sessions run by worker w, longest
+    predicted first.
+    """
+
+    estimates: Tuple[int, ...]
+    bins: Tuple[Tuple[int, ...], ...]
+
+    @property
+    def loads(self) -> Tuple[int, ...]:
+        """
+        Predicted steps per worker.
+        """
+        return tuple(sum(self.estimates[i] for i in bin_) for bin_ in self.bins)
+
+    @property
+    def makespan(self) -> int:
+        """
+        Predicted steps of the busiest worker.
+        """
+        return max(self.loads, default=0)
+
+    def accuracy(self, sessions: Sequence[SimulationSession]) -> ScheduleAccuracy:
+        """
+        Compare the predictions with the sessions' actual step counts.
+
+        Args:
+            sessions: The scheduled sessions, in the same order, after the run.
+        """
+        if len(sessions) != len(self.estimates):
+            raise ValueError(
+                f"SessionSchedule covers {len(self.estimates)} sessions, "
+                f"got {len(sessions)}."
+            )
+        done = [
+            session.completed and session.stability is not None
+            for session in sessions
+        ]
+        actual = tuple(
+            session.stability.steps  # type: ignore[union-attr]
+            if completed
+            else session.limits.max_iterations + 1  # type: ignore[union-attr]
+            for session, completed in zip(sessions, done)
+        )
+        loads = [sum(actual[i] for i in bin_) for bin_ in self.bins]
+        return ScheduleAccuracy(
+            predicted=self.estimates,
+            actual=actual,
+            predicted_makespan=self.makespan,
+            actual_makespan=max(loads, default=0),
+            failed=done.count(False),
+        )
+
+
+def schedule_sessions(
+    sessions: Sequence[SimulationSession],
+    workers: Optional[int] = None,
+    probe: int = 16,
+) -> SessionSchedule:
+    """
+    Predict every session's steps and bin the sessions across workers.
+
+    Sessions are assigned longest predicted first, each to the worker with
+    the least predicted work so far (longest-processing-time-first).
+
+    Args:
+        sessions: Sessions to schedule.
+        workers: Number of bins (defaults to os.cpu_count()).
+        probe: Steps probed per session (see estimate_steps).
+
+    Returns:
+        SessionSchedule with one bin per worker.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"schedule_sessions needs at least one worker, got {workers}.")
+    estimates = tuple(estimate_steps(session, probe) for session in sessions)
+    bins: List[List[int]] = [[] for _ in range(workers)]
+    # (predicted load, worker) heap; ties go to the lowest worker.
+    loads = [(0, worker) for worker in range(workers)]
+    for index in sorted(range(len(estimates)), key=lambda i: (-estimates[i], i)):
+        load, worker = heapq.heappop(loads)
+        bins[worker].append(index)
+        # Every session costs at least one task slot, even with no steps.
+        heapq.heappush(loads, (load + max(estimates[index], 1), worker))
+    return SessionSchedule(estimates=estimates, bins=tuple(tuple(b) for b in bins))
@@ -18,13 +18,36 @@ evolution sessions.
 
 from __future__ import annotations
 
+import dataclasses
+import os
+import time
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Union
 
-from .absolute_limits import ABSOLUTE_LIMITS
-from .evolution import EvolutionStep, evolve_trace
+from .absolute_limits import AbsoluteLimits, current_limits
+from .cache import TransformCache
+from .checkpoint import SessionCheckpoint
+from .evolution import (
+    AsyncTransformFn,
+    ClosedFormTransform,
+    EvolutionCycle,
+    EvolutionTrace,
+    closed_form_prefix,
+    evolve_trace,
+    evolve_trace_async,
+    evolve_transitions_async,
+    evolve_until_kernel,
+    iter_evolve_trace,
+    iter_transitions,
+)
+from .profiling import Profiler, ProfileReport, StepHook
 from .quantum_state import QuantumState
-from .stability import StabilityReport, analyze_trace
+from .stability import (
+    StabilityAccumulator,
+    StabilityReport,
+    analyze_stream,
+    analyze_trace,
+)
 
 
 TransformFn = Callable[[float], float]
@@ -38,36 +61,420 @@ class SimulationSession:
     This class runs a deterministic, PHI-bounded evolution from an initial
     state toward a target using a user-provided transform function, and
     produces both a trace and a stability report.
+
+    With keep_trace=False the session streams the evolution through a
+    single-pass analyzer and keeps only the stability report, so memory use
+    is independent of the number of steps. In that mode a ClosedFormTransform
+    is also fast-forwarded to its first event under the exact convergence
+    rule, as in evolve_until, and other uninstrumented scalar sessions run
+    on evolve_until's raw-float loop.
+
+    With detect_cycles=True the evolution stops as soon as the trajectory
+    revisits a value, and the stability report records the cycle.
+
+    Sessions whose transform is a coroutine function are run with
+    run_async() instead of run().
+
+    An optional TransformCache memoizes transform results; one cache can be
+    shared by every session of a batch that uses the same transform.
+
+    With profile=True a run also records a ProfileReport (profile_report):
+    the time spent in the transform, the AbsoluteLimits checks, QuantumState
+    construction and stability analysis, plus step counts. step_hooks are
+    called as hook(prev_state, next_state, delta) after every evaluated step.
+    Sessions without either run uninstrumented.
+
+    With checkpoint_every and/or checkpoint_path set, a run records a
+    SessionCheckpoint (last_checkpoint) every checkpoint_every steps, when
+    the evolution ends and when it raises, saving it to checkpoint_path if
+    given. resume() continues from the last checkpoint, optionally under a
+    raised max_iterations, and updates the stability report incrementally.
+
+    limits is the AbsoluteLimits contract the session runs under; it defaults
+    to current_limits() at construction, so sessions created inside a
+    limits_context keep their contract when shipped to worker processes.
     """
 
     initial_value: float
     target: float
-    transform: TransformFn
+    transform: Union[TransformFn, AsyncTransformFn]
+    keep_trace: bool = True
+    detect_cycles: bool = False
+    cache: Optional[TransformCache] = None
+    profile: bool = False
+    step_hooks: Sequence[StepHook] = ()
+    checkpoint_every: Optional[int] = None
+    checkpoint_path: Optional[Union[str, "os.PathLike[str]"]] = None
+    limits: Optional[AbsoluteLimits] = None
 
     initial_state: QuantumState = field(init=False)
-    trace: List[EvolutionStep] = field(default_factory=list, init=False)
+    trace: EvolutionTrace = field(default_factory=EvolutionTrace, init=False)
     stability: Optional[StabilityReport] = field(default=None, init=False)
     completed: bool = field(default=False, init=False)
+    profile_report: Optional[ProfileReport] = field(default=None, init=False)
+    last_checkpoint: Optional[SessionCheckpoint] = field(default=None, init=False)
 
     def __post_init__(self) -> None:
-        # Clamp initial value into the invariant domain and construct state.
-        clamped = ABSOLUTE_LIMITS.clamp_value(self.initial_value)
-        self.initial_state = QuantumState(clamped)
+        if self.limits is None:
+            self.limits = current_limits()
+        # Clamp initial value into the invariant domain and construct state
+        # (componentwise for a vector initial value).
+        self.initial_state = QuantumState(self.initial_value, self.limits)
+
+    def _transform(self):
+        # The transform as evolved: routed through the cache when one is set.
+        if self.cache is None:
+            return self.transform
+        return self.cache.wrap(self.transform)
+
+    def _profiler(self) -> Optional[Profiler]:
+        if not self.profile and not self.step_hooks:
+            return None
+        return Profiler(self.step_hooks)
+
+    def _finish(self, profiler: Optional[Profiler], started_ns: int) -> None:
+        if profiler is not None and self.profile:
+            profiler.total_ns = time.perf_counter_ns() - started_ns
+            self.profile_report = profiler.report()
+        self.completed = True
+
+    @staticmethod
+    def _analyze(profiler: Optional[Profiler], fn: Callable[..., Any], *args):
+        if profiler is None:
+            return fn(*args)
+        return profiler.time_analysis(fn, *args)
 
     def run(self) -> None:
         """
         Execute the evolution session, generating a full trace and stability report.
 
         This method is idempotent: re-running will recompute the trace and report
-        from the same initial conditions.
+        from the same initial conditions. Use resume() to continue a
+        checkpointed run instead.
+        """
+        started_ns = time.perf_counter_ns()
+        profiler = self._profiler()
+        if self.checkpoint_every or self.checkpoint_path is not None:
+            self.stability = self._run_checkpointed(profiler)
+        elif self.keep_trace:
+            self.trace = evolve_trace(
+                initial=self.initial_state,
+                target=self.target,
+                fn=self._transform(),
+                detect_cycles=self.detect_cycles,
+                profiler=profiler,
+                limits=self.limits,
+            )
+            self.stability = self._analyze(
+                profiler, analyze_trace, self.trace, self.target, None, self.limits
+            )
+        elif (
+            isinstance(self._transform(), ClosedFormTransform)
+            and self.limits.convergence.exact
+            and not self.initial_state.is_vector
+        ):
+            self.trace = EvolutionTrace()
+            self.stability = self._run_closed_form(profiler)
+        elif profiler is None and not self.initial_state.is_vector:
+            self.trace = EvolutionTrace()
+            self.stability = self._run_kernel()
+        else:
+            # Streaming analysis is interleaved with evolution, so its cost
+            # is reported as overhead.
+            self.trace = EvolutionTrace()
+            self.stability = analyze_stream(
+                iter_evolve_trace(
+                    initial=self.initial_state,
+                    target=self.target,
+                    fn=self._transform(),
+                    detect_cycles=self.detect_cycles,
+                    profiler=profiler,
+                    limits=self.limits,
+                ),
+                self.target,
+                limits=self.limits,
+            )
+        self._finish(profiler, started_ns)
+
+    async def run_async(self) -> None:
+        """
+        Execute the evolution session on the running event loop, awaiting the
+        transform at every step.
+
+        Produces the same trace and report as run() would for the equivalent
+        synchronous transform.
+        """
+        started_ns = time.perf_counter_ns()
+        profiler = self._profiler()
+        if self.keep_trace:
+            self.trace = await evolve_trace_async(
+                initial=self.initial_state,
+                target=self.target,
+                fn=self._transform(),
+                detect_cycles=self.detect_cycles,
+                profiler=profiler,
+                limits=self.limits,
+            )
+            self.stability = self._analyze(
+                profiler, analyze_trace, self.trace, self.target, None, self.limits
+            )
+        else:
+            accumulator = StabilityAccumulator()
+
+            def record(prev, next_state, delta) -> None:
+                accumulator.update(prev.value, next_state.value)
+
+            _, _, cycle = await evolve_transitions_async(
+                self.initial_state,
+                self.target,
+                self._transform(),
+                self.detect_cycles,
+                on_step=record,
+                profiler=profiler,
+                limits=self.limits,
+            )
+            self.trace = EvolutionTrace()
+            self.stability = accumulator.report(
+                self.target, cycle=cycle, limits=self.limits
+            )
+        self._finish(profiler, started_ns)
+
+    def resume(self, max_iterations: Optional[int] = None) -> None:
+        """
+        Continue the session from its last checkpoint.
+
+        The checkpoint is the one recorded by the last run() or resume(), or
+        else the one saved at checkpoint_path. Steps before the checkpoint
+        are not recomputed: the stability report is built from the
+        checkpointed accumulator. With keep_trace, the trace is extended if
+        it still holds the checkpointed steps (same process); otherwise it
+        holds the steps from the checkpoint on.
+
+        Args:
+            max_iterations: New iteration ceiling, e.g. to extend a session
+                            that stopped at the ceiling. Defaults to the
+                            ceiling the checkpoint was taken under.
+
+        Raises:
+            RuntimeError if there is no checkpoint to resume from.
+            ValueError if the session's limits differ from the checkpoint's
+            other than in max_iterations, or as run() would, e.g. at the
+            (new) ceiling.
+        """
+        checkpoint = self.last_checkpoint
+        if checkpoint is None and self.checkpoint_path is not None:
+            if os.path.exists(self.checkpoint_path):
+                checkpoint = SessionCheckpoint.load(self.checkpoint_path)
+        if checkpoint is None:
+            raise RuntimeError("SimulationSession has no checkpoint to resume from.")
+
+        recorded = checkpoint.limits
+        if self.limits != dataclasses.replace(
+            recorded, max_iterations=self.limits.max_iterations
+        ):
+            raise ValueError(
+                "Cannot resume under limits other than the checkpoint's "
+                "(only max_iterations may change); see SessionCheckpoint.limits."
+            )
+        if max_iterations is None:
+            max_iterations = recorded.max_iterations
+        limits = dataclasses.replace(recorded, max_iterations=max_iterations)
+        started_ns = time.perf_counter_ns()
+        profiler = self._profiler()
+        self.stability = self._run_checkpointed(profiler, checkpoint, limits)
+        self._finish(profiler, started_ns)
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        path: Union[str, "os.PathLike[str]"],
+        transform: Union[TransformFn, AsyncTransformFn],
+        **options: Any,
+    ) -> "SimulationSession":
+        """
+        Rebuild a session from a checkpoint file, ready for resume(). The
+        session runs under the limits recorded in the checkpoint.
+
+        Args:
+            path: Checkpoint written by a session with checkpoint_path set.
+            transform: The session's transform (not stored in checkpoints).
+            **options: Other SimulationSession options (keep_trace, ...).
         """
-        self.trace = evolve_trace(
-            initial=self.initial_state,
+        checkpoint = SessionCheckpoint.load(path)
+        options.setdefault("checkpoint_path", path)
+        options.setdefault("limits", checkpoint.limits)
+        session = cls(
+            initial_value=checkpoint.initial_value,
+            target=checkpoint.target,
+            transform=transform,
+            detect_cycles=checkpoint.detect_cycles,
+            **options,
+        )
+        session.last_checkpoint = checkpoint
+        return session
+
+    def _checkpoint(
+        self,
+        value: float,
+        steps: int,
+        accumulator: StabilityAccumulator,
+        limits: AbsoluteLimits,
+        seen: Optional[Dict[Hashable, int]],
+        done: bool = False,
+        cycle: Optional[EvolutionCycle] = None,
+    ) -> None:
+        checkpoint = SessionCheckpoint(
+            initial_value=self.initial_state.value,
             target=self.target,
-            fn=self.transform,
+            value=value,
+            steps=steps,
+            done=done,
+            limits=limits,
+            detect_cycles=self.detect_cycles,
+            accumulator=accumulator.to_dict(),
+            cycle=cycle,
+            seen=None if seen is None else dict(seen),
         )
-        self.stability = analyze_trace(self.trace, self.target)
-        self.completed = True
+        self.last_checkpoint = checkpoint
+        if self.checkpoint_path is not None:
+            checkpoint.save(self.checkpoint_path)
+
+    def _run_checkpointed(
+        self,
+        profiler: Optional[Profiler],
+        checkpoint: Optional[SessionCheckpoint] = None,
+        limits: Optional[AbsoluteLimits] = None,
+    ) -> StabilityReport:
+        # Stream the evolution through an accumulator, checkpointing as we go.
+        limits = self.limits if limits is None else limits
+        if self.initial_state.is_vector:
+            raise ValueError("Vector sessions cannot be checkpointed.")
+        if checkpoint is None:
+            state = self.initial_state
+            steps = 0
+            accumulator = StabilityAccumulator()
+            seen = {state.value: 0} if self.detect_cycles else None
+            trace = EvolutionTrace(state.value if self.keep_trace else None)
+        else:
+            state = QuantumState(checkpoint.value, limits)
+            steps = checkpoint.steps
+            accumulator = checkpoint.restore_accumulator()
+            seen = None if checkpoint.seen is None else dict(checkpoint.seen)
+            if checkpoint.done:
+                # Nothing left to evolve, whatever the ceiling.
+                self.last_checkpoint = checkpoint
+                return accumulator.report(
+                    self.target, cycle=checkpoint.cycle, limits=limits
+                )
+            trace = self.trace
+            if not self.keep_trace:
+                trace = EvolutionTrace()
+            elif len(trace) != steps or not trace or trace.values[-1] != state.value:
+                trace = EvolutionTrace(state.value)
+
+        transitions = iter_transitions(
+            state,
+            self.target,
+            self._transform(),
+            start=steps,
+            detect_cycles=self.detect_cycles,
+            profiler=profiler,
+            seen=seen,
+            limits=limits,
+        )
+        every = self.checkpoint_every
+        try:
+            while True:
+                try:
+                    prev_state, next_state, delta = next(transitions)
+                except StopIteration as stop:
+                    cycle = stop.value
+                    break
+                # The generator has finished checking the previous step, so
+                # the state before this one is a consistent resume point.
+                if every and steps and steps % every == 0:
+                    self._checkpoint(state.value, steps, accumulator, limits, seen)
+                accumulator.update(prev_state.value, next_state.value)
+                if self.keep_trace:
+                    trace.append(next_state.value, delta)
+                state = next_state
+                steps += 1
+        except BaseException:
+            # Including KeyboardInterrupt, so an interrupted run can resume.
+            self._checkpoint(state.value, steps, accumulator, limits, seen)
+            self.trace = trace
+            raise
+        self._checkpoint(state.value, steps, accumulator, limits, seen, True, cycle)
+        if self.keep_trace:
+            trace.cycle = cycle
+        self.trace = trace
+        return accumulator.report(self.target, cycle=cycle, limits=limits)
+
+    @classmethod
+    def run_batch(
+        cls,
+        sessions: Sequence["SimulationSession"],
+        workers: Optional[int] = None,
+        chunksize: Optional[int] = None,
+        schedule: Optional[Any] = None,
+    ) -> List["SimulationSession"]:
+        """
+        Run many sessions in parallel across a process pool.
+
+        See runner.run_sessions (and scheduler.schedule_sessions for
+        schedule); transforms must be picklable.
+        """
+        from .runner import run_sessions
+
+        return run_sessions(
+            sessions, workers=workers, chunksize=chunksize, schedule=schedule
+        )
+
+    def _run_kernel(self) -> StabilityReport:
+        # Uninstrumented scalar streaming: the raw-float loop feeds the
+        # accumulator directly, without building states.
+        accumulator = StabilityAccumulator()
+        _, _, cycle = evolve_until_kernel(
+            self.initial_state.value,
+            self.target,
+            self._transform(),
+            detect_cycles=self.detect_cycles,
+            limits=self.limits,
+            on_step=accumulator.update,
+        )
+        return accumulator.report(self.target, cycle=cycle, limits=self.limits)
+
+    def _run_closed_form(self, profiler: Optional[Profiler]) -> StabilityReport:
+        # Skip to the first event via the closed form, then stream the rest.
+        fn = self._transform()
+        accumulator = StabilityAccumulator()
+        state = self.initial_state
+        steps = 0
+        if not state.is_converged_to(self.target, limits=self.limits):
+            prefix = closed_form_prefix(state.value, self.target, fn, self.limits)
+            if prefix is not None:
+                prev_value, value, steps = prefix
+                accumulator.update_run(state.value, prev_value, value, steps)
+                state = QuantumState(value, self.limits)
+
+        transitions = iter_transitions(
+            state,
+            self.target,
+            fn,
+            start=steps,
+            skip_stuck=not self.detect_cycles,
+            detect_cycles=self.detect_cycles,
+            profiler=profiler,
+            limits=self.limits,
+        )
+        while True:
+            try:
+                prev_state, next_state, _ = next(transitions)
+            except StopIteration as stop:
+                return accumulator.report(
+                    self.target, cycle=stop.value, limits=self.limits
+                )
+            accumulator.update(prev_state.value, next_state.value)
 
     def final_state(self) -> QuantumState:
         """
@@ -76,12 +483,15 @@ class SimulationSession:
         Raises:
             RuntimeError if the session has not been run yet.
         """
-        if not self.completed or not self.trace:
-            # If no steps were taken, the final state is the initial state.
-            if self.completed and not self.trace:
-                return self.initial_state
+        if not self.completed or self.stability is None:
             raise RuntimeError("SimulationSession has not been run yet.")
-        return self.trace[-1].next_state
+        if self.trace:
+            return self.trace[-1].next_state
+        # Without a trace (no steps taken, or keep_trace=False), the report
+        # carries the final value.
+        if self.stability.steps:
+            return QuantumState(self.stability.final_value, self.limits)
+        return self.initial_state
 
     def report(self) -> str:
         """
@@ -102,6 +512,8 @@ class SimulationSession:
             f"  - final_delta: {self.stability.final_delta}",
             f"  - monotonic_increasing: {self.stability.monotonic_increasing}",
             f"  - monotonic_decreasing: {self.stability.monotonic_decreasing}",
+            f"  - cycle_start: {self.stability.cycle_start}",
+            f"  - cycle_length: {self.stability.cycle_length}",
         ]
         return "\n".join(lines)
 
@@ -5,10 +5,15 @@ QSOL stability and convergence analysis.
 
 Provides tools to analyze evolution traces for:
 
-- convergence status
+- convergence status (and the convergence policy that decided it)
 - final delta
 - monotonicity
 - step counts
+- cycles (when the evolution ran with cycle detection)
+
+Traces can be analyzed whole (analyze_trace) or streamed step by step in
+constant memory (StabilityAccumulator, analyze_stream); both produce the same
+StabilityReport.
 
 These functions are pure, deterministic, and side-effect free.
 """
@@ -16,17 +21,29 @@ These functions are pure, deterministic, and side-effect free.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List
+from typing import Any, Dict, Iterable, Optional, Sequence
 
-from .absolute_limits import ABSOLUTE_LIMITS
-from .evolution import EvolutionStep
+from ._numpy import require_numpy
+from .absolute_limits import AbsoluteLimits, current_limits
+from .compressed_trace import CompressedTrace
+from .convergence import EXACT_CONVERGENCE, ConvergencePolicy
 from .quantum_state import QuantumState
+from .trace import EvolutionCycle, EvolutionStep, EvolutionTrace
 
 
 @dataclass(frozen=True)
 class StabilityReport:
     """
     Summary of stability properties for an evolution process.
+
+    cycle_start and cycle_length are set when the evolution stopped because
+    the trajectory revisited a value (see EvolutionCycle); they are None for
+    processes that converged, stalled or ran without cycle detection.
+
+    converged_by names the rule under which the final value converged:
+    "exact" whenever the canonical rule holds, otherwise the tolerant
+    convergence policy that accepted it (e.g. "ulp(4)"); None if the process
+    did not converge.
     """
 
     converged: bool
@@ -36,6 +53,16 @@ class StabilityReport:
     final_delta: float
     monotonic_increasing: bool
     monotonic_decreasing: bool
+    cycle_start: Optional[int] = None
+    cycle_length: Optional[int] = None
+    converged_by: Optional[str] = None
+
+    @property
+    def cycled(self) -> bool:
+        """
+        Whether the process ended in a detected cycle.
+        """
+        return self.cycle_length is not None
 
     def describe(self) -> str:
         """
@@ -50,74 +77,344 @@ class StabilityReport:
             f"  - final_delta: {self.final_delta}",
             f"  - monotonic_increasing: {self.monotonic_increasing}",
             f"  - monotonic_decreasing: {self.monotonic_decreasing}",
+            f"  - cycle_start: {self.cycle_start}",
+            f"  - cycle_length: {self.cycle_length}",
+            f"  - converged_by: {self.converged_by}",
         ]
         return "\n".join(lines)
 
 
-def _compute_monotonicity(values: List[float]) -> tuple[bool, bool]:
+def _cycle_fields(cycle: Optional[EvolutionCycle]) -> Dict[str, Any]:
+    if cycle is None:
+        return {}
+    return {"cycle_start": cycle.start, "cycle_length": cycle.length}
+
+
+def _converged_by(
+    final_value: float,
+    target: float,
+    convergence: Optional[ConvergencePolicy],
+    limits: Optional[AbsoluteLimits] = None,
+) -> Optional[str]:
+    limits = current_limits() if limits is None else limits
+    final_state = QuantumState(final_value, limits)
+    if final_state.is_converged_to(target, limits=limits):
+        return EXACT_CONVERGENCE.describe()
+    policy = limits.convergence if convergence is None else convergence
+    if not policy.exact and final_state.is_converged_to(target, policy, limits):
+        return policy.describe()
+    return None
+
+
+def _compute_monotonicity(values: Sequence[float]) -> tuple[bool, bool]:
     """
     Determine whether a sequence is monotonic increasing or decreasing (non-strict).
+
+    A sequence of vector values is monotonic when every component is.
     """
     if len(values) < 2:
         return True, True
+    if getattr(values[0], "ndim", 0) > 0:
+        numpy = require_numpy()
+        matrix = numpy.asarray(values)
+        before, after = matrix[:-1], matrix[1:]
+        return bool((before <= after).all()), bool((before >= after).all())
 
-    inc = all(values[i] <= values[i + 1] for i in range(len(values) - 1))
-    dec = all(values[i] >= values[i + 1] for i in range(len(values) - 1))
+    # Single pass with early exit once neither property can hold.
+    inc = dec = True
+    prev = values[0]
+    for i in range(1, len(values)):
+        value = values[i]
+        if inc and not prev <= value:
+            inc = False
+        if dec and not prev >= value:
+            dec = False
+        if not (inc or dec):
+            break
+        prev = value
     return inc, dec
 
 
-def analyze_trace(trace: List[EvolutionStep], target: float) -> StabilityReport:
+def _le(a: Any, b: Any) -> bool:
+    # a <= b, componentwise for vector values (as in _compute_monotonicity).
+    result = a <= b
+    return result if type(result) is bool else bool(result.all())
+
+
+def _empty_report(
+    target: float,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> StabilityReport:
+    # No steps executed; treat as a degenerate process.
+    # We still respect the domain and convergence definition.
+    limits = current_limits() if limits is None else limits
+    dummy_state = QuantumState(limits.clamp_value(target), limits)
+    converged_by = _converged_by(dummy_state.value, target, convergence, limits)
+    return StabilityReport(
+        converged=converged_by is not None,
+        steps=0,
+        initial_value=dummy_state.value,
+        final_value=dummy_state.value,
+        final_delta=0.0,
+        monotonic_increasing=True,
+        monotonic_decreasing=True,
+        converged_by=converged_by,
+    )
+
+
+def analyze_trace(
+    trace: Sequence[EvolutionStep],
+    target: float,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> StabilityReport:
     """
     Analyze an evolution trace and compute stability properties.
 
+    An EvolutionTrace is analyzed directly on its value column, and a
+    CompressedTrace directly on its runs, without building EvolutionStep
+    views.
+
     Args:
-        trace: List of EvolutionStep objects in chronological order.
+        trace: EvolutionTrace, CompressedTrace, or any sequence of
+               EvolutionStep objects in chronological order.
         target: Scalar target value for convergence evaluation.
+        convergence: Convergence policy overriding AbsoluteLimits.convergence
+                     (use the policy the evolution ran under).
+        limits: Contract the evolution ran under (defaults to the limits of a
+                CompressedTrace, else current_limits()).
 
     Returns:
         StabilityReport with convergence and monotonicity information.
     """
     if not trace:
-        # No steps executed; treat as a degenerate process.
-        # We still respect the domain and convergence definition.
-        dummy_state = QuantumState(ABSOLUTE_LIMITS.clamp_value(target))
-        converged = dummy_state.is_converged_to(target)
-        return StabilityReport(
-            converged=converged,
-            steps=0,
-            initial_value=dummy_state.value,
-            final_value=dummy_state.value,
-            final_delta=0.0,
-            monotonic_increasing=True,
-            monotonic_decreasing=True,
-        )
+        return _empty_report(target, convergence, limits)
+    if isinstance(trace, CompressedTrace):
+        limits = trace.limits if limits is None else limits
+        return _analyze_runs(trace, target, convergence, limits)
+
+    values: Sequence[float]
+    cycle: Optional[EvolutionCycle] = None
+    if isinstance(trace, EvolutionTrace):
+        values = trace.values
+        cycle = trace.cycle
+    else:
+        values = [step.prev_state.value for step in trace] + [
+            trace[-1].next_state.value
+        ]
 
-    initial_value = trace[0].prev_state.value
-    final_value = trace[-1].next_state.value
+    initial_value = values[0]
+    final_value = values[-1]
     final_delta = final_value - initial_value
 
-    values = [step.prev_state.value for step in trace] + [final_value]
     monotonic_increasing, monotonic_decreasing = _compute_monotonicity(values)
 
-    final_state = trace[-1].next_state
-    converged = final_state.is_converged_to(target)
+    converged_by = _converged_by(final_value, target, convergence, limits)
 
     return StabilityReport(
-        converged=converged,
+        converged=converged_by is not None,
         steps=len(trace),
         initial_value=initial_value,
         final_value=final_value,
         final_delta=final_delta,
         monotonic_increasing=monotonic_increasing,
         monotonic_decreasing=monotonic_decreasing,
+        converged_by=converged_by,
+        **_cycle_fields(cycle),
     )
 
 
+class StabilityAccumulator:
+    """
+    Single-pass, constant-memory builder of a StabilityReport.
+
+    Feed the steps of an evolution in chronological order with push() (or
+    update() with raw values); report() then returns exactly what
+    analyze_trace would return for the same steps, without the steps ever
+    being held in memory.
+    """
+
+    __slots__ = (
+        "steps",
+        "initial_value",
+        "final_value",
+        "monotonic_increasing",
+        "monotonic_decreasing",
+        "_last_prev",
+    )
+
+    def __init__(self) -> None:
+        self.steps = 0
+        self.initial_value: Optional[float] = None
+        self.final_value: Optional[float] = None
+        self.monotonic_increasing = True
+        self.monotonic_decreasing = True
+        self._last_prev: Optional[float] = None
+
+    def update(self, prev_value: float, next_value: float) -> None:
+        """
+        Account for one step from prev_value to next_value.
+        """
+        last = self._last_prev
+        if last is None:
+            self.initial_value = prev_value
+        else:
+            if self.monotonic_increasing and not _le(last, prev_value):
+                self.monotonic_increasing = False
+            if self.monotonic_decreasing and not _le(prev_value, last):
+                self.monotonic_decreasing = False
+        self._last_prev = prev_value
+        self.final_value = next_value
+        self.steps += 1
+
+    def update_run(
+        self,
+        first_value: float,
+        last_prev_value: float,
+        next_value: float,
+        steps: int,
+    ) -> None:
+        """
+        Account for `steps` consecutive steps along a monotone path.
+
+        first_value is the value before the first step, last_prev_value the
+        value before the last step and next_value the value after it. This is
+        equivalent to calling update() for each step of the path.
+        """
+        if steps < 1:
+            return
+        self.update(first_value, next_value)
+        if steps > 1:
+            if self.monotonic_increasing and not _le(first_value, last_prev_value):
+                self.monotonic_increasing = False
+            if self.monotonic_decreasing and not _le(last_prev_value, first_value):
+                self.monotonic_decreasing = False
+            self._last_prev = last_prev_value
+            self.steps += steps - 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Return the accumulator's state, for checkpointing.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, state: Dict[str, Any]) -> "StabilityAccumulator":
+        """
+        Rebuild an accumulator from to_dict() output; it continues exactly
+        where the original left off.
+        """
+        accumulator = cls()
+        for name in cls.__slots__:
+            setattr(accumulator, name, state[name])
+        return accumulator
+
+    def push(self, step: EvolutionStep) -> None:
+        """
+        Account for one EvolutionStep.
+        """
+        self.update(step.prev_state.value, step.next_state.value)
+
+    def report(
+        self,
+        target: float,
+        cycle: Optional[EvolutionCycle] = None,
+        convergence: Optional[ConvergencePolicy] = None,
+        limits: Optional[AbsoluteLimits] = None,
+    ) -> StabilityReport:
+        """
+        Build the StabilityReport for the steps seen so far, recording the
+        cycle that ended the stream, if any, and judging convergence under
+        the given policy (the limits' convergence by default) and limits
+        (current_limits() by default).
+        """
+        if not self.steps:
+            return _empty_report(target, convergence, limits)
+
+        last = self._last_prev
+        initial_value = self.initial_value
+        final_value = self.final_value
+        monotonic_increasing = self.monotonic_increasing and _le(last, final_value)
+        monotonic_decreasing = self.monotonic_decreasing and _le(final_value, last)
+
+        converged_by = _converged_by(final_value, target, convergence, limits)
+        return StabilityReport(
+            converged=converged_by is not None,
+            steps=self.steps,
+            initial_value=initial_value,
+            final_value=final_value,
+            final_delta=final_value - initial_value,
+            monotonic_increasing=monotonic_increasing,
+            monotonic_decreasing=monotonic_decreasing,
+            converged_by=converged_by,
+            **_cycle_fields(cycle),
+        )
+
+
+def _analyze_runs(
+    trace: CompressedTrace,
+    target: float,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> StabilityReport:
+    # Within a run, the values after its first step are monotone, so each run
+    # is one ordinary step followed by a monotone path (see update_run).
+    accumulator = StabilityAccumulator()
+    for base, second, last_prev, end, steps in trace.iter_runs():
+        if steps == 1:
+            accumulator.update(base, end)
+        else:
+            accumulator.update(base, second)
+            accumulator.update_run(second, last_prev, end, steps - 1)
+    return accumulator.report(
+        target, cycle=trace.cycle, convergence=convergence, limits=limits
+    )
+
+
+def analyze_stream(
+    steps: Iterable[EvolutionStep],
+    target: float,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
+) -> StabilityReport:
+    """
+    Analyze a stream of evolution steps in a single pass and constant memory.
+
+    Typically fed by evolution.iter_evolve_trace, so that no trace is ever
+    materialized. If the iterator returns an EvolutionCycle (as
+    iter_evolve_trace does with detect_cycles=True), it is recorded in the
+    report.
+
+    Args:
+        steps: Iterable of EvolutionStep objects in chronological order.
+        target: Scalar target value for convergence evaluation.
+        convergence: Convergence policy overriding AbsoluteLimits.convergence.
+        limits: Contract the evolution ran under (defaults to
+                current_limits()).
+
+    Returns:
+        StabilityReport identical to analyze_trace of the equivalent trace.
+    """
+    accumulator = StabilityAccumulator()
+    iterator = iter(steps)
+    while True:
+        try:
+            step = next(iterator)
+        except StopIteration as stop:
+            return accumulator.report(
+                target, cycle=stop.value, convergence=convergence, limits=limits
+            )
+        accumulator.push(step)
+
+
 def analyze_direct(
     initial: QuantumState,
     final: QuantumState,
     steps: int,
     target: float,
+    convergence: Optional[ConvergencePolicy] = None,
+    limits: Optional[AbsoluteLimits] = None,
 ) -> StabilityReport:
     """
     Analyze stability when you only have initial/final states and step count.
@@ -127,27 +424,32 @@ def analyze_direct(
         final: Final QuantumState.
         steps: Number of steps taken.
         target: Scalar target value.
+        convergence: Convergence policy overriding AbsoluteLimits.convergence.
+        limits: Contract the evolution ran under (defaults to
+                current_limits()).
 
     Returns:
         StabilityReport with basic convergence information.
     """
-    ABSOLUTE_LIMITS.validate_iteration_count(steps)
+    limits = current_limits() if limits is None else limits
+    limits.validate_iteration_count(steps)
 
     initial_value = initial.value
     final_value = final.value
     final_delta = final_value - initial_value
 
-    converged = final.is_converged_to(target)
+    converged_by = _converged_by(final_value, target, convergence, limits)
 
     # Without a full trace, we cannot guarantee monotonicity;
     # we mark both as False to avoid over-claiming.
     return StabilityReport(
-        converged=converged,
+        converged=converged_by is not None,
         steps=steps,
         initial_value=initial_value,
         final_value=final_value,
         final_delta=final_delta,
         monotonic_increasing=False,
         monotonic_decreasing=False,
+        converged_by=converged_by,
     )
 
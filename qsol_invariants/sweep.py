@@ -0,0 +1,236 @@
+"""
+sweep.py
+
+QSOL parameter sweeps.
+
+Maps the behavior of a transform over initial_value x target grids:
+
+- sweep          : evaluate every point of a dense grid
+- sweep_adaptive : refine a coarse grid only around status boundaries
+- SweepStatus    : outcome of the evolution at a grid point
+- SweepResult    : dense status, step-count and final-value maps
+
+Grid points are evolved together by the batch engine (evolve_until_batch),
+so outcomes are exactly those evolve_until would produce point by point,
+with cycle detection on by default. NumPy is required.
+"""
+
+from __future__ import annotations
+
+import enum
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Tuple
+
+from ._numpy import require_numpy
+from .absolute_limits import AbsoluteLimits
+from .batch import BatchResult, BatchTransformFn, evolve_until_batch
+
+
+class SweepStatus(enum.IntEnum):
+    """
+    Outcome of the evolution from one grid point.
+    """
+
+    CONVERGED = 0
+    STALLED = 1
+    CYCLED = 2
+    CEILING = 3
+    PHI_VIOLATION = 4
+
+
+@dataclass(frozen=True)
+class SweepResult:
+    """
+    Dense maps over an initial_value x target grid.
+
+    Map arrays have shape (len(initial_values), len(targets)); entry [i, j]
+    describes the evolution from initial_values[i] toward targets[j].
+
+    - status:       SweepStatus codes (int8)
+    - steps:        steps taken (-1 where not evaluated)
+    - final_values: final values (NaN where not evaluated)
+    - evaluated:    points that were actually evolved; the status of other
+                    points (adaptive sweeps only) is inferred from the
+                    uniform cell around them
+    """
+
+    initial_values: Any
+    targets: Any
+    status: Any
+    steps: Any
+    final_values: Any
+    evaluated: Any
+
+    def fraction(self, status: SweepStatus) -> float:
+        """
+        Share of grid points with the given status.
+        """
+        return float((self.status == status).mean())
+
+
+def _status(np, result: BatchResult) -> Any:
+    status = np.full(result.values.shape, SweepStatus.STALLED, dtype=np.int8)
+    status[result.converged] = SweepStatus.CONVERGED
+    if result.cycled is not None:
+        status[result.cycled] = SweepStatus.CYCLED
+    status[result.ceiling_violation] = SweepStatus.CEILING
+    status[result.phi_violation] = SweepStatus.PHI_VIOLATION
+    return status
+
+
+def _evaluate(
+    np,
+    initial_values,
+    targets,
+    fn: BatchTransformFn,
+    limits: Optional[AbsoluteLimits],
+    detect_cycles: bool,
+) -> Tuple[Any, Any, Any]:
+    result = evolve_until_batch(
+        initial_values, targets, fn, limits=limits, detect_cycles=detect_cycles
+    )
+    return _status(np, result), result.steps, result.values
+
+
+def sweep(
+    fn: BatchTransformFn,
+    initial_values: Sequence[float],
+    targets: Sequence[float],
+    detect_cycles: bool = True,
+    limits: Optional[AbsoluteLimits] = None,
+) -> SweepResult:
+    """
+    Evolve from every (initial_value, target) pair of a dense grid.
+
+    Args:
+        fn: Vectorizable deterministic transform (see evolve_until_batch).
+        initial_values: Grid of initial values (first map axis).
+        targets: Grid of targets (second map axis).
+        detect_cycles: Classify revisiting trajectories as CYCLED instead of
+                       iterating them to the ceiling.
+        limits: Invariant contract to enforce (defaults to current_limits()).
+
+    Returns:
+        SweepResult with every point evaluated.
+    """
+    np = require_numpy()
+    initial_values = np.asarray(initial_values, dtype=np.float64)
+    targets = np.asarray(targets, dtype=np.float64)
+    grid_initial, grid_targets = np.meshgrid(initial_values, targets, indexing="ij")
+    status, steps, final_values = _evaluate(
+        np, grid_initial, grid_targets, fn, limits, detect_cycles
+    )
+    return SweepResult(
+        initial_values=initial_values,
+        targets=targets,
+        status=status,
+        steps=steps,
+        final_values=final_values,
+        evaluated=np.ones(status.shape, dtype=bool),
+    )
+
+
+def sweep_adaptive(
+    fn: BatchTransformFn,
+    initial_range: Tuple[float, float] = (0.0, 1.0),
+    target_range: Tuple[float, float] = (0.0, 1.0),
+    cells: int = 16,
+    levels: int = 4,
+    detect_cycles: bool = True,
+    limits: Optional[AbsoluteLimits] = None,
+) -> SweepResult:
+    """
+    Map a grid of cells * 2**levels + 1 points per axis, evaluating only
+    around status boundaries.
+
+    A coarse grid of cells x cells is evaluated first. At each level, every
+    cell whose four corners do not share one status is split in four and its
+    new points are evaluated; cells with uniform corners are not refined, and
+    the points inside them take the corners' status. Features smaller than a
+    coarse cell that do not touch a corner can therefore be missed.
+
+    Args:
+        fn: Vectorizable deterministic transform (see evolve_until_batch).
+        initial_range: (low, high) range of initial values (first map axis).
+        target_range: (low, high) range of targets (second map axis).
+        cells: Coarse cells per axis.
+        levels: Number of refinement levels.
+        detect_cycles: Classify revisiting trajectories as CYCLED.
+        limits: Invariant contract to enforce (defaults to current_limits()).
+
+    Returns:
+        SweepResult at full resolution; see SweepResult.evaluated.
+    """
+    if cells < 1 or levels < 0:
+        raise ValueError(
+            f"sweep_adaptive needs cells >= 1 and levels >= 0, "
+            f"got cells={cells}, levels={levels}."
+        )
+    np = require_numpy()
+    stride = 2**levels
+    size = cells * stride + 1
+    initial_values = np.linspace(*initial_range, size)
+    targets = np.linspace(*target_range, size)
+
+    status = np.full((size, size), -1, dtype=np.int8)
+    steps = np.full((size, size), -1, dtype=np.int64)
+    final_values = np.full((size, size), np.nan)
+    evaluated = np.zeros((size, size), dtype=bool)
+
+    def evaluate(todo) -> None:
+        rows, cols = np.nonzero(todo & ~evaluated)
+        if not rows.size:
+            return
+        point_status, point_steps, point_values = _evaluate(
+            np, initial_values[rows], targets[cols], fn, limits, detect_cycles
+        )
+        status[rows, cols] = point_status
+        steps[rows, cols] = point_steps
+        final_values[rows, cols] = point_values
+        evaluated[rows, cols] = True
+
+    coarse = np.zeros((size, size), dtype=bool)
+    coarse[::stride, ::stride] = True
+    evaluate(coarse)
+
+    active = np.ones((cells, cells), dtype=bool)
+    while True:
+        corners = status[::stride, ::stride]
+        corner = corners[:-1, :-1]
+        uniform = (
+            (corner == corners[1:, :-1])
+            & (corner == corners[:-1, 1:])
+            & (corner == corners[1:, 1:])
+        )
+        # Uniform cells take their corner status over the half-open square
+        # [i, i + stride) x [j, j + stride); the last row and column follow
+        # the cells before them.
+        fill = np.repeat(np.repeat(active & uniform, stride, 0), stride, 1)
+        fill = np.pad(fill, ((0, 1), (0, 1)), mode="edge") & ~evaluated
+        value = np.repeat(np.repeat(corner, stride, 0), stride, 1)
+        value = np.pad(value, ((0, 1), (0, 1)), mode="edge")
+        status[fill] = value[fill]
+
+        mixed = active & ~uniform
+        if stride == 1 or not mixed.any():
+            break
+
+        half = stride // 2
+        todo = np.zeros((size, size), dtype=bool)
+        rows, cols = np.nonzero(mixed)
+        for row_offset in (0, half, stride):
+            for col_offset in (0, half, stride):
+                todo[rows * stride + row_offset, cols * stride + col_offset] = True
+        evaluate(todo)
+
+        stride = half
+        active = np.repeat(np.repeat(mixed, 2, 0), 2, 1)
+
+    return SweepResult(
+        initial_values=initial_values,
+        targets=targets,
+        status=status,
+        steps=steps,
+        final_values=final_values,
+        evaluated=evaluated,
+    )
@@ -0,0 +1,61 @@
+import asyncio
+
+from qsol_invariants import (
+    QuantumState,
+    SimulationSession,
+    evolve_trace,
+    evolve_trace_async,
+    evolve_until,
+    evolve_until_async,
+    run_sessions_async,
+)
+
+
+def increment(x):
+    return x + 0.05
+
+
+async def async_increment(x):
+    await asyncio.sleep(0)
+    return x + 0.05
+
+
+def test_async_operators_match_sync():
+    s = QuantumState(0.0)
+
+    final, steps = asyncio.run(evolve_until_async(s, 0.2, async_increment))
+    assert (final, steps) == evolve_until(s, 0.2, increment)
+
+    trace = asyncio.run(evolve_trace_async(s, 0.2, async_increment))
+    assert trace == evolve_trace(s, 0.2, increment)
+
+
+def test_run_sessions_async_bounded():
+    in_flight = peak = 0
+
+    async def tracked_increment(x):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return x + 0.05
+
+    sessions = [
+        SimulationSession(
+            initial_value=i / 100,
+            target=1.0,
+            transform=tracked_increment,
+            keep_trace=bool(i % 2),
+        )
+        for i in range(20)
+    ]
+    asyncio.run(run_sessions_async(sessions, concurrency=4))
+
+    assert peak == 4
+
+    for i, session in enumerate(sessions):
+        reference = SimulationSession(i / 100, 1.0, increment)
+        reference.run()
+        assert session.completed
+        assert session.stability == reference.stability
@@ -0,0 +1,84 @@
+import pytest
+
+from qsol_invariants import QuantumState, evolve_until, evolve_until_batch
+
+np = pytest.importorskip("numpy")
+
+
+def increment(x):
+    return x + 0.05
+
+
+def halfway(x):
+    return x + (0.3 - x) / 2
+
+
+def scalar_outcome(initial, target, fn):
+    try:
+        final, steps = evolve_until(QuantumState(initial), target=target, fn=fn)
+    except ValueError:
+        return None
+    return final.value, steps
+
+
+def test_batch_matches_scalar_path():
+    initial = np.linspace(0.0, 0.6, 13)
+    targets = np.full_like(initial, 0.3)
+
+    result = evolve_until_batch(initial, targets, halfway)
+
+    for i, value in enumerate(initial):
+        expected = scalar_outcome(float(value), 0.3, halfway)
+        if expected is None:
+            assert result.violation[i]
+            continue
+        assert not result.violation[i]
+        assert result.values[i] == expected[0]
+        assert result.steps[i] == expected[1]
+        assert result.converged[i] == (expected[0] == 0.3)
+
+
+def test_batch_flags_violations():
+    result = evolve_until_batch(
+        [0.0, 0.5, 0.5],
+        [0.2, 0.2, 0.5],
+        lambda x: np.where(x > 0.4, x + 0.5, x + 0.05),
+    )
+
+    assert result.converged.tolist() == [True, False, True]
+    assert result.steps.tolist() == [4, 0, 0]
+    assert result.phi_violation.tolist() == [False, True, False]
+    assert result.values[1] == 0.5
+
+
+def test_batch_flags_ceiling():
+    result = evolve_until_batch([0.9], [0.2], increment)
+
+    assert scalar_outcome(0.9, 0.2, increment) is None
+    assert result.ceiling_violation.tolist() == [True]
+    assert result.values[0] == 1.0
+
+
+def test_batch_cycle_detection_matches_scalar_path():
+    from qsol_invariants import evolve_trace
+
+    def stepper(x):
+        return np.where(x < 0.5, x + 0.0625, x - 0.09375)
+
+    initial = np.arange(17) / 16
+    result = evolve_until_batch(initial, 0.9, stepper, detect_cycles=True)
+
+    for i, value in enumerate(initial):
+        trace = evolve_trace(
+            QuantumState(float(value)),
+            0.9,
+            lambda x: float(stepper(np.float64(x))),
+            detect_cycles=True,
+        )
+        assert result.cycled[i]
+        assert result.steps[i] == len(trace)
+        assert result.values[i] == trace.values[-1]
+        assert (result.cycle_start[i], result.cycle_length[i]) == (
+            trace.cycle.start,
+            trace.cycle.length,
+        )
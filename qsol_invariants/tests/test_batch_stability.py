@@ -0,0 +1,93 @@
+import math
+
+import numpy as np
+import pytest
+
+from qsol_invariants import (
+    QuantumState,
+    UlpConvergence,
+    analyze_batch,
+    analyze_columns,
+    analyze_trace,
+    compress_trace,
+    evolve_trace,
+)
+from qsol_invariants.trace import EvolutionTrace
+
+
+def damped(x):
+    return 0.3 - (x - 0.3) * 0.5
+
+
+def oscillate(x):
+    return x + 0.05 if x < 0.6 else x - 0.03
+
+
+def test_matches_analyze_trace():
+    traces = [
+        evolve_trace(QuantumState(0.25), 0.5, lambda x: x + 2.0**-4),
+        evolve_trace(QuantumState(0.0), 2.0, oscillate, detect_cycles=True),
+        compress_trace(
+            evolve_trace(
+                QuantumState(0.5), 2.0, lambda x: x + 2.0**-10, detect_cycles=True
+            )
+        ),
+        evolve_trace(QuantumState(0.35), 0.3, damped, convergence=UlpConvergence(1)),
+        EvolutionTrace(0.4),
+    ]
+    targets = [0.5, 2.0, 2.0, 0.3, 0.7]
+    policy = UlpConvergence(1)
+    report = analyze_batch(traces, targets, convergence=policy)
+
+    assert len(report) == len(traces)
+    for i, (trace, target) in enumerate(zip(traces, targets)):
+        expected = analyze_trace(trace, target, policy)
+        assert bool(report.converged[i]) == expected.converged
+        assert bool(report.converged_exact[i]) == (expected.converged_by == "exact")
+        assert report.steps[i] == expected.steps
+        assert report.initial_value[i] == expected.initial_value
+        assert report.final_value[i] == expected.final_value
+        assert report.final_delta[i] == expected.final_delta
+        assert bool(report.monotonic_increasing[i]) == expected.monotonic_increasing
+        assert bool(report.monotonic_decreasing[i]) == expected.monotonic_decreasing
+    assert report.cycle_length[1] == traces[1].cycle.length
+    assert report.cycle_length[0] == -1
+
+
+def test_extended_metrics():
+    damped_trace = evolve_trace(
+        QuantumState(0.35), 0.3, damped, convergence=UlpConvergence(1)
+    )
+    clamped = evolve_trace(
+        QuantumState(0.875), 2.0, lambda x: x + 0.0625, detect_cycles=True
+    )
+    report = analyze_batch([damped_trace, clamped], [0.3, 2.0])
+
+    # The damped transform halves the error and flips its sign every step.
+    assert report.sign_changes[0] == len(damped_trace) - 1
+    assert report.max_abs_delta[0] == pytest.approx(0.075)
+    assert report.rate[0] == pytest.approx(0.5, rel=0.02)
+    assert report.steps_at_bounds[0] == 0
+
+    # 0.875 -> 0.9375 -> 1.0 -> 1.0, where the revisit ends the evolution.
+    assert report.sign_changes[1] == 0
+    assert report.max_abs_delta[1] == 0.0625
+    assert report.steps_at_bounds[1] == len(clamped) - 1
+    assert math.isfinite(report.rate[1])
+
+
+def test_columns_records_and_offsets():
+    values = np.array([0.0, 0.25, 0.5, 0.7, 0.9, 0.6, 0.2])
+    deltas = np.array([0.25, 0.25, -0.3, -0.4])
+    report = analyze_columns(values, deltas, [0, 2, 2, 4], [0.5, 0.5, 0.2])
+
+    assert report.converged.tolist() == [True, True, True]
+    assert report.steps.tolist() == [2, 0, 2]
+    # Like analyze_trace, a trace without steps reports the clamped target.
+    assert report.final_value[1] == 0.5
+    records = report.to_records()
+    assert records.dtype.names == tuple(report.columns())
+    assert records["final_value"].tolist() == [0.5, 0.5, 0.2]
+
+    with pytest.raises(ValueError):
+        analyze_columns(values, deltas, [0, 2, 4], 0.5)
@@ -0,0 +1,70 @@
+import asyncio
+
+import pytest
+
+from qsol_invariants import SimulationSession, StepToward, TransformCache
+
+
+def increment(x):
+    return x + 0.05
+
+
+async def async_increment(x):
+    return x + 0.05
+
+
+def test_shared_cache_hits_across_sessions():
+    cache = TransformCache()
+    first = SimulationSession(0.0, 1.0, increment, cache=cache)
+    second = SimulationSession(0.0, 1.0, increment, cache=cache, keep_trace=False)
+    reference = SimulationSession(0.0, 1.0, increment)
+    for session in (first, second, reference):
+        session.run()
+
+    stats = cache.stats()
+    assert first.trace == reference.trace
+    assert second.stability == reference.stability
+    assert stats.misses == reference.stability.steps
+    assert stats.hits == reference.stability.steps
+    assert stats.hit_rate == 0.5
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TransformCache(maxsize=2)
+    fn = cache.wrap(increment)
+    fn(0.1)
+    fn(0.2)
+    fn(0.1)
+    fn(0.3)
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.evictions, stats.size) == (1, 3, 1, 2)
+    fn(0.1)
+    assert cache.stats().hits == 2
+
+
+def test_cache_with_async_transform():
+    cache = TransformCache()
+    session = SimulationSession(0.0, 1.0, async_increment, cache=cache)
+    asyncio.run(session.run_async())
+    asyncio.run(session.run_async())
+
+    assert cache.stats().hits == session.stability.steps
+
+
+def test_cache_with_vector_states():
+    np = pytest.importorskip("numpy")
+    cache = TransformCache()
+    fn = StepToward(0.5, 0.05)
+    cached = SimulationSession([0.1, 0.2], 0.5, fn, cache=cache)
+    reference = SimulationSession([0.1, 0.2], 0.5, fn)
+    for session in (cached, reference):
+        session.run()
+
+    assert cached.trace == reference.trace
+    assert cache.stats().misses == reference.stability.steps
+    wrapped = cache.wrap(fn)
+    wrapped(np.array([0.0, 0.1]))
+    wrapped(np.array([-0.0, 0.1]))
+    wrapped(np.array([[0.0, 0.1]]))
+    assert cache.stats().hits == 0
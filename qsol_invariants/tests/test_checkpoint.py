@@ -0,0 +1,119 @@
+import pytest
+
+from qsol_invariants import (
+    AbsoluteLimits,
+    EpsilonConvergence,
+    SessionCheckpoint,
+    SimulationSession,
+    limits_context,
+)
+
+STEP = 2.0**-14
+
+
+def fine_increment(x):
+    return x + STEP
+
+
+def test_resume_extends_past_the_ceiling(tmp_path):
+    target = 12_000 * STEP
+    session = SimulationSession(
+        initial_value=0.0,
+        target=target,
+        transform=fine_increment,
+        checkpoint_every=1_000,
+        checkpoint_path=tmp_path / "session.json",
+    )
+    with pytest.raises(ValueError, match="max_iterations"):
+        session.run()
+    assert session.last_checkpoint.steps == 10_001
+
+    session.resume(max_iterations=20_000)
+
+    assert session.completed
+    assert session.stability.converged
+    assert session.stability.steps == len(session.trace) == 12_000
+    assert session.final_state().value == target
+
+
+def test_resume_from_file_after_interruption(tmp_path):
+    path = tmp_path / "session.json"
+    calls = []
+
+    def interrupted(x):
+        calls.append(x)
+        if len(calls) == 2_500:
+            raise KeyboardInterrupt
+        return x + STEP
+
+    session = SimulationSession(
+        initial_value=0.0,
+        target=3_000 * STEP,
+        transform=interrupted,
+        keep_trace=False,
+        checkpoint_path=path,
+    )
+    with pytest.raises(KeyboardInterrupt):
+        session.run()
+    assert SessionCheckpoint.load(path).steps == 2_499
+
+    restored = SimulationSession.from_checkpoint(path, fine_increment, keep_trace=False)
+    restored.resume()
+
+    reference = SimulationSession(
+        initial_value=0.0, target=3_000 * STEP, transform=fine_increment
+    )
+    reference.run()
+    assert restored.stability == reference.stability
+
+
+def test_checkpoint_json_round_trip_is_exact():
+    checkpoint = SessionCheckpoint(
+        initial_value=0.1,
+        target=0.7,
+        value=float("nan"),
+        steps=3,
+        done=False,
+        limits=AbsoluteLimits(
+            max_step_delta=0.1 + 2**-50, convergence=EpsilonConvergence(0.1 / 3)
+        ),
+        detect_cycles=True,
+        accumulator={"steps": 3, "initial_value": 0.1, "final_value": -0.0},
+        seen={0.1: 0, 0.30000000000000004: 1},
+    )
+    restored = SessionCheckpoint.from_json(checkpoint.to_json())
+
+    assert restored.limits == checkpoint.limits
+    assert restored.seen == checkpoint.seen
+    assert restored.accumulator == checkpoint.accumulator
+    assert str(restored.accumulator["final_value"]) == "-0.0"
+    assert restored.value != restored.value
+
+
+def test_resume_without_checkpoint_raises():
+    session = SimulationSession(0.0, 0.2, fine_increment)
+    with pytest.raises(RuntimeError):
+        session.resume()
+
+
+def test_resume_keeps_the_checkpointed_limits(tmp_path):
+    path = tmp_path / "session.json"
+    limits = AbsoluteLimits(max_iterations=500, convergence=EpsilonConvergence(0.001))
+    session = SimulationSession(
+        0.0, 1_000 * STEP, fine_increment, checkpoint_path=path, limits=limits
+    )
+    with pytest.raises(ValueError, match="max_iterations"):
+        session.run()
+
+    with limits_context(AbsoluteLimits(max_step_delta=STEP / 2)):
+        restored = SimulationSession.from_checkpoint(path, fine_increment)
+        restored.resume(max_iterations=2_000)
+    assert restored.limits == limits
+    assert restored.stability.converged_by == EpsilonConvergence(0.001).describe()
+    assert restored.stability.steps == 984
+
+    changed = SimulationSession.from_checkpoint(
+        path, fine_increment, limits=AbsoluteLimits(max_iterations=2_000)
+    )
+    with pytest.raises(ValueError, match="checkpoint's"):
+        changed.resume()
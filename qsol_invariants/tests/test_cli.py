@@ -0,0 +1,97 @@
+import dataclasses
+import json
+
+from qsol_invariants import Affine, SimulationSession, StepToward
+from qsol_invariants.cli import main
+
+HALFWAY = Affine(0.5, 0.375)
+INCREMENT = Affine(1.0, 0.0625)
+
+
+def write_specs(path, specs):
+    path.write_text("".join(json.dumps(spec) + "\n" for spec in specs))
+
+
+def read_records(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_cli_reports_match_sessions(tmp_path, monkeypatch):
+    # Named transforms are looked up in a module of the caller's.
+    (tmp_path / "lab_transforms.py").write_text(
+        "from qsol_invariants import Affine\n"
+        "halfway = Affine(0.5, 0.375)\n"
+        "increment = Affine(1.0, 0.0625)\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    specs = [
+        {"id": 1, "initial_value": 0.7, "target": 0.75, "transform": "halfway"},
+        {
+            "id": 2,
+            "initial_value": 0.0,
+            "target": 2.0,
+            "transform": "lab_transforms:increment",
+            "detect_cycles": True,
+        },
+        {"id": 3, "initial_value": 0.0, "target": 0.5},
+        {
+            "id": 4,
+            "initial_value": 0.1,
+            "target": 0.6,
+            "transform": StepToward(0.6, 0.05).to_spec(),
+        },
+    ]
+    write_specs(tmp_path / "specs.jsonl", specs)
+
+    status = main(
+        [
+            str(tmp_path / "specs.jsonl"),
+            "-o",
+            str(tmp_path / "out.jsonl"),
+            "--transforms",
+            "lab_transforms",
+            "--transform",
+            "increment",
+        ]
+    )
+    records = read_records(tmp_path / "out.jsonl")
+
+    assert status == 0
+    assert [record.pop("id") for record in records] == [1, 2, 3, 4]
+    transforms = [HALFWAY, INCREMENT, INCREMENT, StepToward(0.6, 0.05)]
+    for spec, record, fn in zip(specs, records, transforms):
+        session = SimulationSession(
+            spec["initial_value"],
+            spec["target"],
+            fn,
+            detect_cycles=spec.get("detect_cycles", False),
+        )
+        session.run()
+        assert record == dataclasses.asdict(session.stability)
+
+
+def test_cli_workers_limits_and_errors(tmp_path):
+    specs = [
+        {
+            "id": i,
+            "initial_value": i / 16,
+            "target": 0.75,
+            "transform": INCREMENT.to_spec(),
+        }
+        for i in range(12)
+    ]
+    specs[3]["limits"] = {"max_iterations": 2}
+    specs[5] = {"id": 5, "initial_value": 0.5}
+    write_specs(tmp_path / "specs.jsonl", specs)
+
+    common = [str(tmp_path / "specs.jsonl")]
+    assert main(common + ["-o", str(tmp_path / "serial.jsonl")]) == 1
+    parallel = ["-o", str(tmp_path / "parallel.jsonl"), "-w", "2", "--chunksize", "2"]
+    assert main(common + parallel) == 1
+
+    records = read_records(tmp_path / "serial.jsonl")
+    assert read_records(tmp_path / "parallel.jsonl") == records
+    assert [record["id"] for record in records] == list(range(12))
+    assert records[3]["error"].startswith("ValueError: Iteration count 3 exceeds")
+    assert "error" in records[5]
+    assert records[4]["converged"] and records[4]["steps"] == 8
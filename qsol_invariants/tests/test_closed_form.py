@@ -0,0 +1,79 @@
+import dataclasses
+
+from qsol_invariants import (
+    ABSOLUTE_LIMITS,
+    ClosedFormTransform,
+    EpsilonConvergence,
+    QuantumState,
+    SimulationSession,
+    StepToward,
+    evolve_until,
+)
+
+
+class DyadicIncrement:
+    """Constant increment on a dyadic grid, where x + n * step is exact."""
+
+    def __init__(self, step):
+        self.step = step
+        self.calls = 0
+
+    def __call__(self, x):
+        self.calls += 1
+        return x + self.step
+
+    def iterate(self, x, steps):
+        return x + steps * self.step
+
+
+def outcome(fn, initial, target):
+    try:
+        final, steps = evolve_until(QuantumState(initial), target=target, fn=fn)
+    except ValueError as exc:
+        return str(exc)
+    return final.value, steps
+
+
+def test_closed_form_matches_loop():
+    for initial, target, step in [
+        (0.0, 0.5, 2.0**-4),
+        (0.0, 0.3, 2.0**-4),
+        (0.75, 0.25, -(2.0**-6)),
+        (0.0, 0.9, 2.0**-12),
+        (0.5, 0.5, 2.0**-4),
+    ]:
+        fn = DyadicIncrement(step)
+        assert isinstance(fn, ClosedFormTransform)
+        expected = outcome(lambda x: x + step, initial, target)
+        assert outcome(fn, initial, target) == expected
+        assert fn.calls <= 2
+
+
+def test_session_skips_with_closed_form():
+    fn = DyadicIncrement(2.0**-10)
+    session = SimulationSession(
+        initial_value=0.0, target=0.75, transform=fn, keep_trace=False
+    )
+    session.run()
+
+    reference = SimulationSession(
+        initial_value=0.0, target=0.75, transform=lambda x: x + 2.0**-10
+    )
+    reference.run()
+
+    assert session.stability == reference.stability
+    assert session.stability.steps == 768
+    assert fn.calls <= 1
+
+
+def test_session_closed_form_respects_tolerant_policy():
+    limits = dataclasses.replace(
+        ABSOLUTE_LIMITS, convergence=EpsilonConvergence(absolute=0.05)
+    )
+    fn = StepToward(0.5, 2**-6)
+    _, steps = evolve_until(QuantumState(0.0), 0.5, fn, limits=limits)
+
+    for keep_trace in (True, False):
+        session = SimulationSession(0.0, 0.5, fn, keep_trace=keep_trace, limits=limits)
+        session.run()
+        assert session.stability.steps == steps == 29
@@ -0,0 +1,51 @@
+from qsol_invariants import (
+    CompressedTrace,
+    QuantumState,
+    analyze_trace,
+    compress_trace,
+    evolve_trace,
+)
+
+
+def dyadic_increment(x):
+    return x + 2.0**-10
+
+
+def test_constant_delta_runs_collapse():
+    # Climbs to the ceiling, then sits on the clamp with the same raw delta:
+    # clamp(base + k * delta) covers both in a single run.
+    trace = evolve_trace(QuantumState(0.5), 2.0, dyadic_increment, detect_cycles=True)
+    compressed = compress_trace(trace)
+
+    assert len(trace) == 513
+    assert compressed.runs == 1
+    assert len(compressed) == len(trace)
+    assert compressed == trace
+    assert compressed[-1] == trace[-1]
+    assert compressed[300] == trace[300]
+
+
+def test_lossless_when_rounding_breaks_runs():
+    trace = evolve_trace(
+        QuantumState(0.0), 2.0, lambda x: x + 0.05, detect_cycles=True
+    )
+    compressed = compress_trace(trace)
+
+    assert compressed.runs > 1
+    assert compressed.decompress() == trace
+    assert list(compressed) == list(trace)
+
+
+def test_analysis_on_runs_matches_columns():
+    for initial, fn in [
+        (0.5, dyadic_increment),
+        (0.0, lambda x: x + 0.0625 if x < 0.5 else x - 0.03125),
+        (0.25, lambda x: x + 2.0**-12),
+    ]:
+        trace = evolve_trace(QuantumState(initial), 0.75, fn, detect_cycles=True)
+        compressed = CompressedTrace(initial)
+        for step in trace:
+            compressed.append(step.next_state.value, step.delta)
+        compressed.cycle = trace.cycle
+
+        assert analyze_trace(compressed, 0.75) == analyze_trace(trace, 0.75)
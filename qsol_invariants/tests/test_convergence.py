@@ -0,0 +1,98 @@
+import pytest
+
+from qsol_invariants import (
+    ABSOLUTE_LIMITS,
+    AbsoluteLimits,
+    Affine,
+    ConvergencePolicy,
+    EpsilonConvergence,
+    ExactConvergence,
+    Profiler,
+    QuantumState,
+    UlpConvergence,
+    analyze_stream,
+    analyze_trace,
+    convergence_from_spec,
+    evolve_trace,
+    evolve_until,
+    iter_evolve_trace,
+)
+from qsol_invariants.convergence import ulp_distance
+
+
+def damped(x):
+    # Settles into a two-value cycle one ULP either side of 0.3.
+    return 0.3 - (x - 0.3) * 0.5
+
+
+def test_exact_default_runs_to_ceiling():
+    with pytest.raises(ValueError, match="exceeds max_iterations"):
+        evolve_until(QuantumState(0.35), 0.3, damped)
+
+
+def test_ulp_policy_ends_float_noise_runs():
+    policy = UlpConvergence(1)
+
+    trace = evolve_trace(QuantumState(0.35), 0.3, damped, convergence=policy)
+    report = analyze_trace(trace, 0.3, convergence=policy)
+
+    assert len(trace) == 49
+    assert ulp_distance(trace.values[-1], 0.3) == 1
+    assert report.converged and report.converged_by == "ulp(1)"
+    assert not analyze_trace(trace, 0.3).converged
+    assert evolve_until(QuantumState(0.35), 0.3, damped, convergence=policy) == (
+        QuantumState(trace.values[-1]),
+        49,
+    )
+    _, steps = evolve_until(
+        QuantumState(0.35), 0.3, damped, profiler=Profiler(), convergence=policy
+    )
+    assert steps == 49
+    stream = iter_evolve_trace(QuantumState(0.35), 0.3, damped, convergence=policy)
+    assert analyze_stream(stream, 0.3, convergence=policy) == report
+
+
+def test_exact_hits_keep_canonical_results():
+    def increment(x):
+        return x + 0.0625
+
+    policy = EpsilonConvergence(absolute=1e-9)
+    canonical = evolve_trace(QuantumState(0.0), 0.5, increment)
+    relaxed = evolve_trace(QuantumState(0.0), 0.5, increment, convergence=policy)
+
+    assert relaxed == canonical
+    assert analyze_trace(relaxed, 0.5, convergence=policy).converged_by == "exact"
+    assert analyze_trace(canonical, 0.5).converged_by == "exact"
+
+
+def test_policy_lives_on_limits():
+    limits = AbsoluteLimits(convergence=UlpConvergence(2))
+
+    assert ABSOLUTE_LIMITS.convergence.exact
+    assert limits.is_converged_to(0.30000000000000004, 0.3)
+    assert not ABSOLUTE_LIMITS.is_converged_to(0.30000000000000004, 0.3)
+    assert "ulp(2)" in limits.describe()
+    for policy in (ExactConvergence(), UlpConvergence(2), EpsilonConvergence(0.1, 0.2)):
+        assert convergence_from_spec(policy.to_spec()) == policy
+    with pytest.raises(ValueError, match="Invalid convergence spec"):
+        convergence_from_spec({"ulps": 1, "absolute": 0.1})
+    with pytest.raises(ValueError):
+        EpsilonConvergence(absolute=-1.0)
+
+    class Incomplete(ConvergencePolicy):
+        def describe(self):
+            return "incomplete"
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_exact_override_holds_on_closed_forms():
+    limits = AbsoluteLimits(convergence=EpsilonConvergence(absolute=0.01))
+    step = Affine(1.0, 2**-10)
+
+    for fn in (step, lambda x: step(x)):
+        final, steps = evolve_until(
+            QuantumState(0.0), 0.5, fn, limits=limits, convergence=ExactConvergence()
+        )
+        assert (final.value, steps) == (0.5, 512)
@@ -0,0 +1,58 @@
+import pytest
+
+from qsol_invariants import (
+    EvolutionCycle,
+    QuantumState,
+    SimulationSession,
+    evolve_trace,
+    evolve_until,
+)
+
+
+def flip(x):
+    return 0.54 if x < 0.5 else 0.46
+
+
+def increment(x):
+    return x + 0.05
+
+
+def test_oscillation_hits_ceiling_without_detection():
+    with pytest.raises(ValueError):
+        evolve_until(QuantumState(0.5), target=0.9, fn=flip)
+
+
+def test_evolve_until_stops_on_cycle():
+    final, steps = evolve_until(
+        QuantumState(0.5), target=0.9, fn=flip, detect_cycles=True
+    )
+    assert final.value == 0.46
+    assert steps == 3
+
+
+def test_trace_records_cycle():
+    trace = evolve_trace(QuantumState(0.5), target=0.9, fn=flip, detect_cycles=True)
+    assert len(trace) == 3
+    assert trace.cycle == EvolutionCycle(start=1, length=2)
+
+
+def test_clamped_fixed_point_is_a_cycle():
+    trace = evolve_trace(QuantumState(0.9), target=0.2, fn=increment, detect_cycles=True)
+    assert trace.cycle == EvolutionCycle(start=2, length=1)
+
+
+def test_session_reports_cycle():
+    for keep_trace in (True, False):
+        session = SimulationSession(
+            initial_value=0.5,
+            target=0.9,
+            transform=flip,
+            keep_trace=keep_trace,
+            detect_cycles=True,
+        )
+        session.run()
+        assert session.stability.cycled
+        assert session.stability.cycle_start == 1
+        assert session.stability.cycle_length == 2
+        assert not session.stability.converged
+        assert "cycle_length: 2" in session.report()
@@ -3,6 +3,7 @@ from qsol_invariants import (
     evolve,
     evolve_until,
     evolve_trace,
+    iter_evolve_trace,
 )
 
 
@@ -34,3 +35,34 @@ def test_evolve_trace():
     assert len(trace) > 0
     assert trace[-1].next_state.value <= 1.0
 
+
+def test_iter_evolve_trace_matches_trace():
+    s = QuantumState(0.0)
+    steps = list(iter_evolve_trace(s, target=0.2, fn=increment))
+    assert steps == list(evolve_trace(s, target=0.2, fn=increment))
+
+
+def _outcome(fn, initial, target, **kwargs):
+    try:
+        return evolve_until(QuantumState(initial), target, fn, **kwargs)
+    except ValueError as exc:
+        return str(exc)
+
+
+def test_evolve_until_kernel_matches_reference_loop():
+    from qsol_invariants import Profiler
+
+    cases = [
+        (increment, 0.0, 0.2),  # converges
+        (lambda x: min(x + 0.05, 0.3), 0.0, 0.9),  # stalls
+        (lambda x: x + 0.5, 0.0, 0.9),  # PHI-bound violation
+        (lambda x: x + 0.05, 0.98, 0.5),  # clamped at the ceiling
+        (lambda x: 0.54 if x < 0.5 else 0.46, 0.5, 0.9),  # oscillates
+    ]
+    for fn, initial, target in cases:
+        for detect_cycles in (False, True):
+            fast = _outcome(fn, initial, target, detect_cycles=detect_cycles)
+            reference = _outcome(
+                fn, initial, target, detect_cycles=detect_cycles, profiler=Profiler()
+            )
+            assert fast == reference
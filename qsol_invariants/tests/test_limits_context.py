@@ -0,0 +1,95 @@
+import asyncio
+import dataclasses
+import threading
+
+import pytest
+
+from qsol_invariants import (
+    ABSOLUTE_LIMITS,
+    QuantumState,
+    SimulationSession,
+    analyze_trace,
+    current_limits,
+    evolve_trace,
+    evolve_until,
+    evolve_until_async,
+    limits_context,
+    run_sessions,
+)
+
+WIDE = dataclasses.replace(ABSOLUTE_LIMITS, max_value=2.0, max_step_delta=0.5)
+SHORT = dataclasses.replace(ABSOLUTE_LIMITS, max_iterations=3)
+
+
+def increment(x):
+    return x + 0.25
+
+
+def small_step(x):
+    return x + 0.0625
+
+
+def test_explicit_limits():
+    assert QuantumState(1.5).value == 1.0
+    assert QuantumState(1.5, WIDE).value == 1.5
+
+    state, steps = evolve_until(QuantumState(0.0, WIDE), 1.5, increment, limits=WIDE)
+    assert (state.value, steps) == (1.5, 6)
+    trace = evolve_trace(QuantumState(0.0, WIDE), 1.5, increment, limits=WIDE)
+    assert analyze_trace(trace, 1.5, limits=WIDE).converged
+    assert not analyze_trace(trace, 1.5).converged
+
+    # The canonical contract still applies to calls without limits.
+    with pytest.raises(ValueError, match="max_step_delta"):
+        evolve_until(QuantumState(0.0), 1.5, increment)
+
+
+def test_context_nests_and_is_per_thread():
+    seen = {}
+
+    def worker():
+        seen["thread"] = current_limits()
+
+    with limits_context(WIDE):
+        with limits_context(SHORT):
+            assert current_limits() is SHORT
+            with pytest.raises(ValueError, match="max_iterations 3"):
+                evolve_until(QuantumState(0.0), 1.0, small_step)
+        assert current_limits() is WIDE
+        assert evolve_until(QuantumState(0.0), 1.5, increment)[1] == 6
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+    assert current_limits() is ABSOLUTE_LIMITS
+    assert seen["thread"] is ABSOLUTE_LIMITS
+
+
+def test_concurrent_tasks_keep_their_contracts():
+    async def run(limits):
+        with limits_context(limits):
+            await asyncio.sleep(0)
+            try:
+                return await evolve_until_async(QuantumState(0.0), 1.5, increment)
+            except ValueError as exc:
+                return str(exc)
+
+    async def main():
+        return await asyncio.gather(run(WIDE), run(ABSOLUTE_LIMITS))
+
+    wide, canonical = asyncio.run(main())
+    assert wide[1] == 6
+    assert "max_step_delta" in canonical
+
+
+def test_sessions_carry_limits_to_workers():
+    with limits_context(WIDE):
+        wide = SimulationSession(0.0, 1.5, increment)
+    canonical = SimulationSession(0.0, 1.0, small_step, keep_trace=False)
+    short = SimulationSession(0.0, 1.0, small_step, limits=SHORT)
+    assert wide.limits is WIDE
+
+    with pytest.raises(ValueError, match="max_iterations 3"):
+        run_sessions([wide, canonical, short], workers=2, chunksize=1)
+    assert wide.stability.steps == 6 and wide.stability.converged
+    assert wide.final_state().value == 1.5
+    assert canonical.completed
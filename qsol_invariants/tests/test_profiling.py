@@ -0,0 +1,50 @@
+from qsol_invariants import (
+    Profiler,
+    QuantumState,
+    SimulationSession,
+    evolve_trace,
+    evolve_until,
+)
+
+
+def increment(x):
+    return x + 0.05
+
+
+def test_profiler_counts_steps_and_calls_hooks():
+    seen = []
+    profiler = Profiler(hooks=[lambda prev, nxt, delta: seen.append(nxt.value)])
+    trace = evolve_trace(QuantumState(0.0), 0.2, increment, profiler=profiler)
+
+    assert profiler.steps == profiler.transform_calls == len(trace)
+    assert seen == list(trace.values[1:])
+    assert trace == evolve_trace(QuantumState(0.0), 0.2, increment)
+
+
+def test_profiled_evolve_until_matches_plain():
+    profiler = Profiler()
+    plain = evolve_until(QuantumState(0.0), 0.2, increment)
+    profiled = evolve_until(QuantumState(0.0), 0.2, increment, profiler=profiler)
+
+    assert profiled == plain
+    assert profiler.steps == plain[1]
+
+
+def test_session_profile_report():
+    session = SimulationSession(
+        initial_value=0.0, target=0.2, transform=increment, profile=True
+    )
+    session.run()
+    report = session.profile_report
+
+    assert report is not None
+    assert report.steps == session.stability.steps
+    assert report.total_seconds >= report.transform_seconds + report.limits_seconds
+    assert "QSOL Evolution Profile:" in report.describe()
+
+
+def test_session_without_profile_has_no_report():
+    session = SimulationSession(initial_value=0.0, target=0.2, transform=increment)
+    session.run()
+
+    assert session.profile_report is None
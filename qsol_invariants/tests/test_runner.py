@@ -0,0 +1,49 @@
+import pytest
+
+from qsol_invariants import SimulationSession, run_sessions
+
+
+def increment(x):
+    return x + 0.05
+
+
+def flip(x):
+    return 0.54 if x < 0.5 else 0.46
+
+
+def make_sessions():
+    return [
+        SimulationSession(initial_value=0.0, target=0.2, transform=increment),
+        SimulationSession(initial_value=0.5, target=0.5, transform=increment),
+        SimulationSession(
+            initial_value=0.5, target=0.9, transform=flip, detect_cycles=True
+        ),
+        SimulationSession(
+            initial_value=0.1, target=0.3, transform=increment, keep_trace=False
+        ),
+    ]
+
+
+def test_run_sessions_matches_sequential_runs():
+    expected = make_sessions()
+    for session in expected:
+        session.run()
+
+    sessions = run_sessions(make_sessions(), workers=2, chunksize=1)
+
+    for got, want in zip(sessions, expected):
+        assert got.completed
+        assert got.stability == want.stability
+        assert got.trace == want.trace
+        assert got.final_state() == want.final_state()
+
+
+def test_run_batch_raises_first_error_after_running_all():
+    sessions = make_sessions()
+    sessions.insert(1, SimulationSession(0.9, 0.2, increment))
+
+    with pytest.raises(ValueError, match="max_iterations"):
+        SimulationSession.run_batch(sessions, workers=2)
+
+    assert not sessions[1].completed
+    assert all(s.completed for i, s in enumerate(sessions) if i != 1)
@@ -0,0 +1,116 @@
+import pytest
+
+from qsol_invariants import (
+    SimulationSession,
+    estimate_steps,
+    run_sessions,
+    schedule_sessions,
+)
+
+
+def increment(x):
+    return x + 0.05
+
+
+def slow_increment(x):
+    return x + 2.0**-10
+
+
+def overshoot(x):
+    return x + 0.03
+
+
+def flip(x):
+    return 0.54 if x < 0.5 else 0.46
+
+
+def damped(x):
+    return 0.5 - (x - 0.5) * 0.5
+
+
+def test_estimates():
+    # Ends within the probe: exact.
+    assert estimate_steps(SimulationSession(0.0, 0.2, increment)) == 4
+    assert estimate_steps(SimulationSession(0.5, 0.9, flip, detect_cycles=True)) == 3
+    # Constant steps: extrapolated to the target, or to the ceiling bound.
+    assert estimate_steps(SimulationSession(0.0, 0.5, slow_increment)) == 512
+    assert (
+        estimate_steps(SimulationSession(0.0, 2.0, slow_increment, detect_cycles=True))
+        == 1025
+    )
+    assert estimate_steps(SimulationSession(0.0, 2.0, slow_increment)) == 10_000
+    # Inexact constant steps miss the target, overshoot and clamp.
+    assert estimate_steps(SimulationSession(0.0, 0.5, overshoot)) == 10_000
+    assert (
+        estimate_steps(SimulationSession(0.0, 0.5, overshoot, detect_cycles=True))
+        == 35
+    )
+    # Contracting error: within a few percent of the actual step count.
+    session = SimulationSession(0.9, 0.5, lambda x: x - (x - 0.5) * 0.1)
+    estimate = estimate_steps(session)
+    session.run()
+    assert estimate == pytest.approx(session.stability.steps, rel=0.1)
+
+    with pytest.raises(ValueError):
+        estimate_steps(session, probe=2)
+
+
+def test_longest_first_bins():
+    sessions = [
+        SimulationSession(0.0, 0.2, increment),
+        SimulationSession(0.0, 0.5, slow_increment),
+        SimulationSession(0.0, 0.25, slow_increment),
+        SimulationSession(0.0, 0.25, slow_increment),
+        SimulationSession(0.5, 0.9, flip, detect_cycles=True),
+    ]
+    schedule = schedule_sessions(sessions, workers=2)
+
+    assert schedule.estimates == (4, 512, 256, 256, 3)
+    assert schedule.bins == ((1, 0), (2, 3, 4))
+    assert schedule.loads == (516, 515)
+    assert schedule.makespan == 516
+
+
+def test_scheduled_run_matches_sequential_runs():
+    def make_sessions():
+        return [
+            SimulationSession(0.0, 0.2, increment),
+            SimulationSession(0.0, 0.5, slow_increment, keep_trace=False),
+            SimulationSession(0.55, 0.5, damped),
+            SimulationSession(0.5, 0.9, flip, detect_cycles=True),
+        ]
+
+    expected = make_sessions()
+    for session in expected:
+        session.run()
+    sessions = make_sessions()
+    schedule = schedule_sessions(sessions, workers=2)
+    run_sessions(sessions, workers=2, schedule=schedule)
+
+    for got, want in zip(sessions, expected):
+        assert got.stability == want.stability
+        assert got.trace == want.trace
+    accuracy = schedule.accuracy(sessions)
+    assert accuracy.actual == tuple(s.stability.steps for s in expected)
+    assert accuracy.exact >= 3
+    assert "makespan" in accuracy.describe()
+
+    with pytest.raises(ValueError):
+        run_sessions(sessions[:3], workers=2, schedule=schedule)
+
+
+def test_accuracy_counts_ceiling_failures():
+    sessions = [
+        SimulationSession(0.0, 0.2, increment),
+        SimulationSession(0.0, 0.5, overshoot),
+    ]
+    schedule = schedule_sessions(sessions, workers=2)
+    with pytest.raises(ValueError, match="max_iterations"):
+        run_sessions(sessions, workers=1, schedule=schedule)
+
+    accuracy = schedule.accuracy(sessions)
+    assert schedule.estimates == (4, 10_000)
+    assert accuracy.actual == (4, 10_001)
+    assert accuracy.failed == 1
+    assert accuracy.mean_absolute_error == 0.5
+    assert accuracy.actual_makespan == 10_001
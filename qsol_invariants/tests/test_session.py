@@ -29,3 +29,18 @@ def test_session_report():
     report = session.report()
     assert "QSOL Simulation Session:" in report
 
+
+def test_session_streaming_keeps_only_report():
+    streamed = SimulationSession(
+        initial_value=0.0,
+        target=0.2,
+        transform=increment,
+        keep_trace=False,
+    )
+    streamed.run()
+    full = SimulationSession(initial_value=0.0, target=0.2, transform=increment)
+    full.run()
+
+    assert len(streamed.trace) == 0
+    assert streamed.stability == full.stability
+    assert streamed.final_state() == full.final_state()
@@ -0,0 +1,39 @@
+from qsol_invariants import (
+    QuantumState,
+    StabilityAccumulator,
+    analyze_stream,
+    analyze_trace,
+    evolve_trace,
+    iter_evolve_trace,
+)
+
+
+def increment(x):
+    return x + 0.05
+
+
+def wobble(x):
+    return x + 0.05 if x < 0.3 else x - 0.03
+
+
+def test_stream_report_matches_trace_report():
+    for initial, target, fn in [
+        (0.0, 0.2, increment),
+        (0.5, 0.5, increment),
+        (0.25, 0.32, wobble),
+    ]:
+        s = QuantumState(initial)
+        expected = analyze_trace(evolve_trace(s, target, fn), target)
+        assert analyze_stream(iter_evolve_trace(s, target, fn), target) == expected
+
+
+def test_accumulator_tracks_monotonicity():
+    acc = StabilityAccumulator()
+    acc.update(0.1, 0.2)
+    acc.update(0.2, 0.15)
+    report = acc.report(0.15)
+
+    assert report.converged
+    assert report.steps == 2
+    assert not report.monotonic_increasing
+    assert not report.monotonic_decreasing
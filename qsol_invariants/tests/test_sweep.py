@@ -0,0 +1,38 @@
+import pytest
+
+from qsol_invariants import SweepStatus, sweep, sweep_adaptive
+
+np = pytest.importorskip("numpy")
+
+
+def jump_below(x):
+    # PHI-bound violation below 0.3, immediate stall elsewhere.
+    return np.where(x < 0.3, x + 0.5, x)
+
+
+def test_dense_sweep_statuses():
+    result = sweep(lambda x: x + 0.05, [0.0, 0.95], [0.2, 0.5])
+
+    assert result.status.shape == (2, 2)
+    assert result.status[0, 0] == SweepStatus.CONVERGED
+    assert result.steps[0, 0] == 4
+    # Clamped onto 1.0 with a non-zero delta: a cycle of length one.
+    assert result.status[1, 0] == SweepStatus.CYCLED
+
+
+def test_adaptive_sweep_matches_dense_grid():
+    # Targets outside the domain are never reached, so the map has exactly
+    # one boundary, at initial value 0.3.
+    adaptive = sweep_adaptive(
+        jump_below, target_range=(1.5, 2.0), cells=4, levels=4
+    )
+    dense = sweep(jump_below, adaptive.initial_values, adaptive.targets)
+
+    assert np.array_equal(adaptive.status, dense.status)
+    assert adaptive.evaluated.mean() < 0.25
+    evaluated = adaptive.evaluated
+    assert np.array_equal(adaptive.steps[evaluated], dense.steps[evaluated])
+    assert set(np.unique(adaptive.status)) == {
+        SweepStatus.STALLED,
+        SweepStatus.PHI_VIOLATION,
+    }
@@ -0,0 +1,39 @@
+from qsol_invariants import (
+    EvolutionStep,
+    EvolutionTrace,
+    QuantumState,
+    analyze_trace,
+    evolve_trace,
+)
+
+
+def increment(x):
+    return x + 0.05
+
+
+def test_trace_exposes_step_views():
+    trace = evolve_trace(QuantumState(0.0), target=0.2, fn=increment)
+
+    assert isinstance(trace, EvolutionTrace)
+    assert len(trace.values) == len(trace) + 1
+    for i, step in enumerate(trace):
+        assert step.index == i
+        assert step.prev_state.value == trace.values[i]
+        assert step.next_state.value == trace.values[i + 1]
+        assert step.delta == trace.deltas[i]
+    assert trace[-1] == trace[len(trace) - 1]
+    assert trace[1:3] == [trace[1], trace[2]]
+
+
+def test_trace_analysis_matches_step_list():
+    trace = evolve_trace(QuantumState(0.0), target=0.2, fn=increment)
+    steps = list(trace)
+
+    assert all(isinstance(step, EvolutionStep) for step in steps)
+    assert trace == steps
+    assert analyze_trace(trace, 0.2) == analyze_trace(steps, 0.2)
+
+
+def test_trace_memory_per_step():
+    trace = evolve_trace(QuantumState(0.0), target=0.2, fn=increment)
+    assert trace.nbytes == 16 * len(trace) + 8
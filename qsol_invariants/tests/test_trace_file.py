@@ -0,0 +1,87 @@
+import pytest
+
+from qsol_invariants import (
+    QuantumState,
+    StepToward,
+    TraceWriter,
+    analyze_trace,
+    evolve_to_file,
+    evolve_trace,
+    open_trace,
+    write_trace,
+)
+
+
+def increment(x):
+    return x + 0.05
+
+
+def flip(x):
+    return 0.54 if x < 0.5 else 0.46
+
+
+def test_write_and_reopen_trace(tmp_path):
+    path = tmp_path / "session.qtr"
+    trace = evolve_trace(QuantumState(0.0), target=0.2, fn=increment)
+    write_trace(path, trace, target=0.2)
+
+    with open_trace(path) as archive:
+        assert archive.complete
+        assert archive.target == 0.2
+        assert archive.trace == trace
+        assert analyze_trace(archive.trace, 0.2) == analyze_trace(trace, 0.2)
+
+
+def test_evolve_to_file_records_cycle(tmp_path):
+    path = tmp_path / "cycle.qtr"
+    cycle = evolve_to_file(path, QuantumState(0.5), 0.9, flip, detect_cycles=True)
+
+    with open_trace(path) as archive:
+        assert archive.trace.cycle == cycle
+        assert archive.trace == evolve_trace(
+            QuantumState(0.5), 0.9, flip, detect_cycles=True
+        )
+
+
+def test_failed_evolution_leaves_readable_archive(tmp_path):
+    path = tmp_path / "ceiling.qtr"
+    with pytest.raises(ValueError):
+        evolve_to_file(path, QuantumState(0.5), 0.9, flip)
+
+    with open_trace(path) as archive:
+        assert not archive.complete
+        assert len(archive.trace) == archive.limits.max_iterations + 1
+
+
+def test_rejects_foreign_file(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"\0" * 256)
+    with pytest.raises(ValueError):
+        open_trace(path)
+
+
+def test_close_reports_views_in_use(tmp_path):
+    path = tmp_path / "session.qtr"
+    write_trace(path, evolve_trace(QuantumState(0.0), 0.2, increment), target=0.2)
+
+    archive = open_trace(path)
+    view = archive.trace.values[1:]
+    with pytest.raises(BufferError, match="still in use"):
+        archive.close()
+    del view
+    archive.close()
+    archive.close()
+
+
+def test_archives_reject_vector_states(tmp_path):
+    np = pytest.importorskip("numpy")
+    fn = StepToward(0.5, 0.05)
+    path = tmp_path / "vector.qtr"
+    with pytest.raises(ValueError, match="scalar traces only"):
+        evolve_to_file(path, QuantumState([0.1, 0.9]), 0.5, fn)
+    trace = evolve_trace(QuantumState([0.1, 0.9]), 0.5, fn)
+    with pytest.raises(ValueError, match="scalar traces only"):
+        write_trace(path, trace, target=0.5)
+    with TraceWriter(path, 0.1, 0.5) as writer:
+        with pytest.raises(ValueError, match="scalar traces only"):
+            writer.append(np.array([0.15, 0.85]), 0.05)
@@ -0,0 +1,110 @@
+import json
+import pickle
+
+import pytest
+
+from qsol_invariants import (
+    Affine,
+    ClosedFormTransform,
+    Clip,
+    Compose,
+    Piecewise,
+    QuantumState,
+    SimulationSession,
+    StepToward,
+    Transform,
+    TransformCache,
+    evolve_until,
+    evolve_until_batch,
+    run_sessions,
+    transform_from_spec,
+)
+from qsol_invariants.cli import main
+
+PIPELINE = Piecewise(
+    bounds=(0.25, 0.75),
+    pieces=(
+        StepToward(0.5, 0.0625),
+        Affine(0.75, 0.125).then(Clip(0.35, 0.65)),
+        Affine(1.0, -0.05),
+    ),
+)
+
+
+def test_scalar_and_array_evaluation_agree():
+    np = pytest.importorskip("numpy")
+    values = np.linspace(0.0, 1.0, 41)
+
+    assert PIPELINE(values).tolist() == [PIPELINE(float(v)) for v in values]
+
+    initial = np.linspace(0.0, 1.0, 9)
+    result = evolve_until_batch(initial, np.full_like(initial, 0.5), PIPELINE)
+    for i, value in enumerate(initial):
+        final, steps = evolve_until(QuantumState(float(value)), 0.5, PIPELINE)
+        assert (result.values[i], result.steps[i]) == (final.value, steps)
+
+
+def test_specs_fingerprints_and_pickling():
+    rebuilt = transform_from_spec(json.loads(json.dumps(PIPELINE.to_spec())))
+    assert rebuilt == PIPELINE
+    assert rebuilt.fingerprint == PIPELINE.fingerprint
+    assert pickle.loads(pickle.dumps(PIPELINE)) == PIPELINE
+
+    assert Affine(1, 0).fingerprint == Affine(1.0, 0.0).fingerprint
+    assert Affine(1.0, 0.0).fingerprint != Affine(1.0, 0.5).fingerprint
+    nested = Compose((Affine(0.5, 0.1), Compose((Clip(0.0, 0.5), Affine()))))
+    assert nested == Affine(0.5, 0.1).then(Clip(0.0, 0.5)).then(Affine())
+
+    cache = TransformCache()
+    cache.wrap(Affine(0.5, 0.25))(0.5)
+    cache.wrap(Affine(0.5, 0.25))(0.5)
+    assert cache.stats().hits == 1
+
+    with pytest.raises(ValueError, match="Unknown transform type"):
+        transform_from_spec({"type": "spline"})
+    with pytest.raises(ValueError, match="one more piece"):
+        Piecewise(bounds=(0.5,), pieces=(Affine(),))
+
+    class ScalarOnly(Transform):
+        def _scalar(self, value):
+            return value
+
+    with pytest.raises(TypeError):
+        ScalarOnly()
+
+
+def test_closed_forms_match_the_step_loop():
+    for fn, initial, target in [
+        (StepToward(0.7, 0.0625), 0.0, 0.7),
+        (StepToward(0.1, 0.03125), 0.9, 0.1),
+        (StepToward(0.7, 0.05), 0.1, 0.7),
+        (Affine(1.0, 0.0625), 0.0, 0.75),
+        (Affine(0.75, 0.125), 0.3, 0.5),
+    ]:
+        assert isinstance(fn, ClosedFormTransform)
+        expected = evolve_until(QuantumState(initial), target, fn._scalar)
+        assert evolve_until(QuantumState(initial), target, fn) == expected
+
+    assert StepToward(0.7, 0.0625).iterate(0.0, 12) == 0.7
+    assert Affine(1.0, 0.1).iterate(0.1, 3) is None
+    assert not isinstance(Clip(0.0, 1.0), ClosedFormTransform)
+
+
+def test_sessions_in_workers_and_cli_specs(tmp_path):
+    def make_sessions():
+        return [
+            SimulationSession(i / 8, 0.5, PIPELINE, keep_trace=i % 2 == 0)
+            for i in range(8)
+        ]
+
+    expected = make_sessions()
+    for session in expected:
+        session.run()
+    sessions = run_sessions(make_sessions(), workers=2)
+    assert [s.stability for s in sessions] == [s.stability for s in expected]
+
+    spec = {"initial_value": 0.0, "target": 0.5, "transform": PIPELINE.to_spec()}
+    (tmp_path / "specs.jsonl").write_text(json.dumps(spec) + "\n")
+    assert main([str(tmp_path / "specs.jsonl"), "-o", str(tmp_path / "out.jsonl")]) == 0
+    record = json.loads((tmp_path / "out.jsonl").read_text())
+    assert record == json.loads(json.dumps(expected[0].stability.__dict__))
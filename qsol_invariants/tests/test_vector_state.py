@@ -0,0 +1,84 @@
+import asyncio
+import dataclasses
+
+import pytest
+
+from qsol_invariants import (
+    QuantumState,
+    SimulationSession,
+    analyze_stream,
+    analyze_trace,
+    evolve,
+    evolve_trace,
+    evolve_until,
+    iter_evolve_trace,
+)
+
+np = pytest.importorskip("numpy")
+
+TARGET = np.array([0.2, 0.3, 0.05])
+
+
+def toward_target(v):
+    return np.minimum(v + 0.05, TARGET)
+
+
+def test_vector_state_clamps_componentwise():
+    state = QuantumState([-0.5, 0.25, 1.5])
+    assert state.is_vector
+    assert state == QuantumState(np.array([0.0, 0.25, 1.0]))
+
+
+def test_vector_phi_bound_is_per_component():
+    with pytest.raises(ValueError, match="component 1"):
+        evolve(QuantumState([0.1, 0.1]), lambda v: v + np.array([0.05, 0.5]))
+
+
+def test_vector_evolve_until_matches_components():
+    final, steps = evolve_until(QuantumState([0.0, 0.1, 0.0]), TARGET, toward_target)
+    assert final == QuantumState(TARGET)
+    # Converges once the slowest component has.
+    assert steps == 4
+
+
+def test_vector_trace_analysis():
+    trace = evolve_trace(QuantumState([0.0, 0.1, 0.0]), TARGET, toward_target)
+    report = analyze_trace(trace, TARGET)
+
+    assert report.converged
+    assert report.steps == len(trace) == 4
+    assert report.monotonic_increasing and not report.monotonic_decreasing
+    assert np.array_equal(report.final_value, TARGET)
+
+
+def test_vector_session():
+    session = SimulationSession(
+        initial_value=[0.0, 0.1, 0.0], target=TARGET, transform=toward_target
+    )
+    session.run()
+    assert session.stability.converged
+    assert session.final_state() == QuantumState(TARGET)
+
+
+def assert_same_report(got, want):
+    for field in dataclasses.fields(want):
+        assert np.array_equal(getattr(got, field.name), getattr(want, field.name))
+
+
+def test_vector_streaming_analysis():
+    initial = [0.0, 0.1, 0.0]
+    trace = evolve_trace(QuantumState(initial), TARGET, toward_target)
+    want = analyze_trace(trace, TARGET)
+
+    streamed = analyze_stream(
+        iter_evolve_trace(QuantumState(initial), TARGET, toward_target), TARGET
+    )
+    assert_same_report(streamed, want)
+
+    session = SimulationSession(initial, TARGET, toward_target, keep_trace=False)
+    session.run()
+    assert_same_report(session.stability, want)
+
+    session = SimulationSession(initial, TARGET, toward_target, keep_trace=False)
+    asyncio.run(session.run_async())
+    assert_same_report(session.stability, want)
@@ -0,0 +1,75 @@
+from array import array
+
+import pytest
+
+from qsol_invariants import (
+    EvolutionTrace,
+    QuantumState,
+    StepToward,
+    evolve_to_file,
+    evolve_trace,
+    open_trace,
+    verify_trace,
+)
+
+STEP = 2.0**-14
+
+
+def fine_increment(x):
+    return x + STEP
+
+
+def tampered_trace():
+    trace = evolve_trace(QuantumState(0.0), 1_000 * STEP, fine_increment)
+    values, deltas = list(trace.values), list(trace.deltas)
+    values[401] += STEP  # breaks "next" of steps 400 and 401
+    deltas[700] = 0.5  # breaks "delta" and "phi" of step 700
+    return EvolutionTrace.from_columns(array("d", values), array("d", deltas))
+
+
+def test_verify_accepts_genuine_trace():
+    trace = evolve_trace(QuantumState(0.0), 1_000 * STEP, fine_increment)
+    result = verify_trace(trace, fine_increment, workers=1)
+
+    assert result.ok
+    assert result.steps == 1_000
+
+
+def test_verify_reports_first_failure_and_breakdown():
+    result = verify_trace(tampered_trace(), fine_increment, workers=1, chunksize=128)
+
+    assert result.first_failure == 400
+    assert result.failures == {"delta": 1, "next": 2, "phi": 1}
+    assert result.first_failures == {"delta": 700, "next": 400, "phi": 700}
+
+
+def test_parallel_and_vectorized_agree_with_serial():
+    trace = tampered_trace()
+    serial = verify_trace(trace, fine_increment, workers=1)
+    parallel = verify_trace(trace, fine_increment, workers=2, chunksize=256)
+    assert parallel == serial
+
+    pytest.importorskip("numpy")
+    vectorized = verify_trace(trace, fine_increment, vectorized=True, chunksize=300)
+    assert vectorized == serial
+
+
+def test_verify_archived_trace(tmp_path):
+    path = tmp_path / "run.qtr"
+    evolve_to_file(path, QuantumState(0.0), 1_000 * STEP, fine_increment)
+
+    with open_trace(path) as archive:
+        result = verify_trace(archive, fine_increment, workers=2, chunksize=256)
+
+    assert result.ok
+    assert result.steps == 1_000
+
+
+def test_verify_rejects_vector_traces():
+    pytest.importorskip("numpy")
+    fn = StepToward(0.5, 0.05)
+    trace = evolve_trace(QuantumState([0.1, 0.9]), 0.5, fn)
+
+    for stored in (trace, list(trace)):
+        with pytest.raises(ValueError, match="only verifies scalar traces"):
+            verify_trace(stored, fn, workers=1)
@@ -0,0 +1,207 @@
+"""
+trace.py
+
+QSOL evolution trace representation.
+
+Defines the audit records produced by the evolution operators:
+
+- EvolutionStep  : a single transition (prev_state -> next_state, delta)
+- EvolutionCycle : where and how a trajectory started repeating itself
+- EvolutionTrace : a compact, columnar sequence of EvolutionStep records
+
+EvolutionTrace stores one float64 value per step boundary plus one float64
+delta per step in contiguous buffers (about 16 bytes per step). EvolutionStep
+objects are built lazily on access, so the trace behaves like the list of
+steps it replaces without holding one heap object per state.
+
+Traces of vector states hold one NumPy row per step boundary and per step
+instead (lists of arrays, or 2-D arrays via from_columns).
+"""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Union, overload
+
+from ._numpy import require_numpy
+from .quantum_state import QuantumState
+
+
+def is_row_column(column) -> bool:
+    # Columns of vector states hold arrays (or are 2-D arrays).
+    if getattr(column, "ndim", 1) > 1:
+        return True
+    return len(column) > 0 and getattr(column[0], "ndim", 0) > 0
+
+
+def _columns_equal(a, b) -> bool:
+    if is_row_column(a) or is_row_column(b):
+        numpy = require_numpy()
+        return len(a) == len(b) and all(
+            numpy.array_equal(x, y) for x, y in zip(a, b)
+        )
+    return list(a) == list(b)
+
+
+@dataclass(frozen=True)
+class EvolutionStep:
+    """
+    A single evolution step, capturing the transition for auditability.
+    """
+
+    index: int
+    prev_state: QuantumState
+    next_state: QuantumState
+    delta: float
+
+
+@dataclass(frozen=True)
+class EvolutionCycle:
+    """
+    A detected cycle: the value at step boundary `start` recurs at boundary
+    `start + length`, so steps start .. start + length - 1 repeat forever.
+    """
+
+    start: int
+    length: int
+
+
+class EvolutionTrace(Sequence):
+    """
+    A chronological evolution trace stored as contiguous float64 columns.
+
+    - values: the state value at every step boundary; values[i] is the value
+              before step i and values[i + 1] the value after it.
+    - deltas: the signed raw delta of every step.
+
+    A trace of n steps holds n + 1 values and n deltas. Indexing returns
+    EvolutionStep views, so the trace can be used wherever a list of
+    EvolutionStep objects was expected.
+
+    cycle is set when the evolution stopped because it detected a cycle.
+    """
+
+    __slots__ = ("_values", "_deltas", "cycle")
+
+    def __init__(self, initial_value: Optional[float] = None) -> None:
+        self._values = array("d")
+        self._deltas = array("d")
+        self.cycle: Optional[EvolutionCycle] = None
+        if initial_value is not None:
+            if getattr(initial_value, "ndim", 0) > 0:
+                # Vector states: one array per boundary and per step.
+                self._values = [initial_value]
+                self._deltas = []
+            else:
+                self._values.append(initial_value)
+
+    @classmethod
+    def from_columns(cls, values, deltas) -> "EvolutionTrace":
+        """
+        Build a trace over existing value and delta columns without copying.
+
+        Args:
+            values: Buffer of n + 1 boundary values (any indexable float
+                    sequence, e.g. array('d') or a memoryview).
+            deltas: Buffer of n step deltas.
+
+        Raises:
+            ValueError if the column lengths are inconsistent.
+        """
+        if len(deltas) and len(values) != len(deltas) + 1:
+            raise ValueError(
+                f"EvolutionTrace needs len(values) == len(deltas) + 1, "
+                f"got {len(values)} values and {len(deltas)} deltas."
+            )
+        trace = cls.__new__(cls)
+        trace._values = values
+        trace._deltas = deltas
+        trace.cycle = None
+        return trace
+
+    @property
+    def values(self):
+        """
+        Column of state values at every step boundary.
+        """
+        return self._values
+
+    @property
+    def deltas(self):
+        """
+        Column of signed raw deltas, one per step.
+        """
+        return self._deltas
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate size of the column buffers in bytes.
+        """
+        width = 1
+        if is_row_column(self._values):
+            width = len(self._values[0])
+        return 8 * width * (len(self._values) + len(self._deltas))
+
+    def append(self, next_value: float, delta: float) -> None:
+        """
+        Record one step ending at next_value with the given raw delta.
+
+        Raises:
+            ValueError if the trace has no initial value to step from.
+        """
+        if not self._values:
+            raise ValueError("EvolutionTrace has no initial value to step from.")
+        self._values.append(next_value)
+        self._deltas.append(delta)
+
+    def _step(self, index: int) -> EvolutionStep:
+        return EvolutionStep(
+            index=index,
+            prev_state=QuantumState._recorded(self._values[index]),
+            next_state=QuantumState._recorded(self._values[index + 1]),
+            delta=self._deltas[index],
+        )
+
+    def __len__(self) -> int:
+        return len(self._deltas)
+
+    @overload
+    def __getitem__(self, index: int) -> EvolutionStep: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EvolutionStep]: ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[EvolutionStep, List[EvolutionStep]]:
+        if isinstance(index, slice):
+            return [self._step(i) for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("EvolutionTrace index out of range")
+        return self._step(index)
+
+    def __iter__(self) -> Iterator[EvolutionStep]:
+        for index in range(len(self)):
+            yield self._step(index)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EvolutionTrace):
+            return (
+                self.cycle == other.cycle
+                and _columns_equal(self._values, other._values)
+                and _columns_equal(self._deltas, other._deltas)
+            )
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"EvolutionTrace(steps={len(self)})"
@@ -0,0 +1,370 @@
+"""
+trace_file.py
+
+QSOL binary trace archive format.
+
+A versioned, self-describing file format for evolution traces:
+
+- TraceWriter   : streams steps to disk as they are produced
+- TraceFile     : memory-mapped reader exposing a zero-copy EvolutionTrace
+- write_trace   : archive an existing EvolutionTrace
+- open_trace    : open an archive for reading
+- evolve_to_file: evolve while streaming every step into an archive
+
+Layout (all fields little-endian):
+
+    header (96 bytes)
+        magic            8s   b"QSOLTRC\\0"
+        version          u32  currently 1
+        flags            u32  bit 0: complete, bit 1: cycle recorded
+        min_value        f64  \\
+        max_value        f64   |
+        convergence_delta f64  | the AbsoluteLimits in force
+        max_iterations   i64   |
+        max_step_delta   f64  /
+        initial_value    f64
+        target           f64
+        steps            i64  number of steps n
+        cycle_start      i64
+        cycle_length     i64
+    body: n + 1 records of two f64
+        record 0         (initial_value, 0.0)
+        record i         (value after step i, delta of step i)
+
+Archives store scalar traces only; vector states are rejected with a
+ValueError.
+
+Every column element sits at a fixed stride, so the reader maps the file
+and hands strided memoryviews to EvolutionTrace.from_columns: reopening an
+archive costs the same whatever its size, and analyze_trace reads the
+mapped pages directly.
+
+A writer that is never closed (e.g. the process died) leaves the complete
+flag unset; such archives can still be opened, and hold every step that was
+flushed.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from typing import Optional, Tuple, Union
+
+from .absolute_limits import AbsoluteLimits, current_limits
+from .evolution import TransformFn, iter_transitions
+from .quantum_state import QuantumState
+from .trace import EvolutionCycle, EvolutionTrace
+
+
+PathLike = Union[str, "os.PathLike[str]"]
+
+
+MAGIC = b"QSOLTRC\0"
+VERSION = 1
+
+_HEADER = struct.Struct("<8sIIdddqdddqqq")
+_RECORD = struct.Struct("<dd")
+_FLAG_COMPLETE = 1
+_FLAG_CYCLE = 2
+
+
+def _pack_header(
+    limits: AbsoluteLimits,
+    initial_value: float,
+    target: float,
+    steps: int,
+    cycle: Optional[EvolutionCycle],
+    complete: bool,
+) -> bytes:
+    flags = (_FLAG_COMPLETE if complete else 0) | (_FLAG_CYCLE if cycle else 0)
+    return _HEADER.pack(
+        MAGIC,
+        VERSION,
+        flags,
+        limits.min_value,
+        limits.max_value,
+        limits.convergence_delta,
+        limits.max_iterations,
+        limits.max_step_delta,
+        initial_value,
+        target,
+        steps,
+        cycle.start if cycle else 0,
+        cycle.length if cycle else 0,
+    )
+
+
+def _require_scalar(value: float) -> None:
+    if getattr(value, "ndim", 0) > 0:
+        raise ValueError("Trace archives store scalar traces only.")
+
+
+class TraceWriter:
+    """
+    Streams an evolution trace into a binary archive.
+
+    Steps are buffered and written in blocks; close() (or leaving the
+    context manager) flushes them and finalizes the header. A TraceWriter
+    can be used directly as a profiling step hook.
+    """
+
+    def __init__(
+        self,
+        path: PathLike,
+        initial_value: float,
+        target: float,
+        limits: Optional[AbsoluteLimits] = None,
+        buffer_steps: int = 65_536,
+    ) -> None:
+        _require_scalar(initial_value)
+        if limits is None:
+            limits = current_limits()
+        self.path = path
+        self.initial_value = initial_value
+        self.target = target
+        self.limits = limits
+        self.steps = 0
+        self._buffer_steps = buffer_steps
+        self._pending = array("d")
+        self._file = open(path, "wb")
+        self._file.write(
+            _pack_header(limits, initial_value, target, 0, None, complete=False)
+        )
+        self._file.write(_RECORD.pack(initial_value, 0.0))
+
+    def append(self, next_value: float, delta: float) -> None:
+        """
+        Record one step ending at next_value with the given raw delta.
+        """
+        _require_scalar(next_value)
+        self._pending.append(next_value)
+        self._pending.append(delta)
+        self.steps += 1
+        if len(self._pending) >= 2 * self._buffer_steps:
+            self.flush()
+
+    def __call__(
+        self, prev_state: QuantumState, next_state: QuantumState, delta: float
+    ) -> None:
+        self.append(next_state.value, delta)
+
+    def flush(self) -> None:
+        """
+        Write buffered steps to the file.
+        """
+        if self._pending:
+            if sys.byteorder != "little":
+                self._pending.byteswap()
+            self._pending.tofile(self._file)
+            self._pending = array("d")
+        self._file.flush()
+
+    def close(self, cycle: Optional[EvolutionCycle] = None) -> None:
+        """
+        Flush remaining steps and finalize the header.
+
+        Args:
+            cycle: The cycle the evolution detected, if any.
+        """
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.seek(0)
+        self._file.write(
+            _pack_header(
+                self.limits,
+                self.initial_value,
+                self.target,
+                self.steps,
+                cycle,
+                complete=True,
+            )
+        )
+        self._file.close()
+
+    def __enter__(self) -> "TraceWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if exc_info[0] is None:
+            self.close()
+        else:
+            # Leave the archive marked incomplete, with every step so far.
+            self.flush()
+            self._file.close()
+
+
+class TraceFile:
+    """
+    A memory-mapped trace archive.
+
+    Attributes:
+        limits: AbsoluteLimits recorded in the header.
+        initial_value, target: Evolution parameters from the header.
+        complete: False if the writer was never closed.
+        trace: EvolutionTrace whose columns are views of the mapped file.
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        self.path = path
+        with open(path, "rb") as handle:
+            size = os.fstat(handle.fileno()).st_size
+            if size < _HEADER.size + _RECORD.size:
+                raise ValueError(f"{path} is too short to be a QSOL trace file.")
+            self._map = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (
+            magic,
+            version,
+            flags,
+            min_value,
+            max_value,
+            convergence_delta,
+            max_iterations,
+            max_step_delta,
+            self.initial_value,
+            self.target,
+            steps,
+            cycle_start,
+            cycle_length,
+        ) = _HEADER.unpack_from(self._map)
+        if magic != MAGIC:
+            self._map.close()
+            raise ValueError(f"{path} is not a QSOL trace file.")
+        if version != VERSION:
+            self._map.close()
+            raise ValueError(
+                f"{path} uses trace format version {version}; "
+                f"only version {VERSION} is supported."
+            )
+
+        self.limits = AbsoluteLimits(
+            min_value=min_value,
+            max_value=max_value,
+            convergence_delta=convergence_delta,
+            max_iterations=max_iterations,
+            max_step_delta=max_step_delta,
+        )
+        self.complete = bool(flags & _FLAG_COMPLETE)
+        if not self.complete:
+            # Recover every fully written record.
+            steps = (size - _HEADER.size) // _RECORD.size - 1
+
+        values, deltas = self._columns(steps)
+        self.trace = EvolutionTrace.from_columns(values, deltas)
+        if flags & _FLAG_CYCLE:
+            self.trace.cycle = EvolutionCycle(start=cycle_start, length=cycle_length)
+
+    def _columns(self, steps: int) -> Tuple[object, object]:
+        end = _HEADER.size + (steps + 1) * _RECORD.size
+        if sys.byteorder == "little":
+            body = memoryview(self._map)[_HEADER.size : end].cast("d")
+        else:
+            # Big-endian hosts read a byte-swapped copy.
+            body = array("d", bytes(self._map[_HEADER.size : end]))
+            body.byteswap()
+            body = memoryview(body)
+        values, deltas = body[0::2], body[3::2]
+        # Released by close(), so that the map can be unmapped.
+        self._views = (values, deltas, body)
+        return values, deltas
+
+    def close(self) -> None:
+        """
+        Unmap the file. The trace (and its columns) must not be used
+        afterwards.
+
+        Raises:
+            BufferError if views made from the trace's columns (e.g. slices
+            or casts of them) are still referenced; the file stays mapped,
+            and close() can be called again once they are released.
+        """
+        if self._map.closed:
+            return
+        self.trace = EvolutionTrace.from_columns(array("d"), array("d"))
+        for view in self._views:
+            view.release()
+        try:
+            self._map.close()
+        except BufferError:
+            raise BufferError(
+                f"Cannot unmap {self.path}: views of its trace are still in use."
+            ) from None
+
+    def __enter__(self) -> "TraceFile":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"TraceFile({self.path!r}, steps={len(self.trace)})"
+
+
+def open_trace(path: PathLike) -> TraceFile:
+    """
+    Memory-map a trace archive.
+
+    Raises:
+        ValueError if the file is not a supported QSOL trace archive.
+    """
+    return TraceFile(path)
+
+
+def write_trace(
+    path: PathLike,
+    trace: EvolutionTrace,
+    target: float,
+    limits: Optional[AbsoluteLimits] = None,
+) -> None:
+    """
+    Archive an in-memory EvolutionTrace, recording limits (defaults to
+    current_limits()) in the header.
+
+    Raises:
+        ValueError if the trace has no initial value.
+    """
+    values, deltas = trace.values, trace.deltas
+    if not len(values):
+        raise ValueError("EvolutionTrace has no initial value to archive.")
+    with TraceWriter(path, values[0], target, limits) as writer:
+        for i in range(len(deltas)):
+            writer.append(values[i + 1], deltas[i])
+        writer.close(trace.cycle)
+
+
+def evolve_to_file(
+    path: PathLike,
+    initial: QuantumState,
+    target: float,
+    fn: TransformFn,
+    detect_cycles: bool = False,
+    limits: Optional[AbsoluteLimits] = None,
+) -> Optional[EvolutionCycle]:
+    """
+    Evolve as evolve_trace does, streaming every step into an archive
+    instead of holding the trace in memory. The evolution enforces limits
+    (defaults to current_limits()), which the archive records.
+
+    If the evolution raises, the archive is left incomplete but readable,
+    holding every step up to the failure.
+
+    Returns:
+        The detected EvolutionCycle, or None.
+    """
+    limits = current_limits() if limits is None else limits
+    writer = TraceWriter(path, initial.copy().value, target, limits)
+    with writer:
+        transitions = iter_transitions(
+            initial, target, fn, detect_cycles=detect_cycles, limits=limits
+        )
+        while True:
+            try:
+                _, next_state, delta = next(transitions)
+            except StopIteration as stop:
+                writer.close(stop.value)
+                return stop.value
+            writer.append(next_state.value, delta)
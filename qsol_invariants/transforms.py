@@ -0,0 +1,360 @@
+"""
+transforms.py
+
+QSOL declarative transform library.
+
+Common transforms as small immutable value objects instead of opaque
+callables:
+
+- StepToward : move a fixed step toward a goal, landing on it exactly
+- Affine     : slope * x + intercept
+- Clip       : clamp into [lower, upper]
+- Piecewise  : a different transform on each interval of x
+- Compose    : apply transforms in sequence (also a.then(b))
+- transform_from_spec : rebuild a transform from its JSON-compatible spec
+
+Every transform:
+
+- is a frozen dataclass, so it pickles (process pools, run_sessions) and
+  hashes by content (equal transforms share TransformCache entries)
+- has a stable content fingerprint, the SHA-256 of its canonical spec
+- evaluates a float or a NumPy array (vector QuantumStates, evolve_batch),
+  computing the same floats elementwise either way
+
+StepToward and Affine with slope 1 (a constant increment) also provide the
+exact closed form of ClosedFormTransform when their values lie on a common
+binary grid, which lets evolve_until skip the steps between events.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+from abc import ABC, abstractmethod
+from bisect import bisect_right
+from dataclasses import dataclass
+from fractions import Fraction
+from typing import Any, Dict, Optional, Tuple
+
+from ._numpy import require_numpy
+
+
+def _as_floats(transform: "Transform", *names: str) -> None:
+    # Store parameters as floats, so that e.g. Affine(1, 0) and
+    # Affine(1.0, 0.0) share a spec and fingerprint.
+    for name in names:
+        object.__setattr__(transform, name, float(getattr(transform, name)))
+
+
+def _is_array(value: Any) -> bool:
+    return getattr(value, "ndim", 0) > 0
+
+
+def _grid(*values: float) -> Optional[int]:
+    # Smallest power-of-two denominator putting every value on an integer
+    # grid, or None for non-finite values.
+    denominator = 1
+    for value in values:
+        if not math.isfinite(value):
+            return None
+        denominator = max(denominator, Fraction(value).denominator)
+    return denominator
+
+
+def _exact_walk(value: float, step: float, steps: int) -> Optional[float]:
+    # value + steps * step, provided every partial sum of the repeated float
+    # additions is exact (all on one grid, within 53 bits), else None.
+    denominator = _grid(value, step)
+    if denominator is None:
+        return None
+    start = int(Fraction(value) * denominator)
+    stride = int(Fraction(step) * denominator)
+    end = start + steps * stride
+    if max(abs(start), abs(end)) > 2**53:
+        return None
+    return end / denominator
+
+
+class Transform(ABC):
+    """
+    Abstract base class of declarative transforms.
+
+    Subclasses are frozen dataclasses implementing _scalar(value),
+    _array(numpy, values) and to_spec().
+    """
+
+    def __call__(self, value: Any) -> Any:
+        if type(value) is float:
+            return self._scalar(value)
+        if _is_array(value):
+            numpy = require_numpy()
+            return self._array(numpy, numpy.asarray(value, dtype=numpy.float64))
+        return self._scalar(value)
+
+    @abstractmethod
+    def _scalar(self, value: float) -> float:
+        """
+        The transform of a float.
+        """
+
+    @abstractmethod
+    def _array(self, numpy, values: Any) -> Any:
+        """
+        The transform of a float64 array, elementwise equal to _scalar.
+        """
+
+    @abstractmethod
+    def to_spec(self) -> Dict[str, Any]:
+        """
+        Return the JSON-compatible spec of the transform (see
+        transform_from_spec).
+        """
+
+    @property
+    def fingerprint(self) -> str:
+        """
+        SHA-256 hex digest of the canonical spec; equal for equal transforms,
+        stable across processes and sessions.
+        """
+        canonical = json.dumps(self.to_spec(), sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def then(self, other: "Transform") -> "Compose":
+        """
+        Return the transform applying self, then other.
+        """
+        return Compose((self, other))
+
+
+@dataclass(frozen=True)
+class StepToward(Transform):
+    """
+    Move at most `step` toward `goal`; within reach, land on goal exactly.
+    """
+
+    goal: float
+    step: float
+
+    def __post_init__(self) -> None:
+        _as_floats(self, "goal", "step")
+        if not self.step > 0.0:
+            raise ValueError(f"StepToward needs a positive step, got {self.step}.")
+
+    def _scalar(self, value: float) -> float:
+        distance = self.goal - value
+        if abs(distance) <= self.step:
+            return self.goal
+        return value + self.step if distance > 0.0 else value - self.step
+
+    def _array(self, numpy, values: Any) -> Any:
+        distance = self.goal - values
+        moved = numpy.where(distance > 0.0, values + self.step, values - self.step)
+        return numpy.where(numpy.abs(distance) <= self.step, self.goal, moved)
+
+    def iterate(self, value: float, steps: int) -> Optional[float]:
+        """
+        Exact value after `steps` applications, when value and step share a
+        binary grid; None otherwise.
+        """
+        if steps == 0:
+            return value
+        distance = self.goal - value
+        if not math.isfinite(distance):
+            return None
+        step = self.step if distance > 0.0 else -self.step
+        # Steps taken before the goal is within reach: a couple below the
+        # estimate, then walk up to the first step where it is.
+        reach = max(0, int(abs(distance) / self.step) - 2)
+        while True:
+            position = _exact_walk(value, step, reach)
+            if position is None:
+                return None
+            if abs(self.goal - position) <= self.step:
+                break
+            reach += 1
+        if steps <= reach:
+            return _exact_walk(value, step, steps)
+        return self.goal
+
+    def to_spec(self) -> Dict[str, Any]:
+        return {"type": "step_toward", "goal": self.goal, "step": self.step}
+
+
+@dataclass(frozen=True)
+class Affine(Transform):
+    """
+    slope * x + intercept.
+    """
+
+    slope: float = 1.0
+    intercept: float = 0.0
+
+    def __post_init__(self) -> None:
+        _as_floats(self, "slope", "intercept")
+
+    def _scalar(self, value: float) -> float:
+        return self.slope * value + self.intercept
+
+    def _array(self, numpy, values: Any) -> Any:
+        return self.slope * values + self.intercept
+
+    def iterate(self, value: float, steps: int) -> Optional[float]:
+        """
+        Exact value after `steps` applications for a constant increment
+        (slope 1) on a binary grid with value; None otherwise.
+        """
+        if steps == 0:
+            return value
+        if self.slope != 1.0:
+            return None
+        return _exact_walk(value, self.intercept, steps)
+
+    def to_spec(self) -> Dict[str, Any]:
+        return {"type": "affine", "slope": self.slope, "intercept": self.intercept}
+
+
+@dataclass(frozen=True)
+class Clip(Transform):
+    """
+    Clamp into [lower, upper].
+    """
+
+    lower: float
+    upper: float
+
+    def __post_init__(self) -> None:
+        _as_floats(self, "lower", "upper")
+        if not self.lower <= self.upper:
+            raise ValueError(
+                f"Clip needs lower <= upper, got [{self.lower}, {self.upper}]."
+            )
+
+    def _scalar(self, value: float) -> float:
+        if value < self.lower:
+            return self.lower
+        if value > self.upper:
+            return self.upper
+        return value
+
+    def _array(self, numpy, values: Any) -> Any:
+        return numpy.where(
+            values < self.lower,
+            self.lower,
+            numpy.where(values > self.upper, self.upper, values),
+        )
+
+    def to_spec(self) -> Dict[str, Any]:
+        return {"type": "clip", "lower": self.lower, "upper": self.upper}
+
+
+@dataclass(frozen=True)
+class Piecewise(Transform):
+    """
+    pieces[i] applies to x in [bounds[i - 1], bounds[i]), with pieces[0]
+    below bounds[0] and pieces[-1] from bounds[-1] on.
+    """
+
+    bounds: Tuple[float, ...]
+    pieces: Tuple[Transform, ...]
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "bounds", tuple(map(float, self.bounds)))
+        object.__setattr__(self, "pieces", tuple(self.pieces))
+        if len(self.pieces) != len(self.bounds) + 1:
+            raise ValueError(
+                f"Piecewise needs one more piece than bounds, got "
+                f"{len(self.pieces)} pieces and {len(self.bounds)} bounds."
+            )
+        if list(self.bounds) != sorted(self.bounds):
+            raise ValueError(f"Piecewise bounds must be sorted, got {self.bounds}.")
+
+    def _scalar(self, value: float) -> float:
+        return self.pieces[bisect_right(self.bounds, value)]._scalar(value)
+
+    def _array(self, numpy, values: Any) -> Any:
+        index = numpy.searchsorted(numpy.asarray(self.bounds), values, side="right")
+        result = numpy.empty_like(values)
+        for i, piece in enumerate(self.pieces):
+            lanes = index == i
+            if lanes.any():
+                result[lanes] = piece._array(numpy, values[lanes])
+        return result
+
+    def to_spec(self) -> Dict[str, Any]:
+        return {
+            "type": "piecewise",
+            "bounds": list(self.bounds),
+            "pieces": [piece.to_spec() for piece in self.pieces],
+        }
+
+
+@dataclass(frozen=True)
+class Compose(Transform):
+    """
+    Apply transforms in order: Compose((f, g))(x) == g(f(x)).
+    """
+
+    transforms: Tuple[Transform, ...]
+
+    def __post_init__(self) -> None:
+        # Nested compositions are flattened, so equal pipelines compare (and
+        # fingerprint) equal however they were built.
+        flat = []
+        for transform in self.transforms:
+            if isinstance(transform, Compose):
+                flat.extend(transform.transforms)
+            else:
+                flat.append(transform)
+        if not flat:
+            raise ValueError("Compose needs at least one transform.")
+        object.__setattr__(self, "transforms", tuple(flat))
+
+    def _scalar(self, value: float) -> float:
+        for transform in self.transforms:
+            value = transform._scalar(value)
+        return value
+
+    def _array(self, numpy, values: Any) -> Any:
+        for transform in self.transforms:
+            values = transform._array(numpy, values)
+        return values
+
+    def to_spec(self) -> Dict[str, Any]:
+        return {
+            "type": "compose",
+            "transforms": [transform.to_spec() for transform in self.transforms],
+        }
+
+
+def transform_from_spec(spec: Dict[str, Any]) -> Transform:
+    """
+    Build a transform from its spec (as returned by to_spec, e.g. parsed
+    from JSON).
+
+    Raises:
+        ValueError for an unknown transform type or invalid parameters.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError(f"Transform spec must be an object, got {spec!r}.")
+    fields = dict(spec)
+    kind = fields.pop("type", None)
+    try:
+        if kind == "step_toward":
+            return StepToward(**fields)
+        if kind == "affine":
+            return Affine(**fields)
+        if kind == "clip":
+            return Clip(**fields)
+        if kind == "piecewise":
+            return Piecewise(
+                bounds=tuple(fields["bounds"]),
+                pieces=tuple(transform_from_spec(piece) for piece in fields["pieces"]),
+            )
+        if kind == "compose":
+            return Compose(
+                tuple(transform_from_spec(item) for item in fields["transforms"])
+            )
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"Invalid {kind} transform spec {spec!r}: {exc}") from None
+    raise ValueError(f"Unknown transform type {kind!r}.")
@@ -0,0 +1,254 @@
+"""
+verify.py
+
+QSOL trace replay verification.
+
+Audits a stored trace against the transform that produced it:
+
+- verify_trace      : check every step, in parallel chunks or vectorized
+- TraceVerification : first failing step and per-check breakdown
+
+Each step i (from values[i] to values[i + 1] with deltas[i]) is checked
+independently of the others:
+
+- "delta": deltas[i] == fn(values[i]) - values[i]
+- "next":  values[i + 1] == clamp(fn(values[i]))
+- "phi":   |deltas[i]| <= max_step_delta
+
+Floats are compared exactly; two NaNs count as equal. Only scalar traces
+can be verified; vector traces are rejected with a ValueError. Because no step
+depends on the replay of the previous one, the trace is split into chunks
+that are checked on a process pool (the transform must be picklable), or
+evaluated with one array call per chunk for vectorizable transforms.
+"""
+
+from __future__ import annotations
+
+import os
+from array import array
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from ._numpy import require_numpy
+from .absolute_limits import AbsoluteLimits, current_limits
+from .trace import EvolutionStep, EvolutionTrace, is_row_column
+from .trace_file import TraceFile
+
+
+CHECKS = ("delta", "next", "phi")
+
+# (failure count per check, first failing index per check) of one chunk.
+_ChunkResult = Tuple[Dict[str, int], Dict[str, Optional[int]]]
+
+
+@dataclass(frozen=True)
+class TraceVerification:
+    """
+    Outcome of a trace replay.
+
+    - steps:          number of steps checked
+    - first_failure:  index of the first step failing any check, or None
+    - failures:       number of failing steps per check
+    - first_failures: index of the first failing step per check, or None
+    """
+
+    steps: int
+    first_failure: Optional[int]
+    failures: Dict[str, int]
+    first_failures: Dict[str, Optional[int]]
+
+    @property
+    def ok(self) -> bool:
+        """
+        Whether every step passed every check.
+        """
+        return self.first_failure is None
+
+    def describe(self) -> str:
+        """
+        Return a human-readable summary of the verification.
+        """
+        lines = [
+            "QSOL Trace Verification:",
+            f"  - steps: {self.steps}",
+            f"  - ok: {self.ok}",
+            f"  - first_failure: {self.first_failure}",
+        ]
+        for check in CHECKS:
+            lines.append(
+                f"  - {check}: {self.failures[check]} failing "
+                f"(first: {self.first_failures[check]})"
+            )
+        return "\n".join(lines)
+
+
+def _same(a: float, b: float) -> bool:
+    return a == b or (a != a and b != b)
+
+
+def _verify_chunk_scalar(
+    start: int,
+    values: Sequence[float],
+    deltas: Sequence[float],
+    fn: Callable[[float], float],
+    limits: AbsoluteLimits,
+) -> _ChunkResult:
+    counts = dict.fromkeys(CHECKS, 0)
+    firsts: Dict[str, Optional[int]] = dict.fromkeys(CHECKS)
+    max_step_delta = limits.max_step_delta
+    clamp = limits.clamp_value
+
+    for i in range(len(deltas)):
+        prev = values[i]
+        delta = deltas[i]
+        raw = fn(prev)
+        failed = []
+        if not _same(delta, raw - prev):
+            failed.append("delta")
+        if not _same(values[i + 1], clamp(raw)):
+            failed.append("next")
+        if not abs(delta) <= max_step_delta:
+            failed.append("phi")
+        for check in failed:
+            counts[check] += 1
+            if firsts[check] is None:
+                firsts[check] = start + i
+    return counts, firsts
+
+
+def _verify_chunk_vectorized(
+    start: int,
+    values: Sequence[float],
+    deltas: Sequence[float],
+    fn: Callable[[Any], Any],
+    limits: AbsoluteLimits,
+) -> _ChunkResult:
+    np = require_numpy()
+    values = np.asarray(values, dtype=np.float64)
+    deltas = np.asarray(deltas, dtype=np.float64)
+    prev = values[:-1]
+    raw = np.asarray(fn(prev), dtype=np.float64)
+    if raw.shape != prev.shape:
+        raise ValueError(
+            f"Batch transform returned shape {raw.shape}, expected {prev.shape}."
+        )
+
+    def differs(a, b):
+        return ~((a == b) | (np.isnan(a) & np.isnan(b)))
+
+    clamped = np.where(
+        raw < limits.min_value,
+        limits.min_value,
+        np.where(raw > limits.max_value, limits.max_value, raw),
+    )
+    masks = {
+        "delta": differs(deltas, raw - prev),
+        "next": differs(values[1:], clamped),
+        "phi": ~(np.abs(deltas) <= limits.max_step_delta),
+    }
+    counts = {check: int(mask.sum()) for check, mask in masks.items()}
+    firsts = {
+        check: (start + int(mask.argmax())) if counts[check] else None
+        for check, mask in masks.items()
+    }
+    return counts, firsts
+
+
+def _verify_chunk(task: Tuple[Any, ...]) -> _ChunkResult:
+    start, values, deltas, fn, limits, vectorized = task
+    verify = _verify_chunk_vectorized if vectorized else _verify_chunk_scalar
+    return verify(start, values, deltas, fn, limits)
+
+
+def _columns(trace: Sequence[EvolutionStep]) -> Tuple[Sequence[float], Sequence[float]]:
+    if isinstance(trace, EvolutionTrace):
+        vector = is_row_column(trace.values)
+    else:
+        vector = len(trace) > 0 and trace[0].prev_state.is_vector
+    if vector:
+        raise ValueError("verify_trace only verifies scalar traces.")
+    if isinstance(trace, EvolutionTrace):
+        return trace.values, trace.deltas
+    values = array("d", (step.prev_state.value for step in trace))
+    if len(trace):
+        values.append(trace[-1].next_state.value)
+    return values, array("d", (step.delta for step in trace))
+
+
+def verify_trace(
+    trace: Union[Sequence[EvolutionStep], TraceFile],
+    fn: Callable[[Any], Any],
+    limits: Optional[AbsoluteLimits] = None,
+    vectorized: bool = False,
+    workers: Optional[int] = None,
+    chunksize: int = 65_536,
+) -> TraceVerification:
+    """
+    Replay-verify every step of a stored trace.
+
+    Args:
+        trace: EvolutionTrace, TraceFile archive (see open_trace) or any
+               sequence of EvolutionStep objects.
+        fn: The transform that produced the trace. With vectorized=True it
+            is called on arrays of values, as in evolve_until_batch.
+        limits: Contract the trace was produced under (defaults to the
+                limits recorded in a TraceFile, else current_limits()).
+        vectorized: Evaluate fn on whole chunks at once (needs NumPy).
+        workers: Processes to spread chunks over (defaults to
+                 os.cpu_count()). With one worker, or a single chunk, the
+                 trace is checked in the calling process.
+        chunksize: Steps per chunk.
+
+    Returns:
+        TraceVerification with the first failing step and per-check counts.
+    """
+    if chunksize < 1:
+        raise ValueError(f"verify_trace needs a positive chunksize, got {chunksize}.")
+    if isinstance(trace, TraceFile):
+        if limits is None:
+            limits = trace.limits
+        trace = trace.trace
+    limits = current_limits() if limits is None else limits
+    values, deltas = _columns(trace)
+    steps = len(deltas)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError(f"verify_trace needs at least one worker, got {workers}.")
+
+    starts = range(0, steps, chunksize)
+    in_process = workers == 1 or len(starts) <= 1
+
+    def task(start: int) -> Tuple[Any, ...]:
+        stop = min(start + chunksize, steps)
+        chunk_values = values[start : stop + 1]
+        chunk_deltas = deltas[start:stop]
+        if not in_process:
+            # Slices of mapped archives are memoryviews, which do not pickle.
+            chunk_values = array("d", chunk_values)
+            chunk_deltas = array("d", chunk_deltas)
+        return start, chunk_values, chunk_deltas, fn, limits, vectorized
+
+    results: List[_ChunkResult]
+    if in_process:
+        results = [_verify_chunk(task(start)) for start in starts]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=min(workers, len(starts))) as pool:
+            results = list(pool.map(_verify_chunk, (task(s) for s in starts)))
+
+    failures = dict.fromkeys(CHECKS, 0)
+    first_failures: Dict[str, Optional[int]] = dict.fromkeys(CHECKS)
+    for counts, firsts in results:
+        for check in CHECKS:
+            failures[check] += counts[check]
+            if first_failures[check] is None:
+                first_failures[check] = firsts[check]
+    indices = [index for index in first_failures.values() if index is not None]
+    return TraceVerification(
+        steps=steps,
+        first_failure=min(indices) if indices else None,
+        failures=failures,
+        first_failures=first_failures,
+    )